@@ -0,0 +1,47 @@
+from typing import Dict, List
+import tempfile
+import os
+
+
+def setup_environment(db_path: str | None = None) -> str:
+    """벤치마크용 환경 변수 설정 (로컬 SQLite 파일을 MySQL 대신 사용)"""
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="tdls-bench-"), "tdls.db")
+
+    os.environ["DB_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-0123456789abcdef")
+    os.environ.setdefault("ALGORITHM", "HS256")
+    os.environ.setdefault("SENDER", "bench@localhost")
+    os.environ.setdefault("APP_PASSWORD", "bench")
+    # 한 IP에서 많은 계정으로 로그인하므로 요청 한도는 끔
+    for rule in ("LOGIN_IP", "LOGIN_ACCOUNT", "EMAIL_IP", "EMAIL_ADDRESS"):
+        os.environ.setdefault(f"RATE_LIMIT_{rule}", "0/1")
+    return db_path
+
+
+def create_schema() -> None:
+    """모든 모델을 등록한 뒤 테이블을 생성"""
+    from database import schema
+
+    schema.create_schema()
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(p / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
@@ -0,0 +1,288 @@
+"""엔드투엔드 부하/지연 시간 벤치마크 (aiosmtpd 필요)
+
+main.py의 앱을 uvicorn으로 별도 프로세스에서 띄우고, 로컬 SQLite(또는 --db-url로 지정한
+MySQL 호환 DB)와 SMTP 대역 서버를 붙인 뒤 현실적인 크기의 데이터를 미리 넣어두고,
+가상 유저 --users명이 --concurrency개씩 동시에 아래 흐름을 실행합니다.
+
+    회원가입 -> 로그인 -> 프로필 조회(--profile-reads번) -> 회원정보 수정 -> 인증 메일 발송 -> 인증
+
+라우트별 처리량과 p50/p95/p99 지연 시간을 JSON으로 출력하고, --output으로 저장한 결과를
+다음 실행에서 --baseline으로 넘기면 라우트별 변화율과 회귀 여부를 함께 출력합니다.
+
+    python -m benchmark.e2e --users 500 --concurrency 50 --output before.json
+    python -m benchmark.e2e --users 500 --concurrency 50 --baseline before.json --output after.json
+"""
+from benchmark.common import setup_environment, create_schema, summarize
+from benchmark.room_fanout import free_port, wait_ready
+from benchmark.smtp_stub import start_stub
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from collections import Counter
+import subprocess
+import platform
+import argparse
+import asyncio
+import email
+import json
+import time
+import uuid
+import sys
+import os
+import re
+
+SEED_PASSWORD = "bench-password"
+VERIFY_CODE_PATTERN = re.compile(r"인증 코드: (\d{6})")
+
+
+def seed(users: int, tasks_per_user: int) -> None:
+    """기존 유저 users명과 유저마다 방 1개, 카테고리 1개, 할 일 tasks_per_user개를 생성
+    (테이블과 인덱스 크기를 운영 환경과 비슷하게 맞추기 위한 데이터이고, 흐름에서는 새 유저를 사용)"""
+    from model.room import Room, RoomEntry, RoomEntryStatus
+    from service.password_hasher import pwd_context
+    from database.connection import DBObject
+    from model.category import Category
+    from model.user import User
+    from model.task import Task
+    from sqlalchemy import insert
+
+    password = pwd_context.hash(SEED_PASSWORD)
+    now = datetime.now()
+    engine = DBObject.get_instance().engine
+    with engine.begin() as connection:
+        for start in range(0, users, 5000):
+            chunk = range(start, min(users, start + 5000))
+            user_rows = [{"user_uuid": str(uuid.uuid4()), "user_id": f"seed{index}", "password": password,
+                          "nickname": f"s{index}", "email": f"seed{index}@bench.local", "created_at": now}
+                         for index in chunk]
+            room_rows = [{"room_uuid": str(uuid.uuid4()), "room_name": f"방 {index}", "created_at": now}
+                         for index in chunk]
+            category_rows = [{"category_uuid": str(uuid.uuid4()), "category_name": "할 일", "owner_uuid": user["user_uuid"],
+                              "room_uuid": room["room_uuid"], "created_at": now}
+                             for user, room in zip(user_rows, room_rows)]
+            connection.execute(insert(User), user_rows)
+            connection.execute(insert(Room), room_rows)
+            connection.execute(insert(RoomEntry), [
+                {"room_uuid": room["room_uuid"], "user_uuid": user["user_uuid"],
+                 "created_at": now, "status": RoomEntryStatus.accepted}
+                for user, room in zip(user_rows, room_rows)])
+            connection.execute(insert(Category), category_rows)
+            if tasks_per_user:
+                connection.execute(insert(Task), [
+                    {"task_uuid": str(uuid.uuid4()), "title": f"할 일 {index}", "content": "내용",
+                     "category_uuid": category["category_uuid"], "user_uuid": category["owner_uuid"],
+                     "room_uuid": category["room_uuid"], "created_at": now, "updated_at": now,
+                     "end_at": now + timedelta(days=index)}
+                    for category in category_rows for index in range(tasks_per_user)])
+
+
+class Recorder:
+    """라우트별 지연 시간과 예상하지 못한 응답 코드를 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Counter] = {}
+
+    async def call(self, client, route: str, expected: int, **kwargs):
+        method, path = route.split(" ", 1)
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, kwargs.pop("url", path), **kwargs)
+        except Exception as e:
+            self.errors.setdefault(route, Counter())[type(e).__name__] += 1
+            return None
+
+        self.latencies.setdefault(route, []).append(time.perf_counter() - started)
+        if response.status_code != expected:
+            self.errors.setdefault(route, Counter())[str(response.status_code)] += 1
+            return None
+
+        return response
+
+
+async def wait_verify_code(handler, address: str, timeout: float) -> str | None:
+    """SMTP 대역 서버에 도착한 인증 메일에서 코드를 추출"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        content = handler.latest.pop(address, None)
+        if content is not None:
+            for part in email.message_from_bytes(content).walk():
+                payload = part.get_payload(decode=True)
+                match = payload and VERIFY_CODE_PATTERN.search(payload.decode("utf-8", "replace"))
+                if match:
+                    return match.group(1)
+
+        await asyncio.sleep(0.05)
+
+    return None
+
+
+async def user_flow(client, recorder: Recorder, handler, index: int, tag: str, args) -> None:
+    user_id = f"e2e{tag}{index}"
+    address = f"{user_id}@bench.local"
+    form = {"user_id": user_id, "password": SEED_PASSWORD, "nickname": f"e{tag}{index}", "email": address}
+    if not await recorder.call(client, "POST /user", 201, json=form):
+        return
+
+    response = await recorder.call(client, "POST /user/auth/login", 200,
+                                   json={"user_id": user_id, "password": SEED_PASSWORD})
+    if not response:
+        return
+
+    headers = {"Authorization": f"Bearer {response.json()['token']['access_token']}"}
+    for _ in range(args.profile_reads):
+        await recorder.call(client, "GET /user", 200, headers=headers)
+
+    await recorder.call(client, "PATCH /user", 200, headers=headers, json={"nickname": f"u{tag}{index}"})
+    if not args.email:
+        return
+
+    if not await recorder.call(client, "POST /user/email/send", 200, params={"email": address}):
+        return
+
+    started = time.perf_counter()
+    verify_code = await wait_verify_code(handler, address, args.email_timeout)
+    if verify_code is None:
+        recorder.errors.setdefault("email delivery", Counter())["timeout"] += 1
+        return
+
+    recorder.latencies.setdefault("email delivery", []).append(time.perf_counter() - started)
+    await recorder.call(client, "POST /user/email/verify", 200, params={"email": address, "verify_code": verify_code})
+
+
+async def run(args, port: int, handler) -> Dict[str, Any]:
+    import httpx
+
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    tag = uuid.uuid4().hex[:4]
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=args.timeout, limits=limits) as client:
+        async def one(index: int):
+            async with semaphore:
+                await user_flow(client, recorder, handler, index, tag, args)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(args.users)))
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for route, latencies in recorder.latencies.items()
+                     if route != "email delivery" for latency in latencies]
+    return {
+        "total": {**summarize(all_latencies, elapsed),
+                  "errors": sum(sum(errors.values()) for errors in recorder.errors.values())},
+        "routes": {route: {**summarize(latencies, elapsed), "errors": dict(recorder.errors.get(route, {}))}
+                   for route, latencies in sorted(recorder.latencies.items())},
+        "unanswered": {route: dict(errors) for route, errors in recorder.errors.items()
+                       if route not in recorder.latencies},
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> Dict[str, Any]:
+    """라우트별 처리량/p95/p99 변화율(%)과, threshold(%)보다 나빠졌으면 regression=True"""
+    def change(now: float, before: float) -> float | None:
+        return round((now - before) / before * 100, 2) if before else None
+
+    comparison = {}
+    routes = {"total": current["total"], **current["routes"]}
+    baseline_routes = {"total": baseline["total"], **baseline.get("routes", {})}
+    for route, result in routes.items():
+        before = baseline_routes.get(route)
+        if before is None:
+            continue
+
+        delta = {
+            "throughput_rps_%": change(result["throughput_rps"], before["throughput_rps"]),
+            "p95_ms_%": change(result["p95_ms"], before["p95_ms"]),
+            "p99_ms_%": change(result["p99_ms"], before["p99_ms"]),
+        }
+        delta["regression"] = (
+            (delta["throughput_rps_%"] or 0) < -threshold or (delta["p95_ms_%"] or 0) > threshold)
+        comparison[route] = delta
+
+    return comparison
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200, help="흐름을 실행할 가상 유저 수")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--profile-reads", type=int, default=5)
+    parser.add_argument("--no-email", dest="email", action="store_false")
+    parser.add_argument("--email-timeout", type=float, default=10)
+    parser.add_argument("--seed-users", type=int, default=10000)
+    parser.add_argument("--seed-tasks", type=int, default=5, help="기존 유저별 할 일 수")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--bcrypt-rounds", type=int, default=None, help="지정하지 않으면 BCRYPT_ROUNDS 또는 12")
+    parser.add_argument("--db-url", default=None, help="SQLite 대신 사용할 DB (예: mysql+pymysql://...)")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=10, help="회귀로 판단할 변화율(%%)")
+    args = parser.parse_args()
+
+    setup_environment()
+    if args.db_url:
+        os.environ["DB_URL"] = args.db_url
+    if args.bcrypt_rounds:
+        os.environ["BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+    if args.workers > 1:
+        # 인증 코드를 발급한 워커와 확인하는 워커가 다를 수 있음
+        os.environ.setdefault("VERIFICATION_STORE", "database")
+
+    smtp_port = free_port()
+    os.environ.update({"SMTP_HOST": "127.0.0.1", "SMTP_PORT": str(smtp_port), "SMTP_SECURITY": "none"})
+    create_schema()
+    seed_started = time.perf_counter()
+    seed(args.seed_users, args.seed_tasks)
+    seed_elapsed = time.perf_counter() - seed_started
+
+    smtp, handler = start_stub("127.0.0.1", smtp_port)
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL)
+
+    async def bench():
+        await wait_ready(port)
+        return await run(args, port, handler)
+
+    try:
+        results = asyncio.run(bench())
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+        smtp.stop()
+
+    report = {
+        "config": {**vars(args), "db": os.environ["DB_URL"].split(":", 1)[0],
+                   "bcrypt_rounds": int(os.getenv("BCRYPT_ROUNDS", "12"))},
+        "environment": {"revision": git_revision(), "python": platform.python_version(),
+                        "platform": platform.platform(), "cpus": os.cpu_count(),
+                        "started_at": datetime.now().isoformat(timespec="seconds")},
+        "seed_elapsed_s": round(seed_elapsed, 2),
+        **results,
+    }
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            report["comparison"] = compare(results, json.load(file), args.threshold)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2, ensure_ascii=False)
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if any(delta["regression"] for delta in report.get("comparison", {}).values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
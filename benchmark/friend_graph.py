@@ -0,0 +1,149 @@
+"""친구 그래프 벤치마크 (기본 10만 명)
+
+합성 그래프를 SQLite에 만든 뒤 친구 목록(커서 페이지), 받은 요청 목록, 친구 추천(캐시 콜드/웜)의
+지연 시간을 측정하고, 반대 방향/상태 인덱스를 지웠을 때의 목록 조회와 비교합니다.
+
+    python -m benchmark.friend_graph --users 100000 --degree 10 --samples 200
+"""
+from benchmark.common import setup_environment, create_schema, summarize
+from datetime import datetime
+from typing import List
+import argparse
+import asyncio
+import random
+import json
+import time
+
+
+def seed(users: int, degree: int, pending: int, seed_value: int) -> List[str]:
+    """무작위 그래프 생성: 유저마다 degree/2개의 수락된 관계와 pending개의 받은 요청"""
+    from model.friend import Friend, FriendStatus
+    from database.connection import DBObject
+    from model.user import User
+    from sqlalchemy import insert
+
+    rng = random.Random(seed_value)
+    user_uuids = [f"{rng.getrandbits(128):032x}" for _ in range(users)]
+    now = datetime.now()
+
+    edges = {}
+    for index, user_uuid in enumerate(user_uuids):
+        for _ in range(degree // 2):
+            other = user_uuids[rng.randrange(users)]
+            if other != user_uuid and (other, user_uuid) not in edges:
+                edges[(user_uuid, other)] = FriendStatus.accepted
+        for _ in range(pending):
+            other = user_uuids[rng.randrange(users)]
+            if other != user_uuid and (other, user_uuid) not in edges and (user_uuid, other) not in edges:
+                edges[(other, user_uuid)] = FriendStatus.pending
+
+    engine = DBObject.get_instance().engine
+    with engine.begin() as connection:
+        for start in range(0, users, 10000):
+            connection.execute(insert(User), [
+                {"user_uuid": user_uuid, "user_id": f"user{start + i}", "password": "x",
+                 "nickname": f"n{start + i}", "email": f"user{start + i}@localhost", "created_at": now}
+                for i, user_uuid in enumerate(user_uuids[start:start + 10000])
+            ])
+
+        rows = [{"transmit_user_uuid": transmit, "receive_user_uuid": receive, "status": status, "created_at": now}
+                for (transmit, receive), status in edges.items()]
+        for start in range(0, len(rows), 10000):
+            connection.execute(insert(Friend), rows[start:start + 10000])
+
+    return user_uuids
+
+
+async def timed(samples: List[str], func) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for user_uuid in samples:
+        call_started = time.perf_counter()
+        await func(user_uuid)
+        latencies.append(time.perf_counter() - call_started)
+
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def run(user_uuids: List[str], samples: int, page_size: int, seed_value: int) -> dict:
+    from repository.friend_repository import FriendRepository
+    from repository.friend_graph_cache import FriendGraphCache
+    from service.friend_service import FriendService
+    from database.connection import DBObject
+    from util.cursor import decode_cursor
+    from model.user import User
+    from sqlalchemy import text
+
+    rng = random.Random(seed_value + 1)
+    sample = rng.sample(user_uuids, samples)
+
+    def principal(user_uuid: str) -> User:
+        return User("", "", "", "", user_uuid=user_uuid)
+
+    async def list_friends(user_uuid: str):
+        await FriendRepository.list_friends(user_uuid, None, page_size)
+
+    async def list_friends_second_page(user_uuid: str):
+        _, cursor = await FriendRepository.list_friends(user_uuid, None, 2)
+        if cursor:
+            await FriendRepository.list_friends(user_uuid, decode_cursor(cursor, 1)[0], page_size)
+
+    async def list_requests(user_uuid: str):
+        await FriendRepository.list_received_requests(user_uuid, None, page_size)
+
+    async def suggest(user_uuid: str):
+        status_code, result = await FriendService.suggest_friends(principal(user_uuid))
+        assert isinstance(result, list), result
+
+    results = {
+        "list_friends": await timed(sample, list_friends),
+        "list_friends_second_page": await timed(sample, list_friends_second_page),
+        "list_received_requests": await timed(sample, list_requests),
+    }
+
+    cache = FriendGraphCache.get_instance()
+    cache.cache.clear()
+    results["suggest_cold_cache"] = await timed(sample, suggest)
+    results["suggest_warm_cache"] = await timed(sample, suggest)
+    results["graph_cache"] = cache.stats()
+
+    with DBObject.get_instance().engine.connect() as connection:
+        results["received_plan"] = [row[-1] for row in connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT transmit_user_uuid FROM friend "
+            "WHERE receive_user_uuid = :uuid AND status = 'accepted' ORDER BY transmit_user_uuid"),
+            {"uuid": sample[0]})]
+
+        connection.execute(text("DROP INDEX ix_friend_receive_status"))
+        connection.execute(text("DROP INDEX ix_friend_transmit_status"))
+        connection.commit()
+
+    # 풀에 남아있는 커넥션이 이전 스키마로 준비된 문장을 쓰지 않도록 비움
+    await DBObject.get_instance().async_engine.dispose()
+    results["list_friends_without_indexes"] = await timed(sample[:max(1, samples // 10)], list_friends)
+    results["list_received_requests_without_indexes"] = await timed(sample[:max(1, samples // 10)], list_requests)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--degree", type=int, default=10)
+    parser.add_argument("--pending", type=int, default=1)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_environment()
+    create_schema()
+
+    started = time.perf_counter()
+    user_uuids = seed(args.users, args.degree, args.pending, args.seed)
+    seeded = time.perf_counter() - started
+
+    results = asyncio.run(run(user_uuids, args.samples, args.page_size, args.seed))
+    print(json.dumps({"config": vars(args), "seed_s": round(seeded, 2), **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""방 대시보드 쿼리 수 / 지연 시간 벤치마크
+
+카테고리 수를 늘려가면서 RoomRepository.find_dashboard()가 실행하는 SQL 수가
+변하지 않는지 확인하고(변하면 AssertionError), 카테고리마다 할 일을 따로 조회하는
+N+1 방식과 지연 시간을 비교합니다.
+
+    python -m benchmark.room_dashboard --categories 1 10 100 --tasks 20
+"""
+from benchmark.common import setup_environment, create_schema
+from datetime import datetime, timedelta
+from typing import List
+import argparse
+import asyncio
+import json
+import time
+
+
+def seed(categories: int, tasks: int) -> str:
+    from model.room import Room, RoomEntry, RoomEntryStatus
+    from database.connection import DBObject
+    from model.category import Category
+    from model.user import User
+    from model.task import Task
+
+    base = datetime(2026, 1, 1, 9, 0, 0)
+    with DBObject.get_instance().session_scope() as session:
+        user = User(f"bench-{categories}", "password",
+                    f"bench-{categories}", f"bench-{categories}@localhost")
+        room = Room(f"방 {categories}")
+        session.add_all([user, room])
+        session.flush()
+        session.add(RoomEntry(room_uuid=room.room_uuid, user_uuid=user.user_uuid,
+                              status=RoomEntryStatus.accepted))
+        for i in range(categories):
+            category = Category(f"카테고리 {i}", user.user_uuid, room.room_uuid)
+            session.add(category)
+            session.flush()
+            session.add_all([
+                Task(f"할 일 {j}", "내용", category.category_uuid, user.user_uuid, room.room_uuid,
+                     end_at=base + timedelta(hours=j))
+                for j in range(tasks)
+            ])
+
+        return room.room_uuid
+
+
+async def naive_dashboard(room_uuid: str) -> dict:
+    """relationship 없이 카테고리마다 할 일을 조회하던 방식"""
+    from database.connection import DBObject
+    from model.category import Category
+    from model.room import Room
+    from model.task import Task
+    from sqlalchemy import select
+
+    async with DBObject.get_instance().async_session_scope() as session:
+        room = (await session.execute(select(Room).filter(Room.room_uuid == room_uuid))).scalars().first()
+        categories = (await session.execute(
+            select(Category).filter(Category.room_uuid == room_uuid))).scalars().all()
+        result = {**room.get_attributes(), "categories": []}
+        for category in categories:
+            tasks = (await session.execute(
+                select(Task).filter(Task.category_uuid == category.category_uuid))).scalars().all()
+            result["categories"].append({
+                **category.get_attributes(),
+                "task_count": len(tasks),
+                "tasks": [task.get_attributes() for task in tasks],
+            })
+
+        return result
+
+
+async def measure(func, repeat: int) -> tuple:
+    from database.connection import DBObject
+    from sqlalchemy import event
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = DBObject.get_instance().async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count)
+    try:
+        await func()
+        queries = len(statements)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await func()
+        elapsed = (time.perf_counter() - started) / repeat
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count)
+
+    return queries, elapsed
+
+
+async def run(category_counts: List[int], tasks: int, repeat: int) -> List[dict]:
+    from repository.room_repository import RoomRepository
+
+    results = []
+    for categories in category_counts:
+        room_uuid = seed(categories, tasks)
+
+        async def dashboard():
+            room = await RoomRepository.find_dashboard(room_uuid)
+            return room.get_dashboard_attributes()
+
+        assert (await dashboard())["categories"][0]["task_count"] == tasks
+        queries, elapsed = await measure(dashboard, repeat)
+        naive_queries, naive_elapsed = await measure(lambda: naive_dashboard(room_uuid), repeat)
+        results.append({
+            "categories": categories,
+            "tasks_per_category": tasks,
+            "queries": queries,
+            "latency_ms": round(elapsed * 1000, 3),
+            "naive_queries": naive_queries,
+            "naive_latency_ms": round(naive_elapsed * 1000, 3),
+        })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--categories", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_environment()
+    create_schema()
+
+    results = asyncio.run(run(args.categories, args.tasks, args.repeat))
+    query_counts = {result["queries"] for result in results}
+    assert len(query_counts) == 1, f"카테고리 수에 따라 쿼리 수가 달라졌습니다: {results}"
+
+    print(json.dumps({"config": vars(args), "results": results}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
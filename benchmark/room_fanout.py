@@ -0,0 +1,185 @@
+"""방 실시간 동기화 부하 테스트 (websockets 패키지 필요)
+
+uvicorn으로 앱을 별도 프로세스에서 띄우고, --rooms개의 방에 나눠서 참여한 유저들이
+--sockets개의 웹소켓을 동시에 연결한 상태에서 HTTP로 할 일을 생성하고,
+요청을 보낸 시점부터 각 소켓이 변경 사항을 받기까지의 지연 시간을 측정합니다.
+
+    python -m benchmark.room_fanout --sockets 10000 --rooms 100 --rounds 20
+"""
+from benchmark.common import setup_environment, create_schema, percentile
+from datetime import datetime
+from typing import Dict, List
+import subprocess
+import argparse
+import asyncio
+import socket
+import json
+import time
+import uuid
+import sys
+import os
+
+
+def seed(sockets: int, rooms: int) -> Dict[str, List[str]]:
+    """방마다 sockets / rooms 명의 참여 유저와 카테고리 하나를 생성하고 {room_uuid: [user_uuid, ...]}를 반환"""
+    from model.room import Room, RoomEntry, RoomEntryStatus
+    from database.connection import DBObject
+    from model.category import Category
+    from model.user import User
+    from sqlalchemy import insert
+
+    now = datetime.now()
+    members: Dict[str, List[str]] = {str(uuid.uuid4()): [] for _ in range(rooms)}
+    users, entries = [], []
+    for index in range(sockets):
+        room_uuid = list(members)[index % rooms]
+        user_uuid = str(uuid.uuid4())
+        members[room_uuid].append(user_uuid)
+        users.append({"user_uuid": user_uuid, "user_id": f"user{index}", "password": "x",
+                      "nickname": f"n{index}", "email": f"user{index}@localhost", "created_at": now})
+        entries.append({"room_uuid": room_uuid, "user_uuid": user_uuid,
+                        "created_at": now, "status": RoomEntryStatus.accepted})
+
+    with DBObject.get_instance().engine.begin() as connection:
+        connection.execute(insert(User), users)
+        connection.execute(insert(Room), [
+            {"room_uuid": room_uuid, "room_name": f"방 {i}", "created_at": now} for i, room_uuid in enumerate(members)])
+        connection.execute(insert(RoomEntry), entries)
+        connection.execute(insert(Category), [
+            {"category_uuid": room_uuid, "category_name": "카테고리", "owner_uuid": users[0]["user_uuid"],
+             "room_uuid": room_uuid, "created_at": now} for room_uuid in members])
+
+    return members
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+
+    raise RuntimeError("서버가 시작되지 않았습니다.")
+
+
+async def run(args, members: Dict[str, List[str]], port: int) -> dict:
+    from service.token_service import TokenService
+    import websockets
+    import httpx
+
+    tokens = {user_uuid: TokenService.get_instance().encode({"sub": user_uuid})
+              for room_members in members.values() for user_uuid in room_members}
+
+    received: Dict[str, List[float]] = {}
+    connect_latencies: List[float] = []
+    connections = []
+    semaphore = asyncio.Semaphore(args.connect_concurrency)
+
+    async def connect(user_uuid: str):
+        async with semaphore:
+            started = time.perf_counter()
+            connection = await websockets.connect(
+                f"ws://127.0.0.1:{port}/ws/room?token={tokens[user_uuid]}", max_queue=None, open_timeout=60)
+            connect_latencies.append(time.perf_counter() - started)
+            connections.append(connection)
+
+    async def consume(connection):
+        try:
+            async for message in connection:
+                arrived = time.perf_counter()
+                task_uuid = json.loads(message)["data"].get("task_uuid")
+                received.setdefault(task_uuid, []).append(arrived)
+        except websockets.ConnectionClosed:
+            pass
+
+    started = time.perf_counter()
+    await asyncio.gather(*(connect(user_uuid) for user_uuid in tokens))
+    connect_elapsed = time.perf_counter() - started
+    consumers = [asyncio.create_task(consume(connection)) for connection in connections]
+
+    room_uuids = list(members)
+    latencies: List[float] = []
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60) as client:
+        sent = []
+        for round_index in range(args.rounds):
+            room_uuid = room_uuids[round_index % len(room_uuids)]
+            owner = members[room_uuid][0]
+            published_at = time.perf_counter()
+            response = await client.post(f"/room/{room_uuid}/task", headers={"Authorization": f"Bearer {tokens[owner]}"},
+                                         json={"title": f"할 일 {round_index}", "content": "내용", "category_uuid": room_uuid})
+            sent.append((response.json()["task"]["task_uuid"], published_at, len(members[room_uuid])))
+            await asyncio.sleep(args.interval)
+
+        await asyncio.sleep(args.settle)
+
+        broker = (await client.get("/internal/room/broker", headers={"X-Internal-Token": os.environ["INTERNAL_API_TOKEN"]})).json()
+
+    expected = delivered = 0
+    for task_uuid, published_at, subscribers in sent:
+        arrivals = received.get(task_uuid, [])
+        expected += subscribers
+        delivered += len(arrivals)
+        latencies.extend(arrived - published_at for arrived in arrivals)
+
+    for consumer in consumers:
+        consumer.cancel()
+    await asyncio.gather(*(connection.close() for connection in connections), return_exceptions=True)
+
+    return {
+        "connected": len(connections),
+        "connect_elapsed_s": round(connect_elapsed, 2),
+        "connect_p95_ms": round(percentile(connect_latencies, 95) * 1000, 2),
+        "expected_messages": expected,
+        "delivered_messages": delivered,
+        "fanout_p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "fanout_p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "fanout_p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "broker": broker.get("broker"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=10000)
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.1)
+    parser.add_argument("--settle", type=float, default=2.0)
+    parser.add_argument("--connect-concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    setup_environment()
+    os.environ.setdefault("INTERNAL_API_TOKEN", "benchmark-internal-token")
+    create_schema()
+    members = seed(args.sockets, args.rooms)
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--ws", "auto", "--log-level", "warning", "--backlog", "4096"],
+        stdout=subprocess.DEVNULL)
+
+    async def bench():
+        await wait_ready(port)
+        return await run(args, members, port)
+
+    try:
+        results = asyncio.run(bench())
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    print(json.dumps({"config": vars(args), **results}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Task 행 직렬화 벤치마크
+
+변경 전 방식(행마다 strftime 3번 + 표준 json JSONResponse)과
+컴파일된 TASK_SERIALIZER + FastJSONResponse를 비교합니다.
+
+    python -m benchmark.serialize_tasks --rows 10000 --repeat 5
+"""
+from benchmark.common import setup_environment
+from datetime import datetime, timedelta
+import argparse
+import json
+import time
+
+
+def legacy_attributes(task) -> dict:
+    """변경 전 Task.get_attributes()"""
+    return {
+        "task_uuid": task.task_uuid,
+        "title": task.title,
+        "content": task.content,
+        "category_uuid": task.category_uuid,
+        "user_uuid": task.user_uuid,
+        "room_uuid": task.room_uuid,
+        "created_at": task.created_at.strftime("%Y/%m/%d %H:%M:%S"),
+        "updated_at": task.updated_at.strftime("%Y/%m/%d %H:%M:%S"),
+        "end_at": task.end_at.strftime("%Y/%m/%d %H:%M:%S"),
+    }
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_environment()
+    from model.response import FastJSONResponse, orjson
+    from fastapi.responses import JSONResponse
+    from model.task import Task
+
+    base = datetime(2026, 1, 1, 9, 0, 0)
+    tasks = []
+    for i in range(args.rows):
+        task = Task(f"할 일 {i}", "내용" * 20, "category", "user", "room",
+                    created_at=base + timedelta(minutes=i), updated_at=base + timedelta(minutes=i, seconds=30),
+                    end_at=base + timedelta(days=1, minutes=i))
+        task.task_uuid = f"task-{i:08d}"
+        tasks.append(task)
+
+    assert legacy_attributes(tasks[0]) == tasks[0].get_attributes()
+
+    legacy = best_of(args.repeat, lambda: JSONResponse(
+        {"status_code": 200, "tasks": [legacy_attributes(task) for task in tasks]}))
+    attributes = best_of(args.repeat, lambda: FastJSONResponse(
+        {"status_code": 200, "tasks": [task.get_attributes() for task in tasks]}))
+    rows = best_of(args.repeat, lambda: FastJSONResponse(
+        {"status_code": 200, "tasks": tasks}))
+
+    print(json.dumps({
+        "config": vars(args),
+        "orjson": orjson is not None,
+        "legacy_strftime_json_ms": round(legacy * 1000, 2),
+        "compiled_serializer_ms": round(attributes * 1000, 2),
+        "orm_rows_direct_ms": round(rows * 1000, 2),
+        "speedup": round(legacy / min(attributes, rows), 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""로컬 SMTP 대역 서버 (aiosmtpd 필요)
+
+    python -m benchmark.smtp_stub --port 8025
+
+앱은 SMTP_HOST=localhost, SMTP_PORT=8025, SMTP_SECURITY=none 으로 실행
+"""
+from typing import Dict, List
+import argparse
+import time
+
+
+class RecordingHandler:
+    """받은 메일의 수신자와 도착 시각, 수신자별 마지막 메일 본문을 기록"""
+
+    def __init__(self):
+        self.messages: List[tuple] = []
+        self.latest: Dict[str, bytes] = {}
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.rcpt_tos, time.monotonic()))
+        for recipient in envelope.rcpt_tos:
+            self.latest[recipient] = envelope.content
+        return "250 Message accepted for delivery"
+
+
+def start_stub(host: str = "127.0.0.1", port: int = 8025):
+    """백그라운드 스레드에서 SMTP 서버를 시작하고 (controller, handler)를 반환"""
+    from aiosmtpd.controller import Controller
+
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname=host, port=port)
+    controller.start()
+    return controller, handler
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    args = parser.parse_args()
+
+    controller, handler = start_stub(args.host, args.port)
+    print(f"SMTP stub listening on {args.host}:{args.port}")
+    try:
+        while True:
+            time.sleep(5)
+            print(f"received {len(handler.messages)} messages")
+    except KeyboardInterrupt:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
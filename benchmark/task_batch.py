@@ -0,0 +1,102 @@
+"""할 일 일괄 처리 벤치마크
+
+같은 방에 대해 개별 API(POST /room/{room_uuid}/task, PATCH /room/{room_uuid}/task/{task_uuid})를
+--items번 호출하는 경우와 POST /room/{room_uuid}/task/batch 한 번으로 처리하는 경우의
+전체 시간과 실행된 SQL 수를 비교합니다.
+
+    python -m benchmark.task_batch --items 500
+"""
+from benchmark.common import setup_environment, create_schema
+from typing import List
+import argparse
+import asyncio
+import json
+import time
+
+
+async def run(items: int) -> dict:
+    from model.room import Room, RoomEntry, RoomEntryStatus
+    from service.token_service import TokenService
+    from httpx import AsyncClient, ASGITransport
+    from database.connection import DBObject
+    from model.category import Category
+    from model.user import User
+    from sqlalchemy import event
+    from main import app
+
+    with DBObject.get_instance().session_scope() as session:
+        user = User("bench", "password", "bench", "bench@localhost")
+        room = Room("벤치마크")
+        session.add_all([user, room])
+        session.flush()
+        session.add(RoomEntry(room_uuid=room.room_uuid, user_uuid=user.user_uuid, status=RoomEntryStatus.accepted))
+        category = Category("카테고리", user.user_uuid, room.room_uuid)
+        session.add(category)
+        session.flush()
+        user_uuid, room_uuid, category_uuid = user.user_uuid, room.room_uuid, category.category_uuid
+
+    headers = {"Authorization": f"Bearer {TokenService.get_instance().encode({'sub': user_uuid})}"}
+    statements: List[str] = []
+    event.listen(DBObject.get_instance().async_engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, parameters, context, executemany: statements.append(statement))
+
+    async def measure(func) -> dict:
+        statements.clear()
+        started = time.perf_counter()
+        value = await func()
+        return {"elapsed_ms": round((time.perf_counter() - started) * 1000, 2), "queries": len(statements), "value": value}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        await client.get(f"/room/{room_uuid}/task", headers=headers)  # 토큰/유저 캐시 준비
+
+        async def single_create():
+            task_uuids = []
+            for i in range(items):
+                response = await client.post(f"/room/{room_uuid}/task", headers=headers, json={
+                    "title": f"할 일 {i}", "content": "내용", "category_uuid": category_uuid})
+                task_uuids.append(response.json()["task"]["task_uuid"])
+            return task_uuids
+
+        async def single_update(task_uuids):
+            for task_uuid in task_uuids:
+                assert (await client.patch(f"/room/{room_uuid}/task/{task_uuid}", headers=headers,
+                                           json={"title": "수정"})).status_code == 200
+
+        async def batch(operations):
+            response = await client.post(f"/room/{room_uuid}/task/batch", headers=headers, json={"operations": operations})
+            assert response.status_code == 200, response.text
+            return [result["task_uuid"] for result in response.json()["results"]]
+
+        results = {}
+        results["single_create"] = await measure(single_create)
+        single_uuids = results["single_create"].pop("value")
+        results["single_update"] = await measure(lambda: single_update(single_uuids))
+        results["single_update"].pop("value")
+
+        results["batch_create"] = await measure(lambda: batch([
+            {"op": "create", "title": f"할 일 {i}", "content": "내용", "category_uuid": category_uuid} for i in range(items)]))
+        batch_uuids = results["batch_create"].pop("value")
+        results["batch_update"] = await measure(lambda: batch([
+            {"op": "update", "task_uuid": task_uuid, "title": "수정"} for task_uuid in batch_uuids]))
+        results["batch_update"].pop("value")
+
+    for kind in ("create", "update"):
+        results[f"{kind}_speedup"] = round(results[f"single_{kind}"]["elapsed_ms"] / results[f"batch_{kind}"]["elapsed_ms"], 2)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=500)
+    args = parser.parse_args()
+
+    setup_environment()
+    create_schema()
+
+    results = asyncio.run(run(args.items))
+    print(json.dumps({"config": vars(args), **results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""토큰 디코딩 처리량 마이크로벤치마크
+
+매 호출마다 환경 변수를 읽고 서명을 검증하던 이전 방식과
+TokenService(설정 1회 로드 + 검증 캐시)를 비교합니다.
+
+    python -m benchmark.token_decode --iterations 100000 --distinct-tokens 100
+"""
+from benchmark.common import setup_environment
+import argparse
+import json
+import time
+import jwt
+import os
+
+
+def decode_with_getenv(access_token: str) -> str:
+    """변경 전 TokenModel.decode_token과 같은 경로"""
+    acem = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
+    sk = os.getenv("SECRET_KEY")
+    al = os.getenv("ALGORITHM")
+    if acem and sk and al:
+        return jwt.decode(access_token, sk, algorithms=[al]).get("sub")
+
+
+def measure(func, tokens, iterations: int) -> dict:
+    started = time.perf_counter()
+    for i in range(iterations):
+        func(tokens[i % len(tokens)])
+
+    elapsed = time.perf_counter() - started
+    return {
+        "iterations": iterations,
+        "elapsed_s": round(elapsed, 4),
+        "decodes_per_s": round(iterations / elapsed, 1),
+        "us_per_decode": round(elapsed / iterations * 1e6, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--distinct-tokens", type=int, default=100)
+    args = parser.parse_args()
+
+    setup_environment()
+    from service.token_service import TokenService
+
+    service = TokenService.get_instance()
+    tokens = [service.encode({"sub": f"user-{i}"})
+              for i in range(args.distinct_tokens)]
+
+    results = {
+        "config": vars(args),
+        "getenv_and_verify": measure(decode_with_getenv, tokens, args.iterations),
+        "token_service": measure(lambda token: service.decode(token)["sub"], tokens, args.iterations),
+        "token_cache": service.stats(),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
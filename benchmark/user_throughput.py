@@ -0,0 +1,109 @@
+"""동시 `/user` 프로필 조회 처리량 벤치마크
+
+비동기 세션 경로(`/user`)와 이전의 동기 세션 경로를 그대로 재현한 라우트를
+같은 SQLite 데이터베이스에 대해 비교합니다. `--query-latency-ms`를 지정하면
+느린 MySQL 쿼리를 흉내내기 위해 user 테이블 조회가 DB 드라이버 쪽에서 지연됩니다.
+
+    python -m benchmark.user_throughput --requests 500 --concurrency 50 --query-latency-ms 20
+"""
+from benchmark.common import setup_environment, create_schema, summarize
+from typing import List
+import argparse
+import asyncio
+import json
+import time
+
+
+def install_query_latency(latency_ms: int) -> None:
+    """user 테이블을 뷰로 바꿔서 조회할 때마다 드라이버 스레드에서 latency_ms 만큼 지연"""
+    from database.connection import DBObject
+    from sqlalchemy import event, text
+
+    def register(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "bench_sleep", 1, lambda ms: time.sleep(ms / 1000) or 1, deterministic=False)
+
+    db = DBObject.get_instance()
+    event.listen(db.engine, "connect", register)
+    event.listen(db.async_engine.sync_engine, "connect", register)
+    db.engine.dispose()
+
+    with db.engine.begin() as connection:
+        connection.execute(text('ALTER TABLE "user" RENAME TO user_data'))
+        connection.execute(text(
+            f'CREATE VIEW "user" AS SELECT * FROM user_data WHERE bench_sleep({latency_ms}) = 1'))
+
+
+async def run(path: str, token: str, total: int, concurrency: int) -> dict:
+    from httpx import AsyncClient, ASGITransport
+    from main import app
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+
+    return summarize(latencies, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--query-latency-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_environment()
+    create_schema()
+
+    from model.response import ResponseModel, ResponseStatusCode
+    from service.user_service import oauth2_scheme
+    from service.auth_service import AuthService
+    from database.connection import DBObject
+    from model.user import User
+    from fastapi import Depends
+    from main import app
+
+    with DBObject.get_instance().session_scope() as session:
+        user = User("bench", "bench-password", "bench", "bench@localhost")
+        session.add(user)
+        session.flush()
+        token = AuthService.create_access_token(data={"sub": user.user_uuid})
+
+    @app.get("/bench/user-sync")
+    async def get_profile_sync(token: str = Depends(oauth2_scheme)):
+        """변경 전 경로: 이벤트 루프 위에서 동기 세션으로 조회"""
+        user_uuid = AuthService.decode_claims(token).get("sub")
+        with DBObject.get_instance().session_scope() as session:
+            user = session.query(User).filter(
+                User.user_uuid == user_uuid).first()
+            session.expunge(user)
+
+        return ResponseModel.show_json(status_code=ResponseStatusCode.SUCCESS, user=user.get_attributes())
+
+    if args.query_latency_ms:
+        install_query_latency(args.query_latency_ms)
+
+    async def compare():
+        return {
+            "config": vars(args),
+            "before_sync_session": await run("/bench/user-sync", token, args.requests, args.concurrency),
+            "after_async_session": await run("/user", token, args.requests, args.concurrency),
+        }
+
+    results = asyncio.run(compare())
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
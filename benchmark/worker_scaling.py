@@ -0,0 +1,127 @@
+"""운영 모드 워커 수에 따른 처리량 벤치마크
+
+`python main.py`를 SERVER_MODE=production으로 워커 수만 바꿔가며 실행하고, 클라이언트 프로세스
+--clients개가 `--path`(기본값 `/user` 프로필 조회)에 --duration초 동안 요청을 보내서
+워커 수별 처리량, 지연 시간, 워커 1개 대비 배율을 출력합니다.
+클라이언트가 병목이 되지 않도록 서버와 클라이언트를 합친 프로세스 수가 CPU 수를 넘지 않게 잡으세요.
+
+    python -m benchmark.worker_scaling --workers 1 2 4 --clients 4 --concurrency 64 --duration 10
+"""
+from benchmark.common import setup_environment, create_schema, summarize
+from benchmark.room_fanout import free_port, wait_ready
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+import subprocess
+import argparse
+import asyncio
+import json
+import time
+import sys
+import os
+
+
+def seed() -> str:
+    """벤치마크 유저를 만들고 액세스 토큰을 반환"""
+    from service.token_service import TokenService
+    from database.connection import DBObject
+    from model.user import User
+
+    with DBObject.get_instance().session_scope() as session:
+        user = User("bench", "bench-password", "bench", "bench@localhost")
+        session.add(user)
+        session.flush()
+        return TokenService.get_instance().encode({"sub": user.user_uuid})
+
+
+def client(port: int, path: str, token: str, concurrency: int, duration: float) -> Tuple[List[float], int]:
+    """클라이언트 프로세스 하나에서 duration초 동안 요청을 보내고 (지연 시간 목록, 실패 수)를 반환"""
+    import httpx
+
+    async def run():
+        latencies: List[float] = []
+        failures = 0
+        deadline = time.perf_counter() + duration
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30,
+                                     headers={"Authorization": f"Bearer {token}"}) as http:
+            async def worker():
+                nonlocal failures
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        response = await http.get(path)
+                        if response.status_code != 200:
+                            failures += 1
+                            continue
+                    except httpx.HTTPError:
+                        failures += 1
+                        continue
+
+                    latencies.append(time.perf_counter() - started)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        return (latencies, failures)
+
+    return asyncio.run(run())
+
+
+def measure(workers: int, args, token: str) -> dict:
+    port = free_port()
+    env = {**os.environ, "SERVER_MODE": "production", "SERVER_PORT": str(port),
+           "SERVER_HOST": "127.0.0.1", "SERVER_WORKERS": str(workers)}
+    server = subprocess.Popen([sys.executable, "main.py"], env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_ready(port))
+        # 워커가 모두 앱을 불러올 때까지 대기
+        time.sleep(args.warmup)
+
+        per_client = max(1, args.concurrency // args.clients)
+        with ProcessPoolExecutor(max_workers=args.clients) as executor:
+            started = time.perf_counter()
+            results = list(executor.map(
+                client, *zip(*[(port, args.path, token, per_client, args.duration)] * args.clients)))
+            elapsed = time.perf_counter() - started
+
+    finally:
+        started = time.perf_counter()
+        server.terminate()
+        server.wait(timeout=60)
+        shutdown = time.perf_counter() - started
+
+    latencies = [latency for client_latencies, _ in results for latency in client_latencies]
+    return {"workers": workers, **summarize(latencies, elapsed),
+            "failures": sum(failures for _, failures in results), "shutdown_s": round(shutdown, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=2, help="부하를 만드는 클라이언트 프로세스 수")
+    parser.add_argument("--concurrency", type=int, default=64, help="전체 동시 요청 수")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--path", default="/user")
+    args = parser.parse_args()
+
+    setup_environment()
+    # 워커끼리 공유해야 하는 저장소는 DB를 사용
+    os.environ.setdefault("VERIFICATION_STORE", "database")
+    create_schema()
+    token = seed()
+
+    results = [measure(workers, args, token) for workers in args.workers]
+    baseline = results[0]["throughput_rps"] or 1
+    for result in results:
+        result["speedup"] = round(result["throughput_rps"] / baseline, 2)
+
+    from util.server_settings import ServerSettings
+    os.environ["SERVER_MODE"] = "production"
+    options = ServerSettings.from_env()
+    print(json.dumps({"config": {**vars(args), "cpus": os.cpu_count(), "loop": options["loop"], "http": options["http"]},
+                      "results": results}, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from model.response import ResponseModel, ResponseStatusCode, Detail
+from service.friend_service import FriendService
+from service.user_service import UserService
+from fastapi import APIRouter, Depends
+from model.friend import FriendStatus
+from model.user import User
+from typing import Tuple
+
+friend_controller = APIRouter(
+    prefix='/friend',
+    tags=['friend']
+)
+
+
+@friend_controller.get("", name="친구 목록 조회")
+async def get_friends(cursor: str | None = None, limit: int = 50, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.list_friends(result, cursor, limit)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="친구 목록을 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="친구 목록을 성공적으로 불러왔습니다.", friends=result.items, next_cursor=result.next_cursor)
+
+
+@friend_controller.get("/requests", name="받은 친구 요청 목록 조회")
+async def get_requests(cursor: str | None = None, limit: int = 50, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.list_friends(result, cursor, limit, received=True)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="친구 요청 목록을 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="친구 요청 목록을 성공적으로 불러왔습니다.", requests=result.items, next_cursor=result.next_cursor)
+
+
+@friend_controller.get("/suggestions", name="친구 추천")
+async def get_suggestions(limit: int = 10, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.suggest_friends(result, limit)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="추천 친구를 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="추천 친구를 성공적으로 불러왔습니다.", suggestions=result)
+
+
+@friend_controller.get("/{user_uuid}/mutual", name="함께 아는 친구 조회")
+async def get_mutual_friends(user_uuid: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.mutual_friends(result, user_uuid)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="함께 아는 친구를 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="함께 아는 친구를 성공적으로 불러왔습니다.", friends=result)
+
+
+@friend_controller.post("/{user_uuid}", name="친구 요청")
+async def request_friend(user_uuid: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.request_friend(result, user_uuid)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="친구 요청에 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="친구 요청을 성공적으로 처리하였습니다.", friend=result)
+
+
+@friend_controller.post("/{user_uuid}/accept", name="친구 요청 수락")
+async def accept_friend(user_uuid: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.answer_request(result, user_uuid, FriendStatus.accepted)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="친구 요청을 수락하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="친구 요청을 수락하였습니다.", friend=result)
+
+
+@friend_controller.post("/{user_uuid}/reject", name="친구 요청 거절")
+async def reject_friend(user_uuid: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.answer_request(result, user_uuid, FriendStatus.rejected)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="친구 요청을 거절하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="친구 요청을 거절하였습니다.", friend=result)
+
+
+@friend_controller.post("/{user_uuid}/block", name="유저 차단")
+async def block_user(user_uuid: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await FriendService.block_user(result, user_uuid)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저를 차단하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="유저를 차단하였습니다.", friend=result)
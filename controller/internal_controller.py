@@ -0,0 +1,46 @@
+from model.response import ResponseModel, ResponseStatusCode, Detail
+from service.internal_service import InternalService
+from fastapi import APIRouter, Depends
+from typing import Tuple
+
+internal_controller = APIRouter(
+    prefix='/internal',
+    tags=['internal'],
+    include_in_schema=False,
+)
+
+
+@internal_controller.get("/db/pool", name="커넥션 풀 통계")
+async def get_pool_stats(result: Tuple[ResponseStatusCode, Detail | None] = Depends(InternalService.verify_internal_token)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="내부 API에 접근할 수 없습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="커넥션 풀 통계를 성공적으로 불러왔습니다.", pool=InternalService.get_pool_stats())
+
+
+@internal_controller.get("/email/outbox", name="메일 발송 대기열 통계")
+async def get_outbox_stats(result: Tuple[ResponseStatusCode, Detail | None] = Depends(InternalService.verify_internal_token)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="내부 API에 접근할 수 없습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="메일 발송 대기열 통계를 성공적으로 불러왔습니다.", outbox=InternalService.get_outbox_stats())
+
+
+@internal_controller.get("/room/broker", name="방 변경 사항 브로커 통계")
+async def get_broker_stats(result: Tuple[ResponseStatusCode, Detail | None] = Depends(InternalService.verify_internal_token)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="내부 API에 접근할 수 없습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="브로커 통계를 성공적으로 불러왔습니다.", broker=InternalService.get_broker_stats())
+
+
+@internal_controller.get("/rate-limit", name="요청 한도 통계")
+async def get_rate_limit_stats(result: Tuple[ResponseStatusCode, Detail | None] = Depends(InternalService.verify_internal_token)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="내부 API에 접근할 수 없습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="요청 한도 통계를 성공적으로 불러왔습니다.", rate_limit=InternalService.get_rate_limit_stats())
@@ -0,0 +1,18 @@
+from model.response import ResponseModel, ResponseStatusCode, Detail
+from service.internal_service import InternalService
+from fastapi import APIRouter, Depends
+from typing import Tuple
+
+metrics_controller = APIRouter(
+    tags=['metrics'],
+    include_in_schema=False,
+)
+
+
+@metrics_controller.get("/metrics", name="Prometheus 메트릭")
+async def get_metrics(result: Tuple[ResponseStatusCode, Detail | None] = Depends(InternalService.verify_metrics_token)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="내부 API에 접근할 수 없습니다.", detail=result.text)
+
+    return ResponseModel.show_text(InternalService.get_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
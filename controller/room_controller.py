@@ -0,0 +1,76 @@
+from model.response import ResponseModel, ResponseStatusCode, Detail
+from model.category import CreateCategoryModel
+from service.user_service import UserService
+from service.room_service import RoomService
+from util.etag import ConditionalRequest
+from fastapi import APIRouter, Depends
+from model.room import CreateRoomModel
+from model.user import User
+from typing import Tuple
+
+room_controller = APIRouter(
+    prefix='/room',
+    tags=['room']
+)
+
+
+@room_controller.post("", name="방 생성")
+async def create_room(form_data: CreateRoomModel, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await RoomService.create_room(result, form_data)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="방을 생성하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="방이 성공적으로 생성되었습니다.", room=result)
+
+
+@room_controller.get("/{room_uuid}", name="방 대시보드 조회")
+async def get_dashboard(room_uuid: str, conditional: ConditionalRequest = Depends(), result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    user = result
+    status_code, result = await RoomService.get_version(user, room_uuid)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="방 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    not_modified = conditional.not_modified("room", room_uuid, result)
+    if not_modified:
+        return not_modified
+
+    status_code, result = await RoomService.get_dashboard(user, room_uuid, member_checked=True)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="방 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, headers=conditional.headers, message="방 정보를 성공적으로 불러왔습니다.", room=result.get_dashboard_attributes())
+
+
+@room_controller.get("/{room_uuid}/changes", name="방 변경 사항 동기화")
+async def get_changes(room_uuid: str, cursor: str | None = None, limit: int = 500, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await RoomService.get_changes(result, room_uuid, cursor, limit)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="변경 사항을 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="변경 사항을 성공적으로 불러왔습니다.", tasks=result.tasks, categories=result.categories,
+                                   deleted={"tasks": result.deleted_tasks, "categories": result.deleted_categories}, next_cursor=result.next_cursor, has_more=result.has_more)
+
+
+@room_controller.post("/{room_uuid}/category", name="카테고리 생성")
+async def create_category(room_uuid: str, form_data: CreateCategoryModel, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await RoomService.create_category(result, room_uuid, form_data)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="카테고리를 생성하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="카테고리가 성공적으로 생성되었습니다.", category=result)
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, WebSocket, status
+from service.room_sync_service import RoomSyncService
+from model.response import Detail
+import asyncio
+import os
+
+room_sync_controller = APIRouter(
+    prefix='/ws',
+    tags=['room']
+)
+
+
+@room_sync_controller.websocket("/room")
+async def room_sync(websocket: WebSocket, token: str | None = None):
+    """참여한 방들의 할 일/카테고리 변경 사항을 실시간으로 전달
+    브라우저는 웹소켓에 헤더를 붙일 수 없으므로 token 쿼리 파라미터도 허용"""
+    authorization = websocket.headers.get("authorization", "")
+    if not token and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+
+    if not token:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="토큰이 필요합니다.")
+        return
+
+    status_code, user = await RoomSyncService.authenticate(token)
+    if isinstance(user, Detail):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="유저 정보를 불러오는데 실패하였습니다.")
+        return
+
+    send_timeout = float(os.getenv("ROOM_SOCKET_SEND_TIMEOUT", "10"))
+    recheck_interval = float(os.getenv("ROOM_SOCKET_RECHECK_INTERVAL", "60"))
+
+    await websocket.accept()
+    subscription = None
+    tasks = []
+    try:
+        status_code, result = await RoomSyncService.subscribe(user)
+        if isinstance(result, Detail):
+            await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="방 정보를 불러오는데 실패하였습니다.")
+            return
+
+        subscription = result
+
+        async def send():
+            while True:
+                payload = await subscription.get()
+                if payload is None:
+                    await websocket.close(code=status.WS_1001_GOING_AWAY)
+                    return
+
+                # 보내기가 오래 막히는 소켓은 끊어서 다른 구독자와 서버 메모리에 영향을 주지 않도록 함
+                await asyncio.wait_for(websocket.send_text(payload), send_timeout)
+
+        async def receive():
+            # 클라이언트가 보내는 메시지(ping 등)는 무시하고 연결 종료만 감지
+            while True:
+                await websocket.receive_text()
+
+        async def recheck():
+            # 연결한 뒤에 토큰이 만료/폐기되거나 방에서 나가면 더 이상 변경 사항을 보내지 않도록 끊음
+            while True:
+                await asyncio.sleep(RoomSyncService.next_check_in(token, recheck_interval))
+                code = await RoomSyncService.recheck(token, subscription)
+                if code is not None:
+                    await websocket.close(code=code)
+                    return
+
+        tasks = [asyncio.create_task(send()), asyncio.create_task(receive()), asyncio.create_task(recheck())]
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if isinstance(task.exception(), asyncio.TimeoutError):
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        if subscription is not None:
+            RoomSyncService.unsubscribe(subscription)
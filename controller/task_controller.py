@@ -0,0 +1,91 @@
+from model.task import CreateTaskModel, UpdateTaskModel, BatchTaskModel
+from model.response import ResponseModel, ResponseStatusCode, Detail
+from service.user_service import UserService
+from service.task_service import TaskService
+from service.room_service import RoomService
+from util.etag import ConditionalRequest
+from fastapi import APIRouter, Depends
+from model.user import User
+from typing import Tuple
+
+task_controller = APIRouter(
+    prefix='/room/{room_uuid}/task',
+    tags=['task']
+)
+
+
+@task_controller.get("", name="할 일 목록 조회")
+async def get_tasks(room_uuid: str, category_uuid: str | None = None, cursor: str | None = None, limit: int = 50, conditional: ConditionalRequest = Depends(), result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    user = result
+    status_code, result = await RoomService.get_version(user, room_uuid)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="할 일 목록을 불러오는데 실패하였습니다.", detail=result.text)
+
+    not_modified = conditional.not_modified("task", room_uuid, result, category_uuid, cursor, limit)
+    if not_modified:
+        return not_modified
+
+    status_code, result = await TaskService.list_tasks(user, room_uuid, category_uuid, cursor, limit, member_checked=True)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="할 일 목록을 불러오는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, headers=conditional.headers, message="할 일 목록을 성공적으로 불러왔습니다.", tasks=result.items, next_cursor=result.next_cursor)
+
+
+@task_controller.post("", name="할 일 생성")
+async def create_task(room_uuid: str, form_data: CreateTaskModel, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await TaskService.create_task(result, room_uuid, form_data)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="할 일을 생성하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="할 일이 성공적으로 생성되었습니다.", task=result)
+
+
+@task_controller.post("/batch", name="할 일 일괄 처리")
+async def apply_batch(room_uuid: str, form_data: BatchTaskModel, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await TaskService.apply_batch(result, room_uuid, form_data)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="할 일을 일괄 처리하는데 실패하였습니다.", detail=result.text)
+
+    if status_code != ResponseStatusCode.SUCCESS:
+        return ResponseModel.show_json(status_code=status_code, message="실패한 작업이 있어 아무것도 반영하지 않았습니다.", results=result)
+
+    return ResponseModel.show_json(status_code=status_code, message="할 일을 성공적으로 일괄 처리하였습니다.", results=result)
+
+
+@task_controller.patch("/{task_uuid}", name="할 일 수정")
+async def update_task(room_uuid: str, task_uuid: str, form_data: UpdateTaskModel, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await TaskService.update_task(result, room_uuid, task_uuid, form_data)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="할 일을 수정하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="할 일을 성공적으로 수정하였습니다.", task=result)
+
+
+@task_controller.delete("/{task_uuid}", name="할 일 삭제")
+async def delete_task(room_uuid: str, task_uuid: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await TaskService.delete_task(result, room_uuid, task_uuid)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="할 일을 삭제하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="할 일이 성공적으로 삭제되었습니다.")
@@ -1,8 +1,11 @@
-from model.user import CreateUserModel, LoginModel, UpdateUserModel, User
+from model.user import CreateUserModel, LoginModel, LogoutModel, RefreshTokenModel, UpdateUserModel, User
 from model.response import ResponseModel, ResponseStatusCode, Detail
+from fastapi import APIRouter, Depends, Header, Request, Response
+from service.user_service import UserService, oauth2_scheme
 from fastapi.security import OAuth2PasswordRequestForm
-from service.user_service import UserService
-from fastapi import APIRouter, Depends
+from service.avatar_service import AvatarService
+from service.rate_limiter import RateLimit
+from util.etag import ConditionalRequest
 from typing import Tuple
 
 user_controller = APIRouter(
@@ -12,17 +15,21 @@ user_controller = APIRouter(
 
 
 @user_controller.get("", name="프로필 조회")
-async def get_profile(result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+async def get_profile(conditional: ConditionalRequest = Depends(), result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
     status_code, result = result
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
 
-    return ResponseModel.show_json(status_code=status_code, message="유저 정보를 성공적으로 불러왔습니다.", user=result.get_attributes())
+    not_modified = conditional.not_modified("user", result.user_uuid, result.updated_at)
+    if not_modified:
+        return not_modified
+
+    return ResponseModel.show_json(status_code=status_code, headers=conditional.headers, message="유저 정보를 성공적으로 불러왔습니다.", user=result.get_attributes())
 
 
 @user_controller.post("", name="회원가입")
 async def signup(user: CreateUserModel):
-    status_code, result = UserService.signup(user)
+    status_code, result = await UserService.signup(user)
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="회원가입에 실패하였습니다.", detail=result.text)
 
@@ -35,7 +42,7 @@ async def update(form_data: UpdateUserModel, result: Tuple[ResponseStatusCode, U
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
 
-    status_code, result = UserService.update_user(
+    status_code, result = await UserService.update_user(
         result, form_data.password, form_data.nickname, form_data.email, form_data.avatar_path)
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="유저 정보를 수정하는데 실패하였습니다.", detail=result.text)
@@ -43,33 +50,85 @@ async def update(form_data: UpdateUserModel, result: Tuple[ResponseStatusCode, U
     return ResponseModel.show_json(status_code=status_code, message="유저 정보를 성공적으로 변경하였습니다.", user=result.get_attributes())
 
 
+@user_controller.put("/avatar", name="아바타 업로드")
+async def upload_avatar(request: Request, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    """multipart가 아닌 이미지 바이트를 그대로 본문으로 전송 (Content-Type: image/*)"""
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await AvatarService.upload_avatar(result, request.headers.get("content-type"), request.stream())
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="아바타를 업로드하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="아바타를 성공적으로 변경하였습니다.", user=result.get_attributes())
+
+
+@user_controller.get("/avatar/{digest}", name="아바타 조회")
+async def get_avatar(digest: str, size: int | None = None, if_none_match: str | None = Header(default=None), if_modified_since: str | None = Header(default=None)):
+    status_code, result = AvatarService.get_avatar(digest, size, if_none_match, if_modified_since)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="아바타를 불러오는데 실패하였습니다.", detail=result.text)
+
+    if status_code == ResponseStatusCode.NOT_MODIFIED:
+        return ResponseModel.show_not_modified(result.headers)
+
+    if "X-Accel-Redirect" in result.headers:
+        return Response(media_type=result.media_type, headers=result.headers)
+
+    return ResponseModel.show_image(result.path, result.media_type, result.headers)
+
+
 @user_controller.delete("", name="회원탈퇴")
 async def signout(password: str, result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
     status_code, result = result
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
 
-    status_code, result = UserService.delete_user(result, password)
+    status_code, result = await UserService.delete_user(result, password)
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="회원탈퇴에 실패하였습니다.", detail=result.text)
 
     return ResponseModel.show_json(status_code=status_code, message="유저가 성공적으로 제거되었습니다.")
 
 
-@user_controller.post("/auth/login", name="로그인")
+@user_controller.post("/auth/login", name="로그인", dependencies=[Depends(RateLimit.login)])
 async def login(form_data: LoginModel):
-    status_code, result = UserService.login(
+    status_code, result = await UserService.login(
         form_data.user_id, form_data.password)
 
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="아이디 또는 비밀번호가 잘못 입력되었습니다.", detail=result.text)
 
-    return ResponseModel.show_json(status_code=status_code, message="로그인에 성공하였습니다.", token={"access_token": result.access_token, "token_type": result.token_type})
+    return ResponseModel.show_json(status_code=status_code, message="로그인에 성공하였습니다.", token=result.get_attributes())
+
+
+@user_controller.post("/auth/refresh", name="토큰 재발급")
+async def refresh(form_data: RefreshTokenModel):
+    status_code, result = await UserService.refresh_token(form_data.refresh_token)
+
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="토큰을 재발급하는데 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="토큰을 성공적으로 재발급하였습니다.", token=result.get_attributes())
+
+
+@user_controller.post("/auth/logout", name="로그아웃")
+async def logout(form_data: LogoutModel | None = None, token: str = Depends(oauth2_scheme), result: Tuple[ResponseStatusCode, User | Detail] = Depends(UserService.get_current_user)):
+    status_code, result = result
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="유저 정보를 불러오는데 실패하였습니다.", detail=result.text)
+
+    status_code, result = await UserService.logout(result, token, form_data.refresh_token if form_data else None)
+    if isinstance(result, Detail):
+        return ResponseModel.show_json(status_code=status_code, message="로그아웃에 실패하였습니다.", detail=result.text)
+
+    return ResponseModel.show_json(status_code=status_code, message="성공적으로 로그아웃하였습니다.")
 
 
-@user_controller.post("/email/send", name="이메일 인증 코드 전송")
+@user_controller.post("/email/send", name="이메일 인증 코드 전송", dependencies=[Depends(RateLimit.email)])
 async def send_email(email: str):
-    status_code, result = UserService.send_email_service(email)
+    status_code, result = await UserService.send_email_service(email)
 
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="인정번호를 전송하는데 실패하였습니다.", detail=result.text)
@@ -79,7 +138,7 @@ async def send_email(email: str):
 
 @user_controller.post("/email/verify", name="이메일 인증")
 async def verify_email(email: str, verify_code: str):
-    status_code, result = UserService.verify_email_service(email, verify_code)
+    status_code, result = await UserService.verify_email_service(email, verify_code)
 
     if isinstance(result, Detail):
         return ResponseModel.show_json(status_code=status_code, message="이메일 인증에 실패하였습니다.", detail=result.text)
@@ -87,13 +146,13 @@ async def verify_email(email: str, verify_code: str):
     return ResponseModel.show_json(status_code=status_code, message="성공적으로 이메일 인증을 완료하였습니다.")
 
 
-@user_controller.post("/token", name="토큰 발급")
+@user_controller.post("/token", name="토큰 발급", dependencies=[Depends(RateLimit.token)])
 async def get_token(form_data: OAuth2PasswordRequestForm = Depends()):
-    _, result = UserService.login(
+    _, result = await UserService.login(
         form_data.username, form_data.password
     )
 
     if isinstance(result, Detail):
         return None
 
-    return {"access_token": result.access_token, "token_type": result.token_type}
+    return result.get_attributes()
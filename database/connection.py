@@ -1,10 +1,82 @@
-from sqlalchemy.engine import create_engine
-from sqlalchemy.orm import sessionmaker
-from contextlib import contextmanager
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from database.pool_monitor import PoolMonitor, PoolSettings
+from contextlib import contextmanager, asynccontextmanager
+from sqlalchemy.engine import create_engine, make_url
+from sqlalchemy.orm import sessionmaker, Session
+from database.query_monitor import QueryMonitor
+from util.structured_log import log_event
+from sqlalchemy.exc import DBAPIError
+from util.ttl_cache import TTLCache
+from contextvars import ContextVar
+from typing import Any, Dict, List
+from sqlalchemy import event
+import logging
 import urllib
+import time
 import os
 
 
+# 동기 드라이버 -> 비동기 드라이버 매핑
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+# read_session_scope가 복제 DB 대신 primary를 고른 상태
+PRIMARY = -1
+
+# 요청을 보낸 유저 (read-your-writes 판단용), 인증할 때 DBObject.set_principal로 설정
+current_principal: ContextVar[str | None] = ContextVar(
+    "current_principal", default=None)
+# 요청 안에서 처음 고른 읽기 대상(복제 DB 번호 또는 PRIMARY)을 계속 사용해서
+# 같은 요청의 읽기가 더 오래된 데이터로 되돌아가지 않도록 함 (ETag 버전과 본문도 같은 곳에서 읽음)
+pinned_replica: ContextVar[int | None] = ContextVar(
+    "pinned_replica", default=None)
+
+
+class WriteTrackingSession(Session):
+    """INSERT/UPDATE/DELETE를 실행했으면 info["wrote"]를 기록하는 세션"""
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _mark_flush(session, flush_context):
+    session.info["wrote"] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _mark_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote"] = True
+
+
+class ReplicaEngine:
+    """복제 DB 하나의 비동기 엔진, 연결에 실패하면 retry_interval 동안 후보에서 제외"""
+
+    def __init__(self, url: str, query_monitor: QueryMonitor):
+        self.url = url
+        self.pool_monitor = PoolMonitor()
+        self.engine = create_async_engine(
+            url, **PoolSettings.engine_kwargs(url, self.pool_monitor, is_async=True))
+        self.pool_monitor.attach(self.engine)
+        query_monitor.attach(self.engine)
+        self.Session = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.down_until = 0.0
+        self.failures = 0
+
+    @property
+    def available(self) -> bool:
+        return self.down_until <= time.monotonic()
+
+    def mark_down(self, retry_interval: float) -> None:
+        self.failures += 1
+        self.down_until = time.monotonic() + retry_interval
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.pool_monitor.stats(), "available": self.available, "failures": self.failures}
+
+
 class DBObject(object):
     _instance = None
 
@@ -16,34 +88,142 @@ class DBObject(object):
     def get_instance(cls):
         """DBObject의 싱글턴 인스턴스를 반환"""
         if cls._instance is None:
-            DB_USER = os.getenv("DB_USER")
-            DB_PASSWORD = os.getenv("DB_PASSWORD")
-            DB_HOST = os.getenv("DB_HOST")
-            DB_PORT = os.getenv("DB_PORT")
-            DB_NAME = os.getenv("DB_NAME")
+            DB_URL = DBObject.get_database_url()
 
-            if not all([DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME]):
-                raise Exception("환경 변수가 올바르게 설정되지 않았습니다. .env 파일을 확인하세요.")
+            cls._instance = object.__new__(cls)
+            cls._instance.url = DB_URL
+            cls._instance.pool_monitor = PoolMonitor()
+            cls._instance.async_pool_monitor = PoolMonitor()
+            cls._instance.query_monitor = QueryMonitor()
+            cls._instance._engine = None
+            cls._instance._Session = None
+            cls._instance._async_engine = None
+            cls._instance._AsyncSession = None
+            cls._instance.replica_urls = [
+                url.strip() for url in os.getenv("DB_REPLICA_URLS", "").split(",") if url.strip()]
+            cls._instance.replica_retry_interval = float(
+                os.getenv("DB_REPLICA_RETRY_INTERVAL", "30"))
+            cls._instance._replicas = None
+            cls._instance._next_replica = 0
+            # 유저가 쓰기를 한 뒤 이 시간(초) 동안은 그 유저의 읽기를 primary로 보냄 (복제 지연보다 길게 설정)
+            cls._instance.recent_writes = TTLCache(
+                max_size=int(os.getenv("DB_READ_YOUR_WRITES_SIZE", "100000")),
+                ttl=float(os.getenv("DB_READ_YOUR_WRITES", "5")),
+            )
 
-            try:
-                DB_URL = (
-                    f"mysql+pymysql://{urllib.parse.quote(DB_USER)}:"
-                    f"{urllib.parse.quote(DB_PASSWORD)}@{DB_HOST}:{DB_PORT}/"
-                    f"{urllib.parse.quote(DB_NAME)}"
-                )
+        return cls._instance
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        """fork된 자식 프로세스에서 부모의 커넥션을 함께 쓰지 않도록 풀만 새로 만듦
+        (close=False: 부모 프로세스가 쓰고 있는 커넥션은 닫지 않고 버림)"""
+        if cls._instance is None:
+            return
+
+        if cls._instance._engine is not None:
+            cls._instance._engine.dispose(close=False)
+        if cls._instance._async_engine is not None:
+            cls._instance._async_engine.sync_engine.dispose(close=False)
+        for replica in cls._instance._replicas or []:
+            replica.engine.sync_engine.dispose(close=False)
+
+    @staticmethod
+    def get_database_url() -> str:
+        """DB_URL 환경 변수가 있으면 그대로 사용하고, 없으면 MySQL 접속 정보로 URL을 생성"""
+        DB_URL = os.getenv("DB_URL")
+        if DB_URL:
+            return DB_URL
+
+        DB_USER = os.getenv("DB_USER")
+        DB_PASSWORD = os.getenv("DB_PASSWORD")
+        DB_HOST = os.getenv("DB_HOST")
+        DB_PORT = os.getenv("DB_PORT")
+        DB_NAME = os.getenv("DB_NAME")
 
-                cls._instance = object.__new__(cls)
-                cls._instance.engine = create_engine(DB_URL)
-                cls._instance.Session = sessionmaker(bind=cls._instance.engine)
+        if not all([DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME]):
+            raise Exception("환경 변수가 올바르게 설정되지 않았습니다. .env 파일을 확인하세요.")
 
+        return (
+            f"mysql+pymysql://{urllib.parse.quote(DB_USER)}:"
+            f"{urllib.parse.quote(DB_PASSWORD)}@{DB_HOST}:{DB_PORT}/"
+            f"{urllib.parse.quote(DB_NAME)}"
+        )
+
+    @staticmethod
+    def get_async_database_url(url: str) -> str:
+        """동기 URL의 드라이버를 비동기 드라이버로 교체 (ASYNC_DB_URL 환경 변수가 우선)"""
+        ASYNC_DB_URL = os.getenv("ASYNC_DB_URL")
+        if ASYNC_DB_URL:
+            return ASYNC_DB_URL
+
+        return DBObject.to_async_url(url)
+
+    @staticmethod
+    def to_async_url(url: str) -> str:
+        sync_url = make_url(url)
+        if sync_url.drivername not in ASYNC_DRIVERS:
+            raise Exception(f"'{sync_url.drivername}' 드라이버에 대응하는 비동기 드라이버가 없습니다. ASYNC_DB_URL을 설정하세요.")
+
+        return sync_url.set(drivername=ASYNC_DRIVERS[sync_url.drivername]).render_as_string(hide_password=False)
+
+    @property
+    def engine(self):
+        """동기 엔진도 처음 사용할 때 생성 (모델을 import하거나 앱을 띄우는 것만으로는 DB에 접속하지 않음)"""
+        if self._engine is None:
+            try:
+                self._engine = create_engine(
+                    self.url, **PoolSettings.engine_kwargs(self.url, self.pool_monitor))
             except Exception as e:
-                print(f"데이터베이스 연결 오류: {e}")
+                log_event("db.connect_failed", logging.ERROR, error=str(e))
                 raise Exception("데이터베이스 연결에 실패했습니다. 환경 변수를 확인하세요.")
 
-        return cls._instance
+            self.pool_monitor.attach(self._engine)
+            self.query_monitor.attach(self._engine)
+            self._Session = sessionmaker(bind=self._engine)
+
+        return self._engine
+
+    @property
+    def async_engine(self):
+        """비동기 엔진은 처음 사용할 때 생성 (스크립트에서는 비동기 드라이버가 필요 없음)"""
+        if self._async_engine is None:
+            ASYNC_DB_URL = DBObject.get_async_database_url(self.url)
+            self._async_engine = create_async_engine(
+                ASYNC_DB_URL, **PoolSettings.engine_kwargs(ASYNC_DB_URL, self.async_pool_monitor, is_async=True))
+            self.async_pool_monitor.attach(self._async_engine)
+            self.query_monitor.attach(self._async_engine)
+            self._AsyncSession = async_sessionmaker(
+                bind=self._async_engine, expire_on_commit=False, sync_session_class=WriteTrackingSession)
+
+        return self._async_engine
+
+    @property
+    def replicas(self) -> List[ReplicaEngine]:
+        """DB_REPLICA_URLS(쉼표로 구분한 동기 URL)의 복제 DB 엔진, 처음 사용할 때 생성"""
+        if self._replicas is None:
+            self._replicas = [ReplicaEngine(DBObject.to_async_url(url), self.query_monitor)
+                              for url in self.replica_urls]
+
+        return self._replicas
+
+    def pool_stats(self) -> Dict[str, Any]:
+        stats = {}
+        if self._engine is not None:
+            stats["sync"] = self.pool_monitor.stats()
+        if self._async_engine is not None:
+            stats["async"] = self.async_pool_monitor.stats()
+        if self._replicas:
+            stats["replicas"] = [replica.stats() for replica in self._replicas]
+
+        return stats
 
     def get_session(self):
-        return self.Session()
+        self.engine
+        return self._Session()
+
+    def get_async_session(self) -> AsyncSession:
+        self.async_engine
+        return self._AsyncSession()
 
     @contextmanager
     def session_scope(self):
@@ -54,8 +234,96 @@ class DBObject(object):
 
         except Exception as e:
             session.rollback()
-            print(f"SQL에서 오류가 발생하였습니다: {e}")
+            log_event("db.rollback", logging.WARNING, error=str(e))
             raise
 
         finally:
             session.close()
+
+    @staticmethod
+    def set_principal(user_uuid: str | None) -> None:
+        """현재 요청의 유저를 기록해서 그 유저가 쓴 내용을 바로 다시 읽을 때 primary를 사용하도록 함"""
+        current_principal.set(user_uuid)
+
+    def record_write(self) -> None:
+        if not self.replica_urls:
+            return
+
+        # 같은 요청의 이후 읽기는 복제 DB로 돌아가지 않음
+        pinned_replica.set(PRIMARY)
+        user_uuid = current_principal.get()
+        if user_uuid is not None:
+            self.recent_writes.set(user_uuid, True)
+
+    async def get_read_session(self) -> AsyncSession:
+        replicas = self.replicas
+        pinned = pinned_replica.get()
+        if not replicas or pinned == PRIMARY:
+            return self.get_async_session()
+
+        user_uuid = current_principal.get()
+        if user_uuid is not None and self.recent_writes.get(user_uuid):
+            pinned_replica.set(PRIMARY)
+            return self.get_async_session()
+
+        if pinned is not None and replicas[pinned].available:
+            candidates = [pinned]
+        else:
+            # 라운드 로빈, 연결에 실패한 복제 DB는 retry_interval 동안 건너뜀
+            start = self._next_replica
+            self._next_replica = (start + 1) % len(replicas)
+            candidates = [index % len(replicas) for index in range(start, start + len(replicas))
+                          if replicas[index % len(replicas)].available]
+
+        for index in candidates:
+            session = replicas[index].Session()
+            try:
+                # 커넥션을 미리 받아서 복제 DB 장애를 쿼리 실행 전에 감지
+                await session.connection()
+            except (DBAPIError, OSError) as e:
+                await session.close()
+                replicas[index].mark_down(self.replica_retry_interval)
+                # 다른 복제 DB나 primary에서 읽음
+                log_event("db.replica_unavailable", logging.WARNING, replica=index, error=str(e))
+                continue
+
+            pinned_replica.set(index)
+            return session
+
+        pinned_replica.set(PRIMARY)
+        return self.get_async_session()
+
+    @asynccontextmanager
+    async def read_session_scope(self):
+        """읽기 전용 세션, 복제 DB(DB_REPLICA_URLS)에 나눠서 보냄
+        복제 DB가 없거나, 모두 연결할 수 없거나, 현재 유저가 DB_READ_YOUR_WRITES초 안에 쓰기를 했으면 primary를 사용
+        복제 지연이 있으므로 쓰기 전에 검증하는 조회나 캐시를 채우는 조회에는 async_session_scope를 사용"""
+        session = await self.get_read_session()
+        try:
+            yield session
+
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def async_session_scope(self):
+        """primary 세션, 블록이 끝나면 커밋 (쓰기와 최신 데이터가 필요한 조회에 사용)"""
+        session = self.get_async_session()
+        try:
+            yield session
+            await session.commit()
+            if session.sync_session.info.get("wrote"):
+                self.record_write()
+
+        except Exception as e:
+            await session.rollback()
+            log_event("db.rollback", logging.WARNING, error=str(e))
+            raise
+
+        finally:
+            await session.close()
+
+
+# uvicorn/gunicorn 워커처럼 엔진을 만든 뒤 fork한 프로세스가 커넥션을 공유하지 않도록 함
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=DBObject.reset_after_fork)
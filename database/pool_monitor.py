@@ -0,0 +1,108 @@
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.engine import make_url
+from util.histogram import Histogram
+from sqlalchemy import event
+from typing import Any, Dict
+import time
+import os
+
+# 커넥션 대기 시간은 대부분 1ms 미만이므로 기본 버킷보다 촘촘하게 나눔
+WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05,
+                0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class PoolSettings:
+    """DB_POOL_* 환경 변수로 설정하는 커넥션 풀 옵션"""
+
+    @staticmethod
+    def from_env() -> Dict[str, Any]:
+        return {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "3600")),
+            "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+        }
+
+    @staticmethod
+    def engine_kwargs(url: str, monitor: "PoolMonitor", is_async: bool = False) -> Dict[str, Any]:
+        """create_engine/create_async_engine에 넘길 풀 옵션 (메모리 SQLite는 단일 커넥션 풀을 유지)"""
+        parsed = make_url(url)
+        if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+            return {}
+
+        base_pool = AsyncAdaptedQueuePool if is_async else QueuePool
+        return {"poolclass": monitor.pool_class(base_pool), **PoolSettings.from_env()}
+
+
+class PoolMonitor:
+    """커넥션 풀 이벤트로 체크아웃/대기 시간/실패 횟수를 수집"""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.checkout_failures = 0
+        self.wait_time = Histogram(WAIT_BUCKETS)
+        self.engine = None
+
+    def pool_class(self, base_pool: type) -> type:
+        """커넥션을 얻기까지 걸린 시간을 재는 풀 클래스 (pool.recreate() 후에도 같은 monitor를 사용)"""
+        monitor = self
+
+        def _do_get(pool):
+            started = time.perf_counter()
+            try:
+                connection = base_pool._do_get(pool)
+
+            except Exception:
+                monitor.checkout_failures += 1
+                raise
+
+            monitor.wait_time.observe(time.perf_counter() - started)
+            return connection
+
+        return type(f"Instrumented{base_pool.__name__}", (base_pool,), {"_do_get": _do_get})
+
+    def attach(self, engine) -> None:
+        self.engine = engine
+        sync_engine = getattr(engine, "sync_engine", engine)
+
+        @event.listens_for(sync_engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+
+        @event.listens_for(sync_engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self.checkouts += 1
+
+        @event.listens_for(sync_engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            self.checkins += 1
+
+        @event.listens_for(sync_engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        pool = getattr(self.engine, "sync_engine", self.engine).pool
+        live = {"status": pool.status()}
+        if isinstance(pool, QueuePool):
+            live = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(0, pool.overflow()),
+                "timeout": pool.timeout(),
+            }
+
+        return {
+            **live,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "checkout_failures": self.checkout_failures,
+            "wait_time": self.wait_time.get_attributes(),
+        }
@@ -0,0 +1,69 @@
+from util.histogram import Histogram
+from typing import Any, Dict, List, Tuple
+from contextvars import ContextVar
+from sqlalchemy import event
+import time
+
+# 쿼리 시간은 대부분 수 ms 이내이므로 기본 버킷보다 촘촘하게 나눔
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01,
+                 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+class QueryStats:
+    """요청 하나에서 실행된 쿼리 수와 DB 시간, SQL별 실행 횟수/시간 (SQL 종류는 max_statements개까지만 기록)"""
+    count: int
+    duration: float
+    statements: Dict[str, List[float]]
+
+    def __init__(self, max_statements: int = 100):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = {}
+        self.max_statements = max_statements
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        entry = self.statements.get(statement)
+        if entry is not None:
+            entry[0] += 1
+            entry[1] += duration
+        elif len(self.statements) < self.max_statements:
+            self.statements[statement] = [1, duration]
+
+    def slowest(self, limit: int) -> List[Tuple[str, int, float]]:
+        """총 소요 시간이 긴 순서로 (SQL, 실행 횟수, 총 시간), 같은 SQL이 여러 번 실행됐으면 N+1을 의심"""
+        return sorted(((statement, int(count), duration) for statement, (count, duration) in self.statements.items()),
+                      key=lambda item: item[2], reverse=True)[:limit]
+
+
+# 요청을 처리하는 동안 미들웨어가 설정, 요청 밖(백그라운드 작업, 스크립트)에서는 None
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None)
+
+
+class QueryMonitor:
+    """엔진 실행 이벤트로 쿼리 수와 실행 시간을 수집하고, 요청 중이면 요청별 QueryStats에도 기록"""
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = Histogram(QUERY_BUCKETS)
+
+    def attach(self, engine) -> None:
+        sync_engine = getattr(engine, "sync_engine", engine)
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+            context._query_started = time.perf_counter()
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+            duration = time.perf_counter() - context._query_started
+            self.queries += 1
+            self.duration.observe(duration)
+            stats = current_query_stats.get()
+            if stats is not None:
+                stats.record(statement, duration)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"queries": self.queries, "duration": self.duration.get_attributes()}
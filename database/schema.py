@@ -0,0 +1,139 @@
+from sqlalchemy import Column, inspect, text, select, insert, exists, literal, union
+from database.connection import DBObject
+from sqlalchemy.engine import Connection
+from datetime import datetime
+from typing import Dict, List
+import importlib
+
+# 테이블을 정의한 모델 모듈, 새 모델을 추가하면 여기에도 등록
+MODEL_MODULES = (
+    "model.user",
+    "model.email_verification",
+    "model.friend",
+    "model.room",
+    "model.category",
+    "model.task",
+    "model.room_change",
+    "model.revoked_token",
+)
+
+
+def import_models():
+    """모든 모델을 Base.metadata에 등록하고 metadata를 반환"""
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+    from model.base import Base
+    return Base.metadata
+
+
+def inspect_schema() -> Dict[str, List[str]]:
+    """모델과 실제 DB를 비교해서 없는 테이블, 인덱스, 컬럼을 반환"""
+    metadata = import_models()
+    inspector = inspect(DBObject.get_instance().engine)
+    existing_tables = set(inspector.get_table_names())
+
+    missing: Dict[str, List[str]] = {"tables": [], "indexes": [], "columns": []}
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            missing["tables"].append(table.name)
+            continue
+
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        missing["indexes"] += [f"{table.name}.{index.name}" for index in table.indexes
+                               if index.name not in existing_indexes]
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        missing["columns"] += [f"{table.name}.{column.name}" for column in table.columns
+                               if column.name not in existing_columns]
+
+    return missing
+
+
+def add_column(connection: Connection, column: Column) -> bool:
+    """이미 있는 테이블에 컬럼을 추가, NOT NULL 컬럼은 기존 행을 info["backfill"]의 SQL 식으로 채운 뒤 NOT NULL로 바꿈
+    기존 행을 채울 값을 알 수 없는 NOT NULL 컬럼은 추가하지 않고 False를 반환"""
+    backfill = column.info.get("backfill")
+    if not column.nullable and backfill is None:
+        return False
+
+    dialect = connection.dialect
+    preparer = dialect.identifier_preparer
+    table = preparer.format_table(column.table)
+    name = preparer.format_column(column)
+    column_type = column.type.compile(dialect=dialect)
+
+    connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}"))
+    if backfill is not None:
+        connection.execute(text(f"UPDATE {table} SET {name} = {backfill} WHERE {name} IS NULL"))
+
+    if not column.nullable:
+        if dialect.name == "mysql":
+            connection.execute(text(f"ALTER TABLE {table} MODIFY COLUMN {name} {column_type} NOT NULL"))
+        elif dialect.name == "postgresql":
+            connection.execute(text(f"ALTER TABLE {table} ALTER COLUMN {name} SET NOT NULL"))
+        # SQLite는 컬럼 제약 조건을 바꿀 수 없으므로 NULL을 허용한 채로 남음 (값은 모델 기본값으로 항상 채워짐)
+
+    return True
+
+
+def create_schema() -> Dict[str, List[str]]:
+    """없는 테이블과, 이미 있는 테이블에 새로 추가된 컬럼과 인덱스를 생성
+    기존 행을 채울 값을 알 수 없는 NOT NULL 컬럼은 만들지 않고 missing["skipped_columns"]로 알려줌"""
+    metadata = import_models()
+    missing = inspect_schema()
+    missing["skipped_columns"] = []
+    engine = DBObject.get_instance().engine
+    metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        # 새 인덱스가 새 컬럼을 사용할 수 있으므로 컬럼을 먼저 추가
+        for table in metadata.sorted_tables:
+            for column in table.columns:
+                key = f"{table.name}.{column.name}"
+                if key in missing["columns"] and not add_column(connection, column):
+                    missing["columns"].remove(key)
+                    missing["skipped_columns"].append(key)
+
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                if f"{table.name}.{index.name}" in missing["indexes"]:
+                    index.create(bind=connection)
+
+    return missing
+
+
+def backfill_room_changes() -> int:
+    """room_change 테이블보다 먼저 만들어진 카테고리와 할 일에 생성 기록을 추가하고 추가한 수를 반환
+    커서 없이 처음 동기화하는 클라이언트도 이 항목들을 받고, 이미 동기화한 클라이언트는 다음 변경분으로 받음
+    기록이 없는 항목이 있는 방만 앱과 같은 순서(방 행 잠금)로 처리하므로 다시 실행하면 아무것도 하지 않음"""
+    import_models()
+    from model.room_change import RoomChange, ChangeOperation
+    from model.category import Category
+    from model.room import Room
+    from model.task import Task
+
+    entities = (("category", Category, Category.category_uuid), ("task", Task, Task.task_uuid))
+
+    def unrecorded(entity: str, key):
+        return ~exists().where(RoomChange.entity == entity, RoomChange.entity_uuid == key)
+
+    engine = DBObject.get_instance().engine
+    with engine.connect() as connection:
+        room_uuids = connection.execute(union(*[
+            select(model.room_uuid).filter(unrecorded(entity, key))
+            for entity, model, key in entities
+        ])).scalars().all()
+
+    added = 0
+    operation = literal(ChangeOperation.upsert, RoomChange.__table__.c.operation.type)
+    for room_uuid in room_uuids:
+        with engine.begin() as connection:
+            connection.execute(select(Room.room_uuid).filter(Room.room_uuid == room_uuid).with_for_update())
+            for entity, model, key in entities:
+                result = connection.execute(insert(RoomChange).from_select(
+                    ["room_uuid", "entity", "entity_uuid", "operation", "changed_at"],
+                    select(model.room_uuid, literal(entity), key, operation, literal(datetime.now()))
+                    .filter(model.room_uuid == room_uuid, unrecorded(entity, key))))
+                added += result.rowcount
+
+    return added
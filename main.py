@@ -1,21 +1,72 @@
+from service.rate_limiter import RateLimiter, RateLimitExceededError
+from repository.verification_repository import VerificationStore
+from controller.room_sync_controller import room_sync_controller
+from repository.room_change_repository import RoomChangePruner
+from controller.internal_controller import internal_controller
 from model.response import ResponseModel, ResponseStatusCode
+from controller.metrics_controller import metrics_controller
+from controller.friend_controller import friend_controller
+from util.request_metrics import RequestMetricsMiddleware
 from controller.user_controller import user_controller
+from controller.task_controller import task_controller
+from controller.room_controller import room_controller
 from fastapi.exceptions import RequestValidationError
+from repository.revocation_list import RevocationList
 from starlette.middleware.cors import CORSMiddleware
+from service.password_hasher import PasswordHasher
+from util.structured_log import StructuredLogging
+from service.avatar_storage import AvatarStorage
+from util.server_settings import ServerSettings
+from service.token_service import TokenService
+from service.email_outbox import EmailOutbox
+from service.room_broker import RoomBroker
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from dotenv import load_dotenv
+import logging
 import uvicorn
-import os
 
 load_dotenv()
-app = FastAPI()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    StructuredLogging.get_instance().start()
+    TokenService.get_instance()
+    await RevocationList.get_instance().start()
+    EmailOutbox.get_instance().start()
+    VerificationStore.get_instance().start_sweeper()
+    RateLimiter.get_instance().start_sweeper()
+    RoomChangePruner.get_instance().start_sweeper()
+    yield
+    RoomBroker.get_instance().close()
+    VerificationStore.get_instance().stop_sweeper()
+    RateLimiter.get_instance().stop_sweeper()
+    RoomChangePruner.get_instance().stop_sweeper()
+    RevocationList.get_instance().stop()
+    await EmailOutbox.get_instance().stop()
+    PasswordHasher.get_instance().shutdown()
+    AvatarStorage.get_instance().shutdown()
+    StructuredLogging.get_instance().stop()
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.exception_handler(Exception)
 async def exception_handler(request: Request, exc: Exception):
     return ResponseModel.show_json(status_code=ResponseStatusCode.INTERNAL_SERVER_ERROR, message="서버 내부에서 오류가 발생하였습니다.", detail=str(exc))
 
+@app.exception_handler(RateLimitExceededError)
+async def rate_limit_exception_handler(request: Request, exc: RateLimitExceededError):
+    return ResponseModel.show_json(status_code=ResponseStatusCode.TOO_MANY_REQUESTS, headers={"Retry-After": str(exc.retry_after)}, message="요청 한도를 초과하였습니다.", detail=str(exc))
+
 app.include_router(user_controller)
+app.include_router(room_controller)
+app.include_router(task_controller)
+app.include_router(friend_controller)
+app.include_router(room_sync_controller)
+app.include_router(internal_controller)
+app.include_router(metrics_controller)
 
 
 @app.exception_handler(RequestValidationError)
@@ -30,11 +81,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# 마지막에 추가한 미들웨어가 가장 바깥에서 실행되므로 CORS 처리 시간까지 포함해서 측정
+app.add_middleware(RequestMetricsMiddleware)
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host="localhost",
-        port=8000 if os.path.exists("./is-server") else 3000,
-        reload=not os.path.exists("./is-server"),
-    )
+    options = ServerSettings.from_env()
+    for warning in ServerSettings.warnings(options):
+        logging.warning(warning)
+
+    uvicorn.run("main:app", **options)
@@ -0,0 +1,70 @@
+"""TDLS 관리 명령
+
+    python manage.py init-db [--check]
+    python manage.py import-users users.json
+
+users.json은 [{"user_id": ..., "password": ..., "nickname": ..., "email": ...}, ...] 형식
+"""
+from dotenv import load_dotenv
+import argparse
+import asyncio
+import json
+
+load_dotenv()
+
+
+def import_users(path: str) -> None:
+    from service.user_service import UserService
+    from model.user import CreateUserModel
+
+    with open(path, encoding="utf-8") as file:
+        users = [CreateUserModel(**user) for user in json.load(file)]
+
+    status_code, result = asyncio.run(UserService.signup_batch(users))
+    print(json.dumps({
+        "status_code": status_code.value,
+        "result": result if isinstance(result, list) else result.text,
+    }, ensure_ascii=False, indent=2))
+
+
+def init_db(check: bool) -> None:
+    """배포 전에 한 번 실행해서 테이블, 컬럼, 인덱스를 생성 (앱은 시작할 때 스키마를 만들지 않음)"""
+    from database import schema
+
+    missing = schema.inspect_schema() if check else schema.create_schema()
+    skipped = missing.pop("skipped_columns", [])
+    print(json.dumps({"created" if not check else "missing": missing}, ensure_ascii=False, indent=2))
+
+    if not check:
+        print(json.dumps({"room_changes_backfilled": schema.backfill_room_changes()}))
+
+    if skipped:
+        print(f"다음 컬럼은 기존 행을 채울 값을 알 수 없어 추가하지 않았습니다. 직접 마이그레이션하세요: {', '.join(skipped)}")
+
+    if check and any(missing.values()):
+        raise SystemExit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TDLS 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    init_parser = subparsers.add_parser(
+        "init-db", help="없는 테이블, 컬럼, 인덱스를 생성")
+    init_parser.add_argument(
+        "--check", action="store_true", help="생성하지 않고 없는 항목만 출력 (있으면 종료 코드 1)")
+
+    import_parser = subparsers.add_parser(
+        "import-users", help="JSON 파일의 계정들을 한 트랜잭션으로 생성")
+    import_parser.add_argument("path")
+
+    args = parser.parse_args()
+    if args.command == "init-db":
+        init_db(args.check)
+
+    elif args.command == "import-users":
+        import_users(args.path)
+
+
+if __name__ == "__main__":
+    main()
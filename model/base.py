@@ -1,9 +1,7 @@
 from sqlalchemy.ext.declarative import declarative_base
-from database.connection import DBObject
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# 테이블 생성은 import 시점이 아니라 `python manage.py init-db`에서 수행
 Base = declarative_base()
-
-Base.metadata.create_all(bind=DBObject.get_instance().engine)
@@ -1,12 +1,20 @@
 from sqlalchemy import String, ForeignKeyConstraint, Enum as SQLEnum
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from model.serializer import ModelSerializer, format_datetime
+from typing import Dict, Any, List
+from pydantic import BaseModel
 from datetime import datetime
-from typing import Dict, Any
 from model.base import Base
 from enum import Enum
 import uuid
 
 
+CATEGORY_SERIALIZER = ModelSerializer(
+    ["category_uuid", "category_name", "owner_uuid", "created_at"],
+    {"created_at": format_datetime},
+)
+
+
 class Category(Base):
     __tablename__ = "Category"
 
@@ -19,10 +27,16 @@ class Category(Base):
         default=lambda: datetime.now())
     room_uuid: Mapped[str] = mapped_column(String(36), nullable=False)
 
+    room: Mapped["Room"] = relationship(
+        back_populates="categories", lazy="raise")
+    tasks: Mapped[List["Task"]] = relationship(
+        back_populates="category", lazy="raise",
+        order_by="(Task.end_at, Task.created_at, Task.task_uuid)")
+
     __table_args__ = (
         ForeignKeyConstraint(
             ["owner_uuid"],
-            ["User.user_uuid"],
+            ["user.user_uuid"],
         ),
         ForeignKeyConstraint(
             ["room_uuid"],
@@ -43,9 +57,16 @@ class Category(Base):
         self.created_at = created_at if created_at else datetime.now()
 
     def get_attributes(self) -> Dict[str, Any]:
+        return CATEGORY_SERIALIZER(self)
+
+    def get_dashboard_attributes(self) -> Dict[str, Any]:
+        """tasks가 미리 로드되어 있어야 함"""
         return {
-            "category_uuid": self.category_uuid,
-            "category_name": self.category_name,
-            "owner_uuid": self.owner_uuid,
-            "created_at": self.created_at.strftime("%Y/%m/%d %H:%M:%S"),
+            **self.get_attributes(),
+            "task_count": len(self.tasks),
+            "tasks": [task.get_attributes() for task in self.tasks],
         }
+
+
+class CreateCategoryModel(BaseModel):
+    category_name: str
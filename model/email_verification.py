@@ -0,0 +1,26 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Index
+from datetime import datetime
+from model.base import Base
+
+
+class EmailVerification(Base):
+    __tablename__ = "email_verification"
+
+    email: Mapped[str] = mapped_column(String(50), primary_key=True)
+    verify_code: Mapped[str] = mapped_column(String(6), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now())
+    expires_at: Mapped[datetime] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(default=0)
+
+    __table_args__ = (
+        Index("ix_email_verification_expires_at", "expires_at"),
+    )
+
+    def __init__(self, email: str, verify_code: str, expires_at: datetime, created_at: datetime | None = None):
+        self.email = email
+        self.verify_code = verify_code
+        self.expires_at = expires_at
+        self.created_at = created_at if created_at else datetime.now()
+        self.attempts = 0
@@ -1,4 +1,5 @@
-from sqlalchemy import String, ForeignKeyConstraint, Enum as SQLEnum
+from sqlalchemy import String, ForeignKeyConstraint, Index, Enum as SQLEnum
+from model.serializer import ModelSerializer, format_datetime
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from typing import Dict, Any
@@ -39,6 +40,12 @@ class Friend(Base):
             ["receive_user_uuid"],
             ["user.user_uuid"],
         ),
+        # PK(transmit, receive)로는 받은 쪽 조회를 할 수 없으므로 반대 방향 인덱스를 추가하고,
+        # 양쪽 모두 status를 두 번째 키로 두어서 "수락된 친구"/"받은 요청" 목록을 상대 uuid 순서로 범위 검색
+        Index("ix_friend_receive_status", "receive_user_uuid",
+              "status", "transmit_user_uuid"),
+        Index("ix_friend_transmit_status", "transmit_user_uuid",
+              "status", "receive_user_uuid"),
     )
 
     def __init__(
@@ -54,12 +61,7 @@ class Friend(Base):
         self.created_at = created_at if created_at else datetime.now()
 
     def get_attributes(self) -> Dict[str, Any]:
-        return {
-            "transmit_user_uuid": self.transmit_user_uuid,
-            "receive_user_uuid": self.receive_user_uuid,
-            "status": Friend.convert_status_korean(self.status),
-            "created_at": self.created_at.strftime("%Y/%m/%d %H:%M:%S"),
-        }
+        return FRIEND_SERIALIZER(self)
 
     @staticmethod
     def convert_status_korean(status: FriendStatus):
@@ -68,4 +70,16 @@ class Friend(Base):
             FriendStatus.accepted: "수락 됨",
             FriendStatus.rejected: "거절 됨",
             FriendStatus.block: "차단 됨",
+            FriendStatus.canceled: "취소 됨",
         }[status]
+
+
+FRIEND_SERIALIZER = ModelSerializer(
+    ["transmit_user_uuid", "receive_user_uuid", "status", "created_at"],
+    {"status": Friend.convert_status_korean, "created_at": format_datetime},
+)
+
+
+FRIEND_PROFILE_SERIALIZER = ModelSerializer(
+    ["user_uuid", "user_id", "nickname", "avatar_path"],
+)
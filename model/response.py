@@ -1,20 +1,30 @@
-from fastapi.responses import JSONResponse, FileResponse
-from datetime import datetime, timedelta
+from fastapi.responses import JSONResponse, FileResponse, Response
+from typing import Any, Dict, List
 from enum import Enum
-import jwt
-import os
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 동작
+    orjson = None
 
 
 class ResponseStatusCode(Enum):
     SUCCESS = 200  # 성공
     CREATED = 201  # 생성됨
+    NOT_MODIFIED = 304  # 클라이언트가 가진 내용과 같음
     FAIL = 401  # 실패
     FORBIDDEN = 403  # 접근 권한 없음
     NOT_FOUND = 404  # 경로 또는 자료를 찾을 수 없음
     TIME_OUT = 408  # 세션 만료됨
     CONFLICT = 409  # 데이터 충돌
+    GONE = 410  # 더 이상 제공하지 않는 자료 (처음부터 다시 받아야 함)
+    PAYLOAD_TOO_LARGE = 413  # 요청 본문이 너무 큼
+    UNSUPPORTED_MEDIA_TYPE = 415  # 지원하지 않는 형식
     ENTITY_ERROR = 422  # 입력 데이터 타입이 잘못됨
+    TOO_MANY_REQUESTS = 429  # 요청 한도 초과
     INTERNAL_SERVER_ERROR = 500  # 서버 내부 에러
+    SERVICE_UNAVAILABLE = 503  # 서버가 요청을 처리할 여유가 없음
 
 
 class Detail:
@@ -24,18 +34,63 @@ class Detail:
         self.text = text
 
 
+class Page:
+    """키셋(커서) 페이지네이션 결과, next_cursor가 None이면 마지막 페이지"""
+    items: List[Any]
+    next_cursor: str | None
+
+    def __init__(self, items: List[Any], next_cursor: str | None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def serialize_default(value: Any) -> Any:
+    """JSON으로 바로 변환되지 않는 값 처리: ORM 행은 get_attributes(), Enum은 value, 나머지는 str"""
+    get_attributes = getattr(value, "get_attributes", None)
+    if get_attributes is not None:
+        return get_attributes()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+
+    return str(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 응답, ORM 행(리스트)을 그대로 넘겨도 get_attributes()로 변환"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, default=serialize_default, option=orjson.OPT_NON_STR_KEYS)
+
+        return json.dumps(
+            content, default=serialize_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
 class ResponseModel:
     status_code: int
 
     @staticmethod
-    def show_json(status_code: ResponseStatusCode, **kwargs):
+    def show_json(status_code: ResponseStatusCode, headers: Dict[str, str] | None = None, **kwargs):
         show_dict = {"status_code": status_code.value}
-        for key in kwargs.keys():
-            if kwargs[key] != None:
-                show_dict[key] = kwargs[key]
+        show_dict.update(
+            {key: value for key, value in kwargs.items() if value is not None})
 
-        return JSONResponse(show_dict, status_code=status_code.value)
+        return FastJSONResponse(show_dict, status_code=status_code.value, headers=headers)
+
+    @staticmethod
+    def show_image(image_path: str, media_type: str = "image/png", headers: Dict[str, str] | None = None):
+        return FileResponse(path=image_path, media_type=media_type, headers=headers)
+
+    @staticmethod
+    def show_text(content: str, media_type: str = "text/plain; charset=utf-8"):
+        return Response(content=content, media_type=media_type)
 
     @staticmethod
-    def show_image(image_path: str):
-        return FileResponse(path=image_path, media_type="image/png")
+    def show_not_modified(headers: Dict[str, str] | None = None):
+        """본문 없이 304를 반환 (캐시 관련 헤더는 200 응답과 같게 보내야 함)"""
+        return Response(status_code=ResponseStatusCode.NOT_MODIFIED.value, headers=headers)
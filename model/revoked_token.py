@@ -0,0 +1,41 @@
+from sqlalchemy import String, BigInteger, Integer, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects import mysql
+from datetime import datetime
+from model.base import Base
+
+
+class RevokedToken(Base):
+    """폐기된 토큰 기록
+    jti가 있으면 그 토큰 하나를, 없으면 revoked_at 이전에 발급된 user_uuid의 모든 토큰을 폐기
+    consumed는 refresh 토큰을 재발급에 사용해서 생긴 기록인지 여부 (로그아웃으로 폐기한 토큰과 구분)
+    expires_at(폐기한 토큰이 어차피 만료되는 시각)이 지나면 지워도 됨"""
+    __tablename__ = "revoked_token"
+
+    # SQLite는 INTEGER PRIMARY KEY에서만 자동 증가하므로 타입을 바꿔서 사용
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    user_uuid: Mapped[str] = mapped_column(String(36), nullable=False)
+    jti: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    # 같은 초에 폐기 전후로 발급된 토큰을 구분할 수 있도록 MySQL에서도 마이크로초까지 저장
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False)
+    consumed: Mapped[bool] = mapped_column(
+        default=False, nullable=False, info={"backfill": "FALSE"})
+
+    __table_args__ = (
+        # 워커마다 마지막으로 읽은 시각 이후의 기록만 범위 검색
+        Index("ix_revoked_token_revoked_at", "revoked_at"),
+        Index("ix_revoked_token_expires_at", "expires_at"),
+        # 토큰 하나는 한 번만 폐기되므로, 여러 워커가 같은 refresh 토큰을 동시에 사용하면 하나만 기록됨
+        # (jti가 NULL인 유저 단위 기록은 MySQL과 SQLite 모두 유니크 검사에서 제외)
+        Index("ux_revoked_token_jti", "jti", unique=True),
+    )
+
+    def __init__(self, user_uuid: str, jti: str | None, revoked_at: datetime, expires_at: datetime, consumed: bool = False):
+        self.user_uuid = user_uuid
+        self.jti = jti
+        self.revoked_at = revoked_at
+        self.expires_at = expires_at
+        self.consumed = consumed
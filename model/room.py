@@ -1,12 +1,20 @@
-from sqlalchemy import String, ForeignKeyConstraint, Enum as SQLEnum
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, BigInteger, ForeignKeyConstraint, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from model.serializer import ModelSerializer, format_datetime
+from typing import Dict, Any, List
+from pydantic import BaseModel
 from datetime import datetime
-from typing import Dict, Any
 from model.base import Base
 from enum import Enum
 import uuid
 
 
+ROOM_SERIALIZER = ModelSerializer(
+    ["room_uuid", "room_name", "created_at"],
+    {"created_at": format_datetime},
+)
+
+
 class Room(Base):
     __tablename__ = "Room"
 
@@ -16,16 +24,26 @@ class Room(Base):
     room_name: Mapped[str] = mapped_column(String(30), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now())
+    # 정리한 삭제 기록(툼스톤) 중 가장 큰 room_change seq, 이보다 오래된 동기화 커서는 삭제를 놓쳤을 수 있음
+    pruned_change_seq: Mapped[int] = mapped_column(
+        BigInteger, default=0, info={"backfill": "0"})
+
+    # 지연 로딩을 막아서 카테고리마다 쿼리가 나가는 N+1을 에러로 드러냄 (selectinload로 명시해서 사용)
+    categories: Mapped[List["Category"]] = relationship(
+        back_populates="room", lazy="raise", order_by="Category.created_at")
 
     def __init__(self, room_name: str, created_at: datetime | None = None):
         self.room_name = room_name
         self.created_at = created_at if created_at else datetime.now()
 
     def get_attributes(self) -> Dict[str, Any]:
+        return ROOM_SERIALIZER(self)
+
+    def get_dashboard_attributes(self) -> Dict[str, Any]:
+        """categories와 각 카테고리의 tasks가 미리 로드되어 있어야 함"""
         return {
-            "room_uuid": self.room_uuid,
-            "room_name": self.room_name,
-            "created_at": self.created_at.strftime("%Y/%m/%d %H:%M:%S"),
+            **self.get_attributes(),
+            "categories": [category.get_dashboard_attributes() for category in self.categories],
         }
 
 
@@ -50,3 +68,7 @@ class RoomEntry(Base):
     status: Mapped[RoomEntryStatus] = mapped_column(
         SQLEnum(RoomEntryStatus), default=RoomEntryStatus.pending
     )
+
+
+class CreateRoomModel(BaseModel):
+    room_name: str
@@ -0,0 +1,65 @@
+from sqlalchemy import String, BigInteger, Integer, Index, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Any, List
+from model.base import Base
+from enum import Enum
+
+
+class ChangeOperation(Enum):
+    upsert = 0  # 생성 또는 수정
+    delete = 1  # 삭제 (툼스톤)
+
+
+class RoomChange(Base):
+    """방 안의 할 일/카테고리 변경 기록
+    항목마다 가장 최근 변경 한 건만 남기므로(이전 기록은 삭제) 살아 있는 항목의 기록은 항목 수를 넘지 않음
+    삭제 기록(툼스톤)은 항목이 없어진 뒤에도 남으므로 RoomChangePruner가 ROOM_CHANGE_TOMBSTONE_TTL이 지나면 지우고,
+    지운 가장 큰 seq를 Room.pruned_change_seq에 남겨서 그보다 오래된 커서는 전체를 다시 받도록 함"""
+    __tablename__ = "room_change"
+
+    # SQLite는 INTEGER PRIMARY KEY에서만 자동 증가하므로 타입을 바꿔서 사용
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    room_uuid: Mapped[str] = mapped_column(String(36), nullable=False)
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_uuid: Mapped[str] = mapped_column(String(36), nullable=False)
+    operation: Mapped[ChangeOperation] = mapped_column(
+        SQLEnum(ChangeOperation), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now())
+
+    __table_args__ = (
+        # 방별로 커서(seq) 이후의 변경만 범위 검색
+        Index("ix_room_change_room_seq", "room_uuid", "seq"),
+        Index("ix_room_change_entity", "entity",
+              "entity_uuid", unique=True),
+        # 가장 큰 seq를 지우고 다시 기록할 때 SQLite가 같은 rowid를 재사용하지 않도록 함
+        # (재사용되면 커서와 ETag 버전이 바뀌지 않아 변경을 놓침)
+        {"sqlite_autoincrement": True},
+    )
+
+    def __init__(self, room_uuid: str, entity: str, entity_uuid: str, operation: ChangeOperation):
+        self.room_uuid = room_uuid
+        self.entity = entity
+        self.entity_uuid = entity_uuid
+        self.operation = operation
+        self.changed_at = datetime.now()
+
+
+class ChangeSet:
+    """커서 이후의 변경 사항 (생성/수정된 행과 삭제된 uuid), next_cursor부터 이어서 조회"""
+    tasks: List[Any]
+    categories: List[Any]
+    deleted_tasks: List[str]
+    deleted_categories: List[str]
+    next_cursor: str
+    has_more: bool
+
+    def __init__(self, tasks: List[Any], categories: List[Any], deleted_tasks: List[str], deleted_categories: List[str], next_cursor: str, has_more: bool):
+        self.tasks = tasks
+        self.categories = categories
+        self.deleted_tasks = deleted_tasks
+        self.deleted_categories = deleted_categories
+        self.next_cursor = next_cursor
+        self.has_more = has_more
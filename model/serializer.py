@@ -0,0 +1,53 @@
+from typing import Any, Callable, Dict, Iterable, List
+from datetime import datetime
+
+
+def format_datetime(value: datetime | None) -> str | None:
+    """strftime("%Y/%m/%d %H:%M:%S")와 같은 결과를 C로 구현된 isoformat으로 생성"""
+    if value is None:
+        return None
+
+    if value.tzinfo is not None:
+        return value.strftime("%Y/%m/%d %H:%M:%S")
+
+    return value.isoformat(" ", "seconds").replace("-", "/")
+
+
+class ModelSerializer:
+    """모델별 get_attributes()를 한 번만 컴파일해서 행마다 getattr/분기 없이 dict를 생성"""
+
+    def __init__(self, fields: Iterable[str], converters: Dict[str, Callable[[Any], Any]] | None = None):
+        self.fields = tuple(fields)
+        self.converters = converters or {}
+
+        namespace: Dict[str, Any] = {}
+        fast_items = []
+        slow_items = []
+        for field in self.fields:
+            if field in self.converters:
+                namespace[f"_convert_{field}"] = self.converters[field]
+                fast_items.append(f"{field!r}: _convert_{field}(state[{field!r}])")
+                slow_items.append(f"{field!r}: _convert_{field}(row.{field})")
+            else:
+                fast_items.append(f"{field!r}: state[{field!r}]")
+                slow_items.append(f"{field!r}: row.{field}")
+
+        # 로드된 ORM 객체는 컬럼 값이 __dict__에 있으므로 descriptor를 거치지 않고 바로 읽고,
+        # 만료(expired)되었거나 지연 로딩되는 컬럼이 있으면 일반 속성 접근으로 대체
+        source = (
+            "def serialize(row):\n"
+            "    state = row.__dict__\n"
+            "    try:\n"
+            f"        return {{{', '.join(fast_items)}}}\n"
+            "    except KeyError:\n"
+            f"        return {{{', '.join(slow_items)}}}\n"
+        )
+        exec(compile(source, f"<serializer {', '.join(self.fields)}>", "exec"), namespace)
+        self.serialize: Callable[[Any], Dict[str, Any]] = namespace["serialize"]
+
+    def __call__(self, row: Any) -> Dict[str, Any]:
+        return self.serialize(row)
+
+    def many(self, rows: Iterable[Any]) -> List[Dict[str, Any]]:
+        serialize = self.serialize
+        return [serialize(row) for row in rows]
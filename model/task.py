@@ -1,12 +1,27 @@
-from sqlalchemy import String, ForeignKeyConstraint, Enum as SQLEnum
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, ForeignKeyConstraint, Index, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from model.serializer import ModelSerializer, format_datetime
+from typing import Dict, Any, List, Literal, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Dict, Any
 from model.base import Base
 from enum import Enum
 import uuid
 
 
+TASK_SERIALIZER = ModelSerializer(
+    [
+        "task_uuid", "title", "content", "category_uuid", "user_uuid",
+        "room_uuid", "created_at", "updated_at", "end_at",
+    ],
+    {
+        "created_at": format_datetime,
+        "updated_at": format_datetime,
+        "end_at": format_datetime,
+    },
+)
+
+
 class Task(Base):
     __tablename__ = "Task"
 
@@ -24,6 +39,9 @@ class Task(Base):
         default=lambda: datetime.now())
     end_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now())
 
+    category: Mapped["Category"] = relationship(
+        back_populates="tasks", lazy="raise")
+
     __table_args__ = (
         ForeignKeyConstraint(
             ["category_uuid"],
@@ -31,12 +49,18 @@ class Task(Base):
         ),
         ForeignKeyConstraint(
             ["user_uuid"],
-            ["User.user_uuid"],
+            ["user.user_uuid"],
         ),
         ForeignKeyConstraint(
             ["room_uuid"],
             ["Room.room_uuid"],
         ),
+        # 방/카테고리별 목록을 end_at, created_at 순서로 키셋 페이지네이션할 때 사용하는 인덱스
+        # (InnoDB 보조 인덱스에는 PK인 task_uuid가 함께 저장되지만 정렬 키로 쓰기 위해 명시)
+        Index("ix_task_room_end_at", "room_uuid",
+              "end_at", "created_at", "task_uuid"),
+        Index("ix_task_category_end_at", "category_uuid",
+              "end_at", "created_at", "task_uuid"),
     )
 
     def __init__(
@@ -60,14 +84,32 @@ class Task(Base):
         self.end_at = end_at if end_at else datetime.now()
 
     def get_attributes(self) -> Dict[str, Any]:
-        return {
-            "task_uuid": self.task_uuid,
-            "title": self.title,
-            "content": self.content,
-            "category_uuid": self.category_uuid,
-            "user_uuid": self.user_uuid,
-            "room_uuid": self.room_uuid,
-            "created_at": self.created_at.strftime("%Y/%m/%d %H:%M:%S"),
-            "updated_at": self.updated_at.strftime("%Y/%m/%d %H:%M:%S"),
-            "end_at": self.end_at.strftime("%Y/%m/%d %H:%M:%S"),
-        }
+        return TASK_SERIALIZER(self)
+
+
+class CreateTaskModel(BaseModel):
+    title: str
+    content: str
+    category_uuid: str
+    end_at: Optional[datetime] = None
+
+
+class UpdateTaskModel(BaseModel):
+    title: Optional[str] = None
+    content: Optional[str] = None
+    category_uuid: Optional[str] = None
+    end_at: Optional[datetime] = None
+
+
+class BatchTaskOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    task_uuid: Optional[str] = None  # update, delete
+    title: Optional[str] = None
+    content: Optional[str] = None
+    category_uuid: Optional[str] = None
+    end_at: Optional[datetime] = None
+
+
+class BatchTaskModel(BaseModel):
+    operations: List[BatchTaskOperation] = Field(min_length=1, max_length=1000)
+    atomic: bool = False  # True면 하나라도 실패할 때 아무것도 반영하지 않음
@@ -1,13 +1,18 @@
+from model.serializer import ModelSerializer, format_datetime
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Dict, Any, Optional
+from pydantic import BaseModel, Field
 from sqlalchemy import String, TEXT
-from pydantic import BaseModel
 from datetime import datetime
 from model.base import Base
 from enum import Enum
 import uuid
-import jwt
-import os
+
+
+USER_SERIALIZER = ModelSerializer(
+    ["user_uuid", "user_id", "nickname", "email", "created_at", "avatar_path"],
+    {"created_at": format_datetime},
+)
 
 
 class User(Base):
@@ -25,6 +30,10 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now())
     avatar_path: Mapped[str | None] = mapped_column(TEXT, default=None)
+    # 프로필 ETag 버전, 정보가 바뀔 때마다 갱신
+    # 이미 있는 user 테이블에 init-db로 추가할 때 기존 유저는 created_at으로 채움
+    updated_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(), onupdate=lambda: datetime.now(), info={"backfill": "created_at"})
 
     def __init__(
         self,
@@ -41,42 +50,21 @@ class User(Base):
         self.nickname = nickname
         self.email = email
         self.created_at = created_at
+        self.updated_at = created_at
         self.avatar_path = None
 
     def get_attributes(self) -> Dict[str, Any]:
-        return {
-            "user_uuid": self.user_uuid,
-            "user_id": self.user_id,
-            "nickname": self.nickname,
-            "email": self.email,
-            "created_at": self.created_at.strftime("%Y/%m/%d %H:%M:%S"),
-            "avatar_path": self.avatar_path,
-        }
+        return USER_SERIALIZER(self)
 
 
-class TokenModel:
+class TokenModel(BaseModel):
+    """발급한 토큰 (인코딩/디코딩은 AuthService와 TokenService가 담당)"""
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
 
-    def __init__(self, access_token: str, token_type: str):
-        self.access_token = access_token
-        self.token_type = token_type
-
-    @staticmethod
-    def decode_token(access_token: str) -> str:
-        acem = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
-        sk = os.getenv("SECRET_KEY")
-        al = os.getenv("ALGORITHM")
-
-        if acem and sk and al:
-            payload = jwt.decode(access_token, sk, algorithms=[al])
-            user_uuid = payload.get("sub")
-            return user_uuid
-
-        else:
-            raise FileNotFoundError(
-                ".env파일에서 ACCESS_TOKEN_EXPIRE_MINUTES과 SECRET_KEY 환경 변수를 찾을 수 없습니다!"
-            )
+    def get_attributes(self) -> Dict[str, Any]:
+        return self.model_dump()
 
 
 class CreateUserModel(BaseModel):
@@ -100,14 +88,25 @@ class SignoutModel(BaseModel):
     password: str
 
 
+class RefreshTokenModel(BaseModel):
+    refresh_token: str
+
+
+class LogoutModel(BaseModel):
+    refresh_token: Optional[str] = None
+
+
 class UpdateUserModel(BaseModel):
     password: Optional[str] = None
     nickname: Optional[str] = None
     email: Optional[str] = None
-    avatar_path: Optional[str] = None
+    # 더 이상 사용하지 않음, 아바타는 PUT /user/avatar로만 변경 (값을 보내면 422로 거절)
+    # deprecated=True는 필드를 읽을 때마다 경고를 내므로 스키마에만 표시
+    avatar_path: Optional[str] = Field(default=None, json_schema_extra={"deprecated": True})
 
 
 class VerifyErrorCode(Enum):
     SUCCESS = 1  # 인증 성공
     WRONG_VERIFY_CODE = 2  # 인증 코드가 잘못됨
     TIMEOUT = 3  # 타임 아웃
+    TOO_MANY_ATTEMPTS = 4  # 시도 횟수 초과
@@ -0,0 +1,15 @@
+from repository.room_change_repository import RoomChangeRepository
+from model.room_change import ChangeOperation
+from util.structured_log import log_event
+from database.connection import DBObject
+from model.category import Category
+
+
+class CategoryRepository:
+    @staticmethod
+    async def create_category(category: Category) -> None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            session.add(category)
+            await session.flush()
+            await RoomChangeRepository.record(session, category.room_uuid, "category", category.category_uuid, ChangeOperation.upsert)
+            log_event("category.created", category_uuid=category.category_uuid)
@@ -0,0 +1,64 @@
+from typing import Any, Callable, Dict, FrozenSet, Iterable
+from repository.friend_repository import FriendRepository
+from util.ttl_cache import TTLCache
+import os
+
+
+class FriendGraphCache(object):
+    """유저별 수락된 친구 uuid 집합(인접 리스트)을 크기 제한이 있는 TTL 캐시에 보관
+    친구 추천처럼 여러 유저의 친구 목록을 반복해서 읽는 작업이 DB를 매번 조회하지 않도록 함"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use FriendGraphCache.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """FriendGraphCache의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.cache = TTLCache(
+                max_size=int(os.getenv("FRIEND_GRAPH_CACHE_SIZE", "100000")),
+                ttl=float(os.getenv("FRIEND_GRAPH_CACHE_TTL", "300")),
+            )
+            cls._instance._invalidation_hooks = []
+
+        return cls._instance
+
+    async def neighbors(self, user_uuid: str) -> FrozenSet[str]:
+        return (await self.neighbors_many([user_uuid]))[user_uuid]
+
+    async def neighbors_many(self, user_uuids: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+        """캐시에 없는 유저들만 모아서 한 번에 조회"""
+        result: Dict[str, FrozenSet[str]] = {}
+        missing = []
+        for user_uuid in user_uuids:
+            friends = self.cache.get(user_uuid)
+            if friends is None:
+                missing.append(user_uuid)
+            else:
+                result[user_uuid] = friends
+
+        if missing:
+            for user_uuid, friends in (await FriendRepository.find_friend_uuids(missing)).items():
+                friends = frozenset(friends)
+                self.cache.set(user_uuid, friends)
+                result[user_uuid] = friends
+
+        return result
+
+    def add_invalidation_hook(self, hook: Callable[[str], Any]) -> None:
+        """다른 워커의 캐시도 무효화할 수 있도록 무효화 시점에 호출할 함수를 등록"""
+        self._invalidation_hooks.append(hook)
+
+    def invalidate(self, *user_uuids: str, broadcast: bool = True) -> None:
+        """관계 상태가 바뀐 양쪽 유저의 항목을 제거"""
+        for user_uuid in user_uuids:
+            self.cache.pop(user_uuid)
+            if broadcast:
+                for hook in self._invalidation_hooks:
+                    hook(user_uuid)
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
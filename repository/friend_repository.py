@@ -0,0 +1,157 @@
+from typing import AsyncIterator, Dict, Iterable, List, Set, Tuple
+from sqlalchemy import select, update, union_all, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from model.friend import Friend, FriendStatus
+from contextlib import asynccontextmanager
+from database.connection import DBObject
+from util.cursor import encode_cursor
+from datetime import datetime
+from model.user import User
+
+# IN 절 하나에 넣을 uuid 수 (MySQL 패킷/SQLite 변수 제한을 넘지 않도록 나눠서 조회)
+IN_CHUNK_SIZE = 500
+
+
+class FriendRepository:
+    @staticmethod
+    @asynccontextmanager
+    async def lock_pair(user_uuid: str, other_uuid: str) -> AsyncIterator[AsyncSession]:
+        """두 유저 사이의 관계를 읽고 바꾸는 트랜잭션, 블록이 끝나면 커밋
+        두 유저 행을 uuid 순서로 잠가서 같은 쌍에 대한 요청(A -> B와 B -> A 포함)이 교착 없이 차례로 실행되도록 함
+        SQLite는 FOR UPDATE를 무시하므로 값을 바꾸지 않는 UPDATE로 쓰기 잠금을 먼저 잡음"""
+        pair = sorted((user_uuid, other_uuid))
+        async with DBObject.get_instance().async_session_scope() as session:
+            if session.bind.dialect.name == "sqlite":
+                # updated_at을 직접 지정해야 onupdate로 프로필 ETag가 바뀌지 않음
+                await session.execute(update(User).filter(User.user_uuid.in_(pair)).values(
+                    updated_at=User.updated_at).execution_options(synchronize_session=False))
+            else:
+                await session.execute(
+                    select(User.user_uuid).filter(User.user_uuid.in_(pair)).order_by(User.user_uuid).with_for_update())
+
+            yield session
+
+    @staticmethod
+    async def find_relations(session: AsyncSession, user_uuid: str, other_uuid: str) -> List[Friend]:
+        """두 유저 사이의 관계를 방향과 관계없이 모두 조회 (PK와 반대 방향 인덱스를 각각 사용)"""
+        result = await session.execute(
+            select(Friend).filter(or_(
+                and_(Friend.transmit_user_uuid == user_uuid,
+                     Friend.receive_user_uuid == other_uuid),
+                and_(Friend.transmit_user_uuid == other_uuid,
+                     Friend.receive_user_uuid == user_uuid),
+            )))
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def set_status(session: AsyncSession, transmit_user_uuid: str, receive_user_uuid: str, status: FriendStatus) -> Friend:
+        """transmit -> receive 관계가 있으면 상태를 바꾸고, 없으면 새로 생성"""
+        friend = await session.get(Friend, (transmit_user_uuid, receive_user_uuid))
+        if friend is None:
+            friend = Friend(transmit_user_uuid, receive_user_uuid, status)
+            session.add(friend)
+        else:
+            friend.status = status
+            friend.created_at = datetime.now()
+
+        await session.flush()
+        return friend
+
+    @staticmethod
+    async def delete_relation(session: AsyncSession, transmit_user_uuid: str, receive_user_uuid: str) -> None:
+        friend = await session.get(Friend, (transmit_user_uuid, receive_user_uuid))
+        if friend is not None:
+            await session.delete(friend)
+            await session.flush()
+
+    @staticmethod
+    async def list_friends(user_uuid: str, after: str | None, limit: int) -> Tuple[List[Tuple[User, datetime]], str | None]:
+        """수락된 친구를 상대 uuid 순서로 조회
+        보낸 쪽(ix_friend_transmit_status)과 받은 쪽(ix_friend_receive_status)을 각각 limit + 1개까지만 범위 검색한 뒤 합침"""
+        sides = []
+        for me, other in ((Friend.transmit_user_uuid, Friend.receive_user_uuid),
+                          (Friend.receive_user_uuid, Friend.transmit_user_uuid)):
+            query = select(other.label("friend_uuid"), Friend.created_at.label("since")).filter(
+                me == user_uuid, Friend.status == FriendStatus.accepted)
+            if after:
+                query = query.filter(other > after)
+
+            sides.append(select(query.order_by(other).limit(limit + 1).subquery()))
+
+        friends = union_all(*sides).subquery()
+        query = select(User, friends.c.since).join(
+            friends, User.user_uuid == friends.c.friend_uuid).order_by(friends.c.friend_uuid).limit(limit + 1)
+
+        async with DBObject.get_instance().read_session_scope() as session:
+            rows = [tuple(row) for row in (await session.execute(query)).all()]
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return (rows, encode_cursor([rows[-1][0].user_uuid]))
+
+        return (rows, None)
+
+    @staticmethod
+    async def list_received_requests(user_uuid: str, after: str | None, limit: int) -> Tuple[List[Tuple[User, datetime]], str | None]:
+        """받은 친구 요청(대기 중)을 보낸 유저 uuid 순서로 조회"""
+        query = select(User, Friend.created_at).join(
+            Friend, Friend.transmit_user_uuid == User.user_uuid).filter(
+                Friend.receive_user_uuid == user_uuid, Friend.status == FriendStatus.pending)
+        if after:
+            query = query.filter(Friend.transmit_user_uuid > after)
+
+        query = query.order_by(Friend.transmit_user_uuid).limit(limit + 1)
+
+        async with DBObject.get_instance().read_session_scope() as session:
+            rows = [tuple(row) for row in (await session.execute(query)).all()]
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            return (rows, encode_cursor([rows[-1][0].user_uuid]))
+
+        return (rows, None)
+
+    @staticmethod
+    async def find_friend_uuids(user_uuids: Iterable[str]) -> Dict[str, Set[str]]:
+        """여러 유저의 수락된 친구 uuid 목록을 한 번에 조회
+        무효화 직후 캐시를 다시 채우는 조회이므로 복제 DB의 오래된 값이 TTL 동안 캐시되지 않도록 primary를 사용"""
+        user_uuids = list(user_uuids)
+        friends: Dict[str, Set[str]] = {user_uuid: set() for user_uuid in user_uuids}
+
+        async with DBObject.get_instance().async_session_scope() as session:
+            for start in range(0, len(user_uuids), IN_CHUNK_SIZE):
+                chunk = user_uuids[start:start + IN_CHUNK_SIZE]
+                query = union_all(
+                    select(Friend.transmit_user_uuid, Friend.receive_user_uuid).filter(
+                        Friend.transmit_user_uuid.in_(chunk), Friend.status == FriendStatus.accepted),
+                    select(Friend.receive_user_uuid, Friend.transmit_user_uuid).filter(
+                        Friend.receive_user_uuid.in_(chunk), Friend.status == FriendStatus.accepted),
+                )
+                for user_uuid, friend_uuid in (await session.execute(query)).all():
+                    friends[user_uuid].add(friend_uuid)
+
+        return friends
+
+    @staticmethod
+    async def find_related_uuids(user_uuid: str) -> Set[str]:
+        """상태와 관계없이 관계(요청/차단 등)가 있는 상대 uuid 목록"""
+        query = union_all(
+            select(Friend.receive_user_uuid).filter(
+                Friend.transmit_user_uuid == user_uuid),
+            select(Friend.transmit_user_uuid).filter(
+                Friend.receive_user_uuid == user_uuid),
+        )
+        async with DBObject.get_instance().read_session_scope() as session:
+            return set((await session.execute(query)).scalars().all())
+
+    @staticmethod
+    async def find_users(user_uuids: Iterable[str]) -> Dict[str, User]:
+        user_uuids = list(user_uuids)
+        users: Dict[str, User] = {}
+        async with DBObject.get_instance().read_session_scope() as session:
+            for start in range(0, len(user_uuids), IN_CHUNK_SIZE):
+                result = await session.execute(
+                    select(User).filter(User.user_uuid.in_(user_uuids[start:start + IN_CHUNK_SIZE])))
+                users.update({user.user_uuid: user for user in result.scalars().all()})
+
+        return users
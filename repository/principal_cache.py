@@ -0,0 +1,63 @@
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Any, Callable, Dict
+from util.ttl_cache import TTLCache
+from model.user import User
+import os
+
+
+class PrincipalCache(object):
+    """인증된 유저(User)의 분리된(detached) 스냅샷을 user_uuid로 캐싱"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use PrincipalCache.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """PrincipalCache의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.cache = TTLCache(
+                max_size=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")),
+                ttl=float(os.getenv("PRINCIPAL_CACHE_TTL", "60")),
+            )
+            cls._instance._invalidation_hooks = []
+
+        return cls._instance
+
+    @staticmethod
+    def snapshot(user: User) -> Dict[str, Any]:
+        return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+    @staticmethod
+    def restore(snapshot: Dict[str, Any]) -> User:
+        """요청마다 새로운 detached User를 만들어서 캐시된 값이 공유되지 않도록 함"""
+        user = User.__mapper__.class_manager.new_instance()
+        for key, value in snapshot.items():
+            setattr(user, key, value)
+
+        make_transient_to_detached(user)
+        return user
+
+    def get(self, user_uuid: str) -> User | None:
+        snapshot = self.cache.get(user_uuid)
+        return PrincipalCache.restore(snapshot) if snapshot else None
+
+    def put(self, user: User) -> None:
+        self.cache.set(user.user_uuid, PrincipalCache.snapshot(user))
+
+    def add_invalidation_hook(self, hook: Callable[[str], Any]) -> None:
+        """다른 워커의 캐시도 무효화할 수 있도록 무효화 시점에 호출할 함수를 등록 (예: pub/sub 발행)"""
+        self._invalidation_hooks.append(hook)
+
+    def invalidate(self, user_uuid: str, broadcast: bool = True) -> None:
+        """로컬 항목을 제거하고, broadcast면 등록된 훅으로 다른 워커에 전파
+        다른 워커에서 받은 무효화 메시지를 처리할 때는 broadcast=False로 호출"""
+        self.cache.pop(user_uuid)
+        if broadcast:
+            for hook in self._invalidation_hooks:
+                hook(user_uuid)
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
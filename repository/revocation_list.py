@@ -0,0 +1,157 @@
+from repository.revoked_token_repository import RevokedTokenRepository, TokenAlreadyRevokedError
+from model.revoked_token import RevokedToken
+from util.structured_log import log_event
+from datetime import datetime, timedelta
+from typing import Any, Dict, Mapping
+import asyncio
+import logging
+import time
+import os
+
+
+class RevocationList(object):
+    """폐기된 토큰 목록을 메모리에 두고, DB에서는 마지막으로 읽은 뒤에 추가된 기록만 주기적으로 읽어 옴
+    요청마다 DB를 조회하지 않고 dict 조회 두 번으로 확인하며, 다른 워커의 폐기는 refresh_interval초 안에 반영됨"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use RevocationList.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """RevocationList의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.refresh_interval = float(
+                os.getenv("TOKEN_REVOCATION_REFRESH_INTERVAL", "5"))
+            # 늦게 커밋된 기록이나 워커 사이의 시계 차이를 놓치지 않도록 이만큼(초) 겹쳐서 다시 읽음
+            cls._instance.overlap = float(
+                os.getenv("TOKEN_REVOCATION_OVERLAP", "60"))
+            cls._instance.purge_interval = float(
+                os.getenv("TOKEN_REVOCATION_PURGE_INTERVAL", "3600"))
+            # jti -> (토큰 만료 시각, refresh 토큰을 사용해서 폐기되었는지)
+            cls._instance._tokens = {}
+            # user_uuid -> (이 시각 이전에 발급된 토큰은 폐기, 기록 만료 시각)
+            cls._instance._users = {}
+            cls._instance._since = None
+            cls._instance._purged_at = 0.0
+            cls._instance._refresher = None
+            cls._instance.refreshes = 0
+
+        return cls._instance
+
+    def is_revoked(self, claims: Mapping[str, Any]) -> bool:
+        jti = claims.get("jti")
+        if jti is not None and jti in self._tokens:
+            return True
+
+        user = self._users.get(claims.get("sub"))
+        # iat가 없는 이전 형식의 토큰은 유저 단위 폐기가 있으면 모두 폐기된 것으로 봄
+        return user is not None and claims.get("iat", 0) < user[0]
+
+    def is_consumed(self, claims: Mapping[str, Any]) -> bool:
+        """refresh 토큰을 재발급에 사용해서 폐기된 토큰인지 확인 (로그아웃이나 유저 단위 폐기는 False)"""
+        entry = self._tokens.get(claims.get("jti"))
+        return entry is not None and entry[1]
+
+    def apply(self, revoked: RevokedToken) -> None:
+        expires_at = revoked.expires_at.timestamp()
+        if revoked.jti is not None:
+            self._tokens[revoked.jti] = (expires_at, revoked.consumed)
+            return
+
+        cutoff = revoked.revoked_at.timestamp()
+        current = self._users.get(revoked.user_uuid)
+        if current is None or current[0] < cutoff:
+            self._users[revoked.user_uuid] = (cutoff, expires_at)
+
+    async def revoke(self, user_uuid: str, jti: str | None, expires_at: datetime) -> None:
+        """jti가 None이면 지금까지 발급된 user_uuid의 모든 토큰을 폐기"""
+        revoked = RevokedToken(user_uuid, jti, datetime.now(), expires_at)
+        try:
+            await RevokedTokenRepository.add(revoked)
+        except TokenAlreadyRevokedError as e:
+            # 이미 사용했거나 폐기한 토큰이면 기존 기록을 그대로 둠
+            revoked.consumed = e.consumed
+
+        self.apply(revoked)
+
+    async def revoke_token(self, claims: Mapping[str, Any]) -> None:
+        # jti가 없는 이전 형식의 토큰은 하나만 폐기할 수 없으므로 유저의 토큰을 모두 폐기
+        await self.revoke(claims["sub"], claims.get("jti"), datetime.fromtimestamp(claims["exp"]))
+
+    async def consume(self, claims: Mapping[str, Any]) -> bool:
+        """한 번만 쓸 수 있는 토큰(refresh 토큰)을 사용한 것으로 기록, 이미 사용했거나 폐기된 토큰이면 False
+        (둘 중 어느 쪽인지는 is_consumed로 확인)
+        확인과 메모리 반영 사이에 await가 없으므로 같은 워커의 동시 요청은 하나만 통과하고,
+        다른 워커와의 경쟁은 jti의 unique 제약 조건으로 하나만 기록됨
+        DB에 기록하지 못해도 이 워커에서는 사용한 것으로 남겨 둠 (다시 로그인해야 함)"""
+        if self.is_revoked(claims):
+            return False
+
+        revoked = RevokedToken(claims["sub"], claims.get("jti"), datetime.now(),
+                               datetime.fromtimestamp(claims["exp"]), consumed=True)
+        self.apply(revoked)
+        try:
+            await RevokedTokenRepository.add(revoked)
+        except TokenAlreadyRevokedError as e:
+            # 다른 워커가 먼저 남긴 기록이 사용인지 로그아웃인지를 따름
+            revoked.consumed = e.consumed
+            self.apply(revoked)
+            return False
+
+        return True
+
+    async def revoke_user(self, user_uuid: str, max_lifetime: timedelta) -> None:
+        """비밀번호 변경, 탈퇴처럼 이미 발급된 모든 토큰을 무효로 만들어야 할 때 사용"""
+        await self.revoke(user_uuid, None, datetime.now() + max_lifetime)
+
+    async def refresh(self) -> int:
+        """마지막으로 읽은 시각 이후의 기록을 반영하고 purge_interval마다 만료된 항목을 정리, 반영한 기록 수를 반환"""
+        started_at = datetime.now()
+        since = None if self._since is None else self._since - timedelta(seconds=self.overlap)
+        rows = await RevokedTokenRepository.list_since(since)
+        for revoked in rows:
+            self.apply(revoked)
+
+        self._since = started_at
+        self.refreshes += 1
+
+        now = time.time()
+        if now - self._purged_at >= self.purge_interval:
+            # 만료된 토큰은 폐기 여부와 관계없이 decode에서 거절되므로 목록에서 빼도 됨
+            self._purged_at = now
+            self._tokens = {jti: entry for jti, entry in self._tokens.items() if entry[0] > now}
+            self._users = {user_uuid: entry for user_uuid, entry in self._users.items() if entry[1] > now}
+            await RevokedTokenRepository.purge_expired()
+
+        return len(rows)
+
+    async def start(self) -> None:
+        """전체 목록을 한 번 읽은 뒤 주기적으로 변경분을 읽는 백그라운드 작업을 시작"""
+        if self._refresher is not None and not self._refresher.done():
+            return
+
+        try:
+            await self.refresh()
+        except Exception as e:
+            log_event("revocation.load_failed", logging.ERROR, error=str(e))
+
+        async def refresh_periodically():
+            while True:
+                await asyncio.sleep(self.refresh_interval)
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    log_event("revocation.refresh_failed", logging.ERROR, error=str(e))
+
+        self._refresher = asyncio.get_running_loop().create_task(refresh_periodically())
+
+    def stop(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"tokens": len(self._tokens), "users": len(self._users), "refreshes": self.refreshes}
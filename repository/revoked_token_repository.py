@@ -0,0 +1,49 @@
+from model.revoked_token import RevokedToken
+from sqlalchemy.exc import IntegrityError
+from database.connection import DBObject
+from sqlalchemy import select, delete
+from datetime import datetime
+from typing import List
+
+
+class TokenAlreadyRevokedError(Exception):
+    """같은 jti의 폐기 기록이 이미 있음 (다른 요청이나 워커가 먼저 사용하거나 폐기한 토큰)
+    consumed는 이미 있는 기록이 refresh 토큰을 사용해서 생긴 것인지 여부"""
+
+    def __init__(self, jti: str, consumed: bool):
+        super().__init__(f"'{jti}' 토큰은 이미 폐기되었습니다.")
+        self.jti = jti
+        self.consumed = consumed
+
+
+class RevokedTokenRepository:
+    @staticmethod
+    async def add(revoked: RevokedToken) -> None:
+        """jti의 unique 제약 조건 위반은 이미 있는 기록의 consumed와 함께 TokenAlreadyRevokedError로 변환"""
+        try:
+            async with DBObject.get_instance().async_session_scope() as session:
+                session.add(revoked)
+                await session.flush()
+
+        except IntegrityError as e:
+            async with DBObject.get_instance().async_session_scope() as session:
+                consumed = await session.scalar(select(RevokedToken.consumed).filter(RevokedToken.jti == revoked.jti))
+            raise TokenAlreadyRevokedError(revoked.jti, bool(consumed)) from e
+
+    @staticmethod
+    async def list_since(since: datetime | None) -> List[RevokedToken]:
+        """since 이후에 폐기된, 아직 만료되지 않은 기록을 조회 (since가 None이면 전체)
+        복제 지연 동안 폐기를 놓치지 않도록 primary에서 조회"""
+        async with DBObject.get_instance().async_session_scope() as session:
+            query = select(RevokedToken).filter(RevokedToken.expires_at > datetime.now())
+            if since is not None:
+                query = query.filter(RevokedToken.revoked_at >= since)
+
+            result = await session.execute(query)
+            return list(result.scalars().all())
+
+    @staticmethod
+    async def purge_expired() -> int:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(delete(RevokedToken).filter(RevokedToken.expires_at <= datetime.now()))
+            return result.rowcount
@@ -0,0 +1,163 @@
+from sqlalchemy import select, delete, insert, update, func
+from model.room_change import RoomChange, ChangeOperation
+from sqlalchemy.ext.asyncio import AsyncSession
+from util.structured_log import log_event
+from datetime import datetime, timedelta
+from database.connection import DBObject
+from typing import Dict, List, Tuple
+from model.category import Category
+from model.room import Room
+from model.task import Task
+import asyncio
+import logging
+import os
+
+# 한 번에 지울 항목 수 (IN 절 길이 제한)
+IN_CHUNK_SIZE = 500
+
+
+class StaleCursorError(Exception):
+    """커서 이후의 삭제 기록 일부가 이미 정리되어 변경분만으로는 동기화할 수 없음"""
+
+    def __init__(self, room_uuid: str, after: int, pruned_seq: int):
+        super().__init__(f"'{room_uuid}' 방의 커서({after})가 정리된 변경 기록({pruned_seq})보다 오래되었습니다.")
+        self.room_uuid = room_uuid
+        self.after = after
+        self.pruned_seq = pruned_seq
+
+
+class RoomChangeRepository:
+    @staticmethod
+    async def record(session: AsyncSession, room_uuid: str, entity: str, entity_uuid: str, operation: ChangeOperation) -> None:
+        """변경을 일으킨 쿼리와 같은 트랜잭션 안에서 호출
+        MySQL에서는 방 행을 잠가서 같은 방의 seq가 커밋 순서대로 보이도록 함
+        (잠그지 않으면 먼저 발급된 seq가 나중에 커밋되어 그 사이에 조회한 클라이언트가 놓칠 수 있음)"""
+        await RoomChangeRepository.record_many(session, room_uuid, entity, [(entity_uuid, operation)])
+
+    @staticmethod
+    async def record_many(session: AsyncSession, room_uuid: str, entity: str, changes: List[Tuple[str, ChangeOperation]]) -> None:
+        """여러 항목의 변경을 DELETE 1번, INSERT 1번(executemany)으로 기록"""
+        if not changes:
+            return
+
+        await session.execute(select(Room.room_uuid).filter(Room.room_uuid == room_uuid).with_for_update())
+        for start in range(0, len(changes), IN_CHUNK_SIZE):
+            await session.execute(delete(RoomChange).filter(
+                RoomChange.entity == entity,
+                RoomChange.entity_uuid.in_([entity_uuid for entity_uuid, _ in changes[start:start + IN_CHUNK_SIZE]])))
+
+        changed_at = datetime.now()
+        await session.execute(insert(RoomChange), [
+            {"room_uuid": room_uuid, "entity": entity, "entity_uuid": entity_uuid,
+             "operation": operation, "changed_at": changed_at}
+            for entity_uuid, operation in changes
+        ])
+
+    @staticmethod
+    async def list_changes(room_uuid: str, after: int, limit: int) -> Tuple[List[RoomChange], Dict[str, List[Task | Category]], bool]:
+        """after 이후의 변경 limit개와 그중 생성/수정된 행을 조회 (변경 1 + 종류별 IN 1번씩)
+        after가 정리된 삭제 기록보다 오래되었으면 StaleCursorError (after가 0이면 살아 있는 항목을 모두 받으므로 해당 없음)"""
+        async with DBObject.get_instance().read_session_scope() as session:
+            if after > 0:
+                pruned_seq = (await session.execute(
+                    select(Room.pruned_change_seq).filter(Room.room_uuid == room_uuid))).scalar() or 0
+                if after < pruned_seq:
+                    raise StaleCursorError(room_uuid, after, pruned_seq)
+
+            result = await session.execute(
+                select(RoomChange).filter(RoomChange.room_uuid == room_uuid, RoomChange.seq > after)
+                .order_by(RoomChange.seq).limit(limit + 1))
+            changes = list(result.scalars().all())
+            has_more = len(changes) > limit
+            changes = changes[:limit]
+
+            upserted: Dict[str, List[str]] = {"task": [], "category": []}
+            for change in changes:
+                if change.operation == ChangeOperation.upsert:
+                    upserted[change.entity].append(change.entity_uuid)
+
+            rows: Dict[str, List[Task | Category]] = {"task": [], "category": []}
+            if upserted["task"]:
+                rows["task"] = list((await session.execute(
+                    select(Task).filter(Task.task_uuid.in_(upserted["task"])))).scalars().all())
+            if upserted["category"]:
+                rows["category"] = list((await session.execute(
+                    select(Category).filter(Category.category_uuid.in_(upserted["category"])))).scalars().all())
+
+            return (changes, rows, has_more)
+
+    @staticmethod
+    async def prune_tombstones(before: datetime) -> int:
+        """before 이전에 기록된 삭제 기록을 방 단위 트랜잭션으로 지우고 지운 가장 큰 seq를 Room.pruned_change_seq에 남김
+        seq와 기록 시각의 순서가 워커 사이의 시계 차이로 어긋나도, 남긴 seq 이하의 삭제 기록만 지우므로 그보다 새로운 커서는 놓치는 것이 없음"""
+        db = DBObject.get_instance()
+        async with db.async_session_scope() as session:
+            result = await session.execute(
+                select(RoomChange.room_uuid, func.max(RoomChange.seq)).filter(
+                    RoomChange.operation == ChangeOperation.delete, RoomChange.changed_at < before)
+                .group_by(RoomChange.room_uuid))
+            horizons = result.all()
+
+        pruned = 0
+        for room_uuid, seq in horizons:
+            async with db.async_session_scope() as session:
+                # 정리 seq 갱신과 삭제를 한 트랜잭션으로 처리해서 기록만 지워지고 커서는 통과하는 시점이 없도록 함
+                await session.execute(update(Room).filter(
+                    Room.room_uuid == room_uuid, Room.pruned_change_seq < seq).values(pruned_change_seq=seq))
+                result = await session.execute(delete(RoomChange).filter(
+                    RoomChange.room_uuid == room_uuid,
+                    RoomChange.operation == ChangeOperation.delete,
+                    RoomChange.seq <= seq))
+                pruned += result.rowcount
+
+        return pruned
+
+
+class RoomChangePruner(object):
+    """오래된 삭제 기록(툼스톤)을 주기적으로 정리 (여러 워커에서 실행해도 결과는 같음)"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use RoomChangePruner.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """RoomChangePruner의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            # 이 시간(초)보다 오래 동기화하지 않은 클라이언트는 커서 없이 전체를 다시 받음
+            cls._instance.ttl = float(
+                os.getenv("ROOM_CHANGE_TOMBSTONE_TTL", "2592000"))
+            cls._instance._sweeper = None
+
+        return cls._instance
+
+    async def purge_expired(self) -> int:
+        pruned = await RoomChangeRepository.prune_tombstones(datetime.now() - timedelta(seconds=self.ttl))
+        if pruned:
+            log_event("room_change.pruned", count=pruned)
+
+        return pruned
+
+    def start_sweeper(self, interval: float | None = None) -> None:
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+
+        interval = interval or float(
+            os.getenv("ROOM_CHANGE_SWEEP_INTERVAL", "3600"))
+
+        async def sweep():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.purge_expired()
+                except Exception as e:
+                    log_event("room_change.prune_failed", logging.ERROR, error=str(e))
+
+        self._sweeper = asyncio.get_running_loop().create_task(sweep())
+
+    def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
@@ -0,0 +1,91 @@
+from model.room import Room, RoomEntry, RoomEntryStatus
+from util.structured_log import log_event
+from sqlalchemy import select, func, case
+from database.connection import DBObject
+from model.room_change import RoomChange
+from sqlalchemy.orm import selectinload
+from typing import Iterable, List, Set
+from model.category import Category
+
+
+class RoomRepository:
+    @staticmethod
+    async def create_room(room: Room, owner_uuid: str) -> None:
+        """방을 만들고 만든 유저를 바로 참여(수락) 상태로 등록"""
+        async with DBObject.get_instance().async_session_scope() as session:
+            session.add(room)
+            await session.flush()
+            session.add(RoomEntry(room_uuid=room.room_uuid, user_uuid=owner_uuid,
+                                  created_at=room.created_at, status=RoomEntryStatus.accepted))
+            log_event("room.created", room_uuid=room.room_uuid)
+
+    @staticmethod
+    async def find_dashboard(room_uuid: str) -> Room | None:
+        """방, 카테고리, 카테고리별 할 일을 카테고리 수와 관계없이 쿼리 3번으로 로드 (방 1 + 카테고리 IN 1 + 할 일 IN 1)"""
+        async with DBObject.get_instance().read_session_scope() as session:
+            result = await session.execute(
+                select(Room).filter(Room.room_uuid == room_uuid).options(
+                    selectinload(Room.categories).selectinload(Category.tasks)))
+            return result.scalars().first()
+
+    @staticmethod
+    async def check_room_member(room_uuid: str, user_uuid: str) -> bool:
+        """user_uuid가 room_uuid 방에 참여(수락)한 상태인지 확인"""
+        async with DBObject.get_instance().read_session_scope() as session:
+            result = await session.execute(
+                select(RoomEntry.user_uuid).filter(
+                    RoomEntry.room_uuid == room_uuid,
+                    RoomEntry.user_uuid == user_uuid,
+                    RoomEntry.status == RoomEntryStatus.accepted,
+                ).limit(1))
+            return result.first() is not None
+
+    @staticmethod
+    async def find_room_version(room_uuid: str, user_uuid: str) -> int | None:
+        """참여 확인과 방의 마지막 변경 seq 조회를 쿼리 1번으로 처리 (참여하지 않았으면 None, 변경이 없으면 0)
+        할 일/카테고리가 바뀔 때마다 seq가 커지므로 방 대시보드와 할 일 목록의 ETag 버전으로 사용
+        마지막 기록이 정리된 삭제 기록이어도 버전이 줄어들지 않도록 Room.pruned_change_seq와 비교"""
+        async with DBObject.get_instance().read_session_scope() as session:
+            last_seq = func.coalesce(select(func.max(RoomChange.seq)).filter(
+                RoomChange.room_uuid == room_uuid).scalar_subquery(), 0)
+            pruned_seq = func.coalesce(select(Room.pruned_change_seq).filter(
+                Room.room_uuid == room_uuid).scalar_subquery(), 0)
+            result = await session.execute(
+                select(case((last_seq >= pruned_seq, last_seq), else_=pruned_seq)).select_from(RoomEntry).filter(
+                    RoomEntry.room_uuid == room_uuid,
+                    RoomEntry.user_uuid == user_uuid,
+                    RoomEntry.status == RoomEntryStatus.accepted,
+                ).limit(1))
+            return result.scalar()
+
+    @staticmethod
+    async def list_room_uuids(user_uuid: str) -> List[str]:
+        """user_uuid가 참여(수락)한 방 목록"""
+        async with DBObject.get_instance().read_session_scope() as session:
+            result = await session.execute(
+                select(RoomEntry.room_uuid).filter(
+                    RoomEntry.user_uuid == user_uuid,
+                    RoomEntry.status == RoomEntryStatus.accepted,
+                ))
+            return list(result.scalars().all())
+
+    @staticmethod
+    async def check_category_in_room(room_uuid: str, category_uuid: str) -> bool:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(Category.category_uuid).filter(
+                    Category.category_uuid == category_uuid,
+                    Category.room_uuid == room_uuid,
+                ).limit(1))
+            return result.first() is not None
+
+    @staticmethod
+    async def find_category_uuids(room_uuid: str, category_uuids: Iterable[str]) -> Set[str]:
+        """room_uuid 방에 속한 카테고리 uuid만 반환"""
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(Category.category_uuid).filter(
+                    Category.room_uuid == room_uuid,
+                    Category.category_uuid.in_(list(category_uuids)),
+                ))
+            return set(result.scalars().all())
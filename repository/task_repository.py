@@ -0,0 +1,123 @@
+from repository.room_change_repository import RoomChangeRepository
+from sqlalchemy import select, insert, update, delete, and_, or_
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from model.room_change import ChangeOperation
+from util.structured_log import log_event
+from database.connection import DBObject
+from util.cursor import encode_cursor
+from datetime import datetime
+from model.task import Task
+
+IN_CHUNK_SIZE = 500
+
+
+class TaskRepository:
+    @staticmethod
+    def cursor_of(task: Task) -> str:
+        return encode_cursor([task.end_at.isoformat(), task.created_at.isoformat(), task.task_uuid])
+
+    @staticmethod
+    def after_cursor(values: List[Any]):
+        """(end_at, created_at, task_uuid) > 커서 조건을 인덱스 범위 검색이 가능한 형태로 풀어서 작성"""
+        end_at, created_at, task_uuid = datetime.fromisoformat(
+            values[0]), datetime.fromisoformat(values[1]), str(values[2])
+        return or_(
+            Task.end_at > end_at,
+            and_(Task.end_at == end_at, Task.created_at > created_at),
+            and_(Task.end_at == end_at, Task.created_at == created_at,
+                 Task.task_uuid > task_uuid),
+        )
+
+    @staticmethod
+    async def list_tasks(room_uuid: str, category_uuid: str | None, after: List[Any] | None, limit: int) -> Tuple[List[Task], str | None]:
+        """room_uuid(또는 category_uuid) 인덱스를 따라 커서 다음 limit개를 조회 (OFFSET 없이 항상 같은 비용)"""
+        query = select(Task).filter(Task.room_uuid == room_uuid)
+        if category_uuid:
+            query = query.filter(Task.category_uuid == category_uuid)
+        if after:
+            query = query.filter(TaskRepository.after_cursor(after))
+
+        query = query.order_by(
+            Task.end_at, Task.created_at, Task.task_uuid).limit(limit + 1)
+
+        async with DBObject.get_instance().read_session_scope() as session:
+            tasks = list((await session.execute(query)).scalars().all())
+
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            return (tasks, TaskRepository.cursor_of(tasks[-1]))
+
+        return (tasks, None)
+
+    @staticmethod
+    async def find_task(room_uuid: str, task_uuid: str) -> Task | None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(Task).filter(Task.task_uuid == task_uuid, Task.room_uuid == room_uuid))
+            return result.scalars().first()
+
+    @staticmethod
+    async def create_task(task: Task) -> None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            session.add(task)
+            await session.flush()
+            await RoomChangeRepository.record(session, task.room_uuid, "task", task.task_uuid, ChangeOperation.upsert)
+            log_event("task.created", task_uuid=task.task_uuid)
+
+    @staticmethod
+    async def update_task(task: Task, task_data: Dict[str, Any]) -> Task:
+        async with DBObject.get_instance().async_session_scope() as session:
+            exist_task = await session.get(Task, task.task_uuid)
+            if not exist_task:
+                raise ValueError("Task를 찾을 수 없습니다.")
+
+            for key, value in task_data.items():
+                setattr(exist_task, key, value)
+
+            exist_task.updated_at = datetime.now()
+            await session.flush()
+            await RoomChangeRepository.record(session, exist_task.room_uuid, "task", exist_task.task_uuid, ChangeOperation.upsert)
+            log_event("task.updated", task_uuid=task.task_uuid)
+            return exist_task
+
+    @staticmethod
+    async def delete_task(task: Task) -> None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            await session.delete(task)
+            await session.flush()
+            await RoomChangeRepository.record(session, task.room_uuid, "task", task.task_uuid, ChangeOperation.delete)
+            log_event("task.deleted", task_uuid=task.task_uuid)
+
+    @staticmethod
+    async def find_task_uuids(room_uuid: str, task_uuids: Iterable[str]) -> Set[str]:
+        """room_uuid 방에 실제로 있는 할 일 uuid만 반환"""
+        task_uuids = list(task_uuids)
+        existing = set()
+        async with DBObject.get_instance().async_session_scope() as session:
+            for start in range(0, len(task_uuids), IN_CHUNK_SIZE):
+                result = await session.execute(select(Task.task_uuid).filter(
+                    Task.room_uuid == room_uuid, Task.task_uuid.in_(task_uuids[start:start + IN_CHUNK_SIZE])))
+                existing.update(result.scalars().all())
+
+        return existing
+
+    @staticmethod
+    async def apply_batch(room_uuid: str, creates: List[Dict[str, Any]], updates: List[Dict[str, Any]], deletes: List[str]) -> None:
+        """여러 할 일의 생성/수정/삭제를 하나의 트랜잭션에서 종류별로 묶어서 실행
+        (객체마다 flush하지 않고 INSERT executemany, 기본 키 기준 UPDATE executemany, IN 절 DELETE 사용)"""
+        async with DBObject.get_instance().async_session_scope() as session:
+            if creates:
+                await session.execute(insert(Task), creates)
+
+            if updates:
+                await session.execute(update(Task), updates)
+
+            for start in range(0, len(deletes), IN_CHUNK_SIZE):
+                await session.execute(delete(Task).filter(
+                    Task.room_uuid == room_uuid, Task.task_uuid.in_(deletes[start:start + IN_CHUNK_SIZE])))
+
+            await RoomChangeRepository.record_many(session, room_uuid, "task", [
+                *((task["task_uuid"], ChangeOperation.upsert) for task in creates),
+                *((task["task_uuid"], ChangeOperation.upsert) for task in updates),
+                *((task_uuid, ChangeOperation.delete) for task_uuid in deletes),
+            ])
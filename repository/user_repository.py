@@ -1,49 +1,138 @@
+from repository.principal_cache import PrincipalCache
+from typing import Literal, Dict, Any, List, Tuple
+from util.structured_log import log_event
+from sqlalchemy.exc import IntegrityError
 from database.connection import DBObject
-from typing import Literal, Dict, Any
+from sqlalchemy import select, or_
 from model.user import User
+import re
+
+# User 테이블의 unique 컬럼 (충돌 메시지 우선순위 순서)
+UNIQUE_FIELDS = ("user_id", "nickname", "email")
+
+
+class UserConflictError(Exception):
+    """unique 제약 조건 위반을 어떤 필드에서 충돌했는지로 변환한 에러"""
+    field: str
+    value: str
+
+    def __init__(self, field: str, value: str):
+        super().__init__(f"'{value}' 값이 '{field}' 필드에서 충돌합니다.")
+        self.field = field
+        self.value = value
 
 
 class UserRepository:
     @staticmethod
-    def find_user(by: Literal["user_uuid", "user_id", "nickname", "email"], value: str) -> User:
-        with DBObject.get_instance().session_scope() as session:
-            user = session.query(User).filter(
-                getattr(User, by) == value).first()
+    async def find_user(by: Literal["user_uuid", "user_id", "nickname", "email"], value: str, consistent: bool = False) -> User:
+        """consistent면 복제 지연 없이 primary에서 조회 (로그인처럼 방금 바뀐 비밀번호를 봐야 하는 경우)"""
+        db = DBObject.get_instance()
+        async with (db.async_session_scope() if consistent else db.read_session_scope()) as session:
+            result = await session.execute(
+                select(User).filter(getattr(User, by) == value).limit(1))
+            user = result.scalars().first()
             if user:
                 session.expunge(user)
 
             return user
 
     @staticmethod
-    def create_user(user: User) -> None:
-        with DBObject.get_instance().session_scope() as session:
-            session.add(user)
-            session.flush()
-            print(f"'{user.user_uuid}'유저가 성공적으로 생성되었습니다!")
+    async def create_user(user: User) -> None:
+        """INSERT 한 번으로 생성하고, unique 제약 조건 위반은 UserConflictError로 변환"""
+        try:
+            async with DBObject.get_instance().async_session_scope() as session:
+                session.add(user)
+                await session.flush()
+
+        except IntegrityError as e:
+            raise await UserRepository.resolve_conflict([user], e) from e
+
+        log_event("user.created", user_uuid=user.user_uuid)
+
+    @staticmethod
+    async def create_users(users: List[User]) -> None:
+        """여러 유저를 하나의 트랜잭션으로 생성 (하나라도 충돌하면 모두 롤백)"""
+        try:
+            async with DBObject.get_instance().async_session_scope() as session:
+                session.add_all(users)
+                await session.flush()
+
+        except IntegrityError as e:
+            raise await UserRepository.resolve_conflict(users, e) from e
+
+        log_event("user.bulk_created", count=len(users))
 
     @staticmethod
-    def update_user(user: User, user_data: Dict[str, Any]) -> None:
-        with DBObject.get_instance().session_scope() as session:
-            exist_user = session.query(User).filter_by(
-                user_uuid=user.user_uuid).first()
+    async def find_conflicts(user_ids: List[str], nicknames: List[str], emails: List[str], consistent: bool = False) -> List[Tuple[str, str, str]]:
+        """user_id, nickname, email 중 하나라도 겹치는 기존 유저를 한 번의 쿼리로 조회
+        미리 확인하는 용도는 복제 DB로 충분하고(최종 판단은 INSERT의 unique 제약 조건), 충돌 원인을 찾을 때는 consistent로 primary를 사용"""
+        db = DBObject.get_instance()
+        async with (db.async_session_scope() if consistent else db.read_session_scope()) as session:
+            result = await session.execute(
+                select(User.user_id, User.nickname, User.email).filter(
+                    or_(
+                        User.user_id.in_(user_ids),
+                        User.nickname.in_(nicknames),
+                        User.email.in_(emails),
+                    )
+                )
+            )
+            return [tuple(row) for row in result.all()]
+
+    @staticmethod
+    async def resolve_conflict(users: List[User], error: IntegrityError) -> Exception:
+        """IntegrityError가 어떤 유저의 어떤 필드 때문에 발생했는지 찾아서 UserConflictError를 반환"""
+        rows = await UserRepository.find_conflicts(
+            [user.user_id for user in users],
+            [user.nickname for user in users],
+            [user.email for user in users],
+            consistent=True,
+        )
+        existing = {field: {row[index] for row in rows}
+                    for index, field in enumerate(UNIQUE_FIELDS)}
+
+        for user in users:
+            for field in UNIQUE_FIELDS:
+                if getattr(user, field) in existing[field]:
+                    return UserConflictError(field, getattr(user, field))
+
+        # 충돌한 행이 그 사이에 삭제된 경우에는 DB 에러 메시지에서 컬럼 이름을 찾음
+        message = str(error.orig)
+        for field in UNIQUE_FIELDS:
+            if re.search(rf"\b{field}\b", message):
+                return UserConflictError(field, getattr(users[0], field))
+
+        return error
+
+    @staticmethod
+    async def update_user(user: User, user_data: Dict[str, Any]) -> None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(User).filter_by(user_uuid=user.user_uuid))
+            exist_user = result.scalars().first()
             if not exist_user:
                 raise ValueError("User를 찾을 수 없습니다.")
 
             for key, value in user_data.items():
                 setattr(exist_user, key, value)
 
-            session.flush()
-            print(f"'{user.user_uuid}'의 정보가 성공적으로 업데이트 되었습니다.")
+            await session.flush()
+
+        PrincipalCache.get_instance().invalidate(user.user_uuid)
+        log_event("user.updated", user_uuid=user.user_uuid, fields=sorted(user_data))
 
     @staticmethod
-    def delete_user(user: User) -> None:
-        with DBObject.get_instance().session_scope() as session:
-            session.delete(user)
-            session.flush()
-            print(f"'{user.user_uuid}'유저가 성공적으로 제거되었습니다!")
+    async def delete_user(user: User) -> None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            await session.delete(user)
+            await session.flush()
+
+        PrincipalCache.get_instance().invalidate(user.user_uuid)
+        log_event("user.deleted", user_uuid=user.user_uuid)
 
     @staticmethod
-    def check_exist_user(by: Literal["user_uuid", "user_id", "nickname", "email"], value: str) -> bool:
-        with DBObject.get_instance().session_scope() as session:
-            query = session.query(User)
-            return query.filter(getattr(User, by) == value).first() is not None
+    async def check_exist_user(by: Literal["user_uuid", "user_id", "nickname", "email"], value: str) -> bool:
+        async with DBObject.get_instance().read_session_scope() as session:
+            result = await session.execute(
+                select(User.user_uuid).filter(getattr(User, by) == value).limit(1))
+            return result.first() is not None
@@ -0,0 +1,237 @@
+from model.email_verification import EmailVerification
+from sqlalchemy import select, delete, func
+from util.structured_log import log_event
+from datetime import datetime, timedelta
+from database.connection import DBObject
+from collections import OrderedDict
+from model.user import VerifyErrorCode
+from abc import ABC, abstractmethod
+from typing import Dict
+import asyncio
+import logging
+import hmac
+import os
+
+
+class VerificationStoreFullError(Exception):
+    """저장할 수 있는 인증 코드 수를 초과함"""
+
+
+class VerificationStore(ABC):
+    """이메일 인증 코드 저장소 인터페이스 (VERIFICATION_STORE=memory|database)"""
+    _instance = None
+
+    def __init__(self, ttl: float, max_entries: int, max_attempts: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_attempts = max_attempts
+        self._sweeper = None
+
+    @classmethod
+    def get_instance(cls) -> "VerificationStore":
+        """환경 변수에 맞는 저장소의 싱글턴 인스턴스를 반환"""
+        if VerificationStore._instance is None:
+            backend = os.getenv("VERIFICATION_STORE", "memory").lower()
+            store_classes = {
+                "memory": MemoryVerificationStore,
+                "database": DatabaseVerificationStore,
+            }
+            if backend not in store_classes:
+                raise ValueError(
+                    f"VERIFICATION_STORE '{backend}'는 지원하지 않습니다. memory 또는 database를 사용하세요.")
+
+            store_class = store_classes[backend]
+
+            VerificationStore._instance = store_class(
+                ttl=float(os.getenv("VERIFICATION_TTL", "300")),
+                max_entries=int(
+                    os.getenv("VERIFICATION_MAX_ENTRIES", "10000")),
+                max_attempts=int(os.getenv("VERIFICATION_MAX_ATTEMPTS", "5")),
+            )
+
+        return VerificationStore._instance
+
+    @staticmethod
+    def matches(expected: str, verify_code: str) -> bool:
+        return hmac.compare_digest(expected.encode(), verify_code.encode())
+
+    @abstractmethod
+    async def issue(self, email: str, verify_code: str) -> "VerificationEntry | None":
+        """코드를 저장하고, 대신한 이전 코드가 있으면 반환 (restore로 되돌릴 때 사용)"""
+
+    @abstractmethod
+    async def restore(self, email: str, verify_code: str, previous: "VerificationEntry | None") -> None:
+        """issue로 저장한 verify_code가 아직 남아 있으면 이전 코드로 되돌림 (이전 코드가 없거나 만료되었으면 삭제)"""
+
+    @abstractmethod
+    async def verify(self, email: str, verify_code: str) -> VerifyErrorCode:
+        """성공하면 코드를 바로 폐기해서 한 번만 사용할 수 있도록 함"""
+
+    @abstractmethod
+    async def purge_expired(self) -> int:
+        """만료된 코드를 지우고 지운 수를 반환"""
+
+    def start_sweeper(self, interval: float | None = None) -> None:
+        """만료된 코드를 주기적으로 지우는 백그라운드 작업을 시작"""
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+
+        interval = interval or float(
+            os.getenv("VERIFICATION_SWEEP_INTERVAL", "60"))
+
+        async def sweep():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.purge_expired()
+                except Exception as e:
+                    log_event("verification.purge_failed", logging.ERROR, error=str(e))
+
+        self._sweeper = asyncio.get_running_loop().create_task(sweep())
+
+    def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+
+class VerificationEntry:
+    verify_code: str
+    expires_at: datetime
+    attempts: int
+
+    def __init__(self, verify_code: str, expires_at: datetime, attempts: int = 0):
+        self.verify_code = verify_code
+        self.expires_at = expires_at
+        self.attempts = attempts
+
+
+class MemoryVerificationStore(VerificationStore):
+    """프로세스 내 저장소 (워커가 하나일 때만 사용)"""
+
+    def __init__(self, ttl: float, max_entries: int, max_attempts: int):
+        super().__init__(ttl, max_entries, max_attempts)
+        self._entries: OrderedDict[str, VerificationEntry] = OrderedDict()
+
+    async def issue(self, email: str, verify_code: str) -> VerificationEntry | None:
+        # 같은 이메일의 코드를 바꾸는 경우는 개수가 늘지 않음
+        if email not in self._entries and len(self._entries) >= self.max_entries:
+            await self.purge_expired()
+            if len(self._entries) >= self.max_entries:
+                raise VerificationStoreFullError(
+                    "인증 요청이 너무 많습니다. 잠시 후 다시 시도하세요.")
+
+        # 만료 순서를 유지하도록 기존 코드를 지우고 맨 뒤에 추가
+        previous = self._entries.pop(email, None)
+        self._entries[email] = VerificationEntry(
+            verify_code, datetime.now() + timedelta(seconds=self.ttl))
+        return previous
+
+    async def restore(self, email: str, verify_code: str, previous: VerificationEntry | None) -> None:
+        entry = self._entries.get(email)
+        if entry is None or entry.verify_code != verify_code:
+            return
+
+        del self._entries[email]
+        # 맨 뒤에 다시 넣으므로 만료 순서가 어긋나지만, verify에서 만료 시각을 확인하므로 늦게 정리될 뿐임
+        if previous is not None and previous.expires_at > datetime.now():
+            self._entries[email] = previous
+
+    async def verify(self, email: str, verify_code: str) -> VerifyErrorCode:
+        entry = self._entries.get(email)
+        if entry is None or entry.expires_at <= datetime.now():
+            self._entries.pop(email, None)
+            return VerifyErrorCode.TIMEOUT
+
+        if entry.attempts >= self.max_attempts:
+            return VerifyErrorCode.TOO_MANY_ATTEMPTS
+
+        if not VerificationStore.matches(entry.verify_code, verify_code):
+            entry.attempts += 1
+            return VerifyErrorCode.WRONG_VERIFY_CODE
+
+        del self._entries[email]
+        return VerifyErrorCode.SUCCESS
+
+    async def purge_expired(self) -> int:
+        now = datetime.now()
+        # 발급 순서대로 저장되므로 앞에서부터 만료된 항목만 제거
+        purged = 0
+        while self._entries:
+            email, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now:
+                break
+
+            del self._entries[email]
+            purged += 1
+
+        return purged
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "max_entries": self.max_entries}
+
+
+class DatabaseVerificationStore(VerificationStore):
+    """email_verification 테이블을 사용하는 저장소 (여러 워커가 같은 코드를 공유)"""
+
+    async def issue(self, email: str, verify_code: str) -> VerificationEntry | None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(EmailVerification.verify_code, EmailVerification.expires_at, EmailVerification.attempts)
+                .filter(EmailVerification.email == email).with_for_update())
+            row = result.first()
+            previous = None if row is None else VerificationEntry(row.verify_code, row.expires_at, row.attempts)
+
+            await session.execute(delete(EmailVerification).filter(EmailVerification.email == email))
+            count = (await session.execute(select(func.count()).select_from(EmailVerification))).scalar_one()
+            if count >= self.max_entries:
+                await session.execute(delete(EmailVerification).filter(EmailVerification.expires_at <= datetime.now()))
+                count = (await session.execute(select(func.count()).select_from(EmailVerification))).scalar_one()
+                if count >= self.max_entries:
+                    raise VerificationStoreFullError(
+                        "인증 요청이 너무 많습니다. 잠시 후 다시 시도하세요.")
+
+            session.add(EmailVerification(
+                email, verify_code, datetime.now() + timedelta(seconds=self.ttl)))
+            return previous
+
+    async def restore(self, email: str, verify_code: str, previous: VerificationEntry | None) -> None:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(EmailVerification).filter(EmailVerification.email == email).with_for_update())
+            entry = result.scalars().first()
+            if entry is None or entry.verify_code != verify_code:
+                return
+
+            if previous is None or previous.expires_at <= datetime.now():
+                await session.delete(entry)
+                return
+
+            entry.verify_code = previous.verify_code
+            entry.expires_at = previous.expires_at
+            entry.attempts = previous.attempts
+
+    async def verify(self, email: str, verify_code: str) -> VerifyErrorCode:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(
+                select(EmailVerification).filter(EmailVerification.email == email).with_for_update())
+            entry = result.scalars().first()
+            if entry is None or entry.expires_at <= datetime.now():
+                if entry is not None:
+                    await session.delete(entry)
+                return VerifyErrorCode.TIMEOUT
+
+            if entry.attempts >= self.max_attempts:
+                return VerifyErrorCode.TOO_MANY_ATTEMPTS
+
+            if not VerificationStore.matches(entry.verify_code, verify_code):
+                entry.attempts += 1
+                return VerifyErrorCode.WRONG_VERIFY_CODE
+
+            await session.delete(entry)
+            return VerifyErrorCode.SUCCESS
+
+    async def purge_expired(self) -> int:
+        async with DBObject.get_instance().async_session_scope() as session:
+            result = await session.execute(delete(EmailVerification).filter(EmailVerification.expires_at <= datetime.now()))
+            return result.rowcount
@@ -1,33 +1,52 @@
 from repository.user_repository import UserRepository
-from datetime import datetime, timedelta, timezone
-from passlib.context import CryptContext
-from typing import Optional
-import jwt
-import os
-
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from service.password_hasher import PasswordHasher
+from service.token_service import TokenService
+from typing import Any, Mapping, Optional
+from model.user import TokenModel
+from datetime import timedelta
 
 
 class AuthService:
     @staticmethod
-    def verify_password(password, plain_password):
-        hashed_password = pwd_context.hash(plain_password)
-        return pwd_context.verify(password, hashed_password)
+    async def hash_password(plain_password: str) -> str:
+        return await PasswordHasher.get_instance().hash(plain_password)
+
+    @staticmethod
+    async def verify_password(password: str, hashed_password: str):
+        return await PasswordHasher.get_instance().verify(password, hashed_password)
 
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
-        to_encode = data.copy()
-        expire = datetime.now(timezone.utc) + \
-            (expires_delta or timedelta(
-                minutes=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))))
-        to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, os.getenv("SECRET_KEY"), algorithm=os.getenv("ALGORITHM"))
+        return TokenService.get_instance().encode(data, expires_delta)
+
+    @staticmethod
+    def decode_claims(token: str) -> Mapping[str, Any]:
+        """서명과 만료를 검증한 claims (캐시된 값을 공유하므로 읽기 전용)"""
+        return TokenService.get_instance().decode(token)
 
     @staticmethod
-    def authenticate_user(user_id: str, password: str):
-        user = UserRepository.find_user(by="user_id", value=user_id)
-        if not user or not AuthService.verify_password(password, user.password):
+    def issue_tokens(user_uuid: str) -> TokenModel:
+        """짧게 유효한 access 토큰과 새 토큰을 발급받을 때 쓰는 refresh 토큰을 함께 발급"""
+        token_service = TokenService.get_instance()
+        return TokenModel(
+            access_token=token_service.encode({"sub": user_uuid}),
+            token_type="bearer",
+            refresh_token=token_service.encode({"sub": user_uuid}, token_type="refresh"),
+        )
+
+    @staticmethod
+    async def authenticate_user(user_id: str, password: str):
+        user = await UserRepository.find_user(by="user_id", value=user_id, consistent=True)
+        if not user:
             return None
 
+        verified, new_hash = await AuthService.verify_password(password, user.password)
+        if not verified:
+            return None
+
+        if new_hash:
+            # 해시 설정이 바뀌었거나 평문으로 저장된 비밀번호는 로그인 시점에 다시 해싱
+            await UserRepository.update_user(user, {"password": new_hash})
+            user.password = new_hash
+
         return user
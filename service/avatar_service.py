@@ -0,0 +1,90 @@
+from service.avatar_storage import AvatarStorage, AvatarTooLargeError, InvalidImageError
+from model.response import ResponseStatusCode, Detail
+from repository.user_repository import UserRepository
+from typing import AsyncIterator, Dict, Tuple
+from util.structured_log import log_exception
+from email.utils import formatdate, parsedate_to_datetime
+from util.etag import etag_matches
+from model.user import User
+import re
+import os
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# 내용이 바뀌면 주소(digest)가 바뀌므로 클라이언트와 CDN이 다시 묻지 않도록 1년 동안 캐시
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class AvatarFile:
+    path: str
+    media_type: str
+    headers: Dict[str, str]
+
+    def __init__(self, path: str, media_type: str, headers: Dict[str, str]):
+        self.path = path
+        self.media_type = media_type
+        self.headers = headers
+
+
+class AvatarService:
+    @staticmethod
+    async def upload_avatar(user: User, content_type: str | None, chunks: AsyncIterator[bytes]) -> Tuple[ResponseStatusCode, Detail | User]:
+        try:
+            if not content_type or not content_type.startswith("image/"):
+                return (ResponseStatusCode.UNSUPPORTED_MEDIA_TYPE, Detail("이미지 파일만 업로드할 수 있습니다."))
+
+            digest = await AvatarStorage.get_instance().save(chunks)
+            await UserRepository.update_user(user, {"avatar_path": digest})
+            user = await UserRepository.find_user("user_uuid", user.user_uuid)
+            return (ResponseStatusCode.SUCCESS, user)
+
+        except AvatarTooLargeError as e:
+            return (ResponseStatusCode.PAYLOAD_TOO_LARGE, Detail(str(e)))
+
+        except InvalidImageError as e:
+            return (ResponseStatusCode.ENTITY_ERROR, Detail(str(e)))
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    def get_avatar(digest: str, size: int | None, if_none_match: str | None, if_modified_since: str | None) -> Tuple[ResponseStatusCode, Detail | AvatarFile]:
+        """digest와 size만으로 ETag를 만들 수 있으므로 If-None-Match는 파일을 열거나 stat하기 전에 304로 응답
+        If-Modified-Since는 파일이 있는지 확인한 뒤 수정 시각과 비교 (없는 digest는 404)"""
+        storage = AvatarStorage.get_instance()
+        if not DIGEST_PATTERN.match(digest):
+            return (ResponseStatusCode.NOT_FOUND, Detail(f"'{digest}' 아바타를 찾을 수 없습니다."))
+
+        size = size or max(storage.sizes)
+        if size not in storage.sizes:
+            return (ResponseStatusCode.ENTITY_ERROR, Detail(f"size는 {', '.join(map(str, storage.sizes))} 중 하나여야 합니다."))
+
+        etag = f'"{digest}-{size}.{storage.image_format}"'
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if if_none_match and etag_matches(if_none_match, etag):
+            return (ResponseStatusCode.NOT_MODIFIED, AvatarFile("", storage.media_type, headers))
+
+        path = storage.path(digest, size)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return (ResponseStatusCode.NOT_FOUND, Detail(f"'{digest}' 아바타를 찾을 수 없습니다."))
+
+        headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+        if not if_none_match and if_modified_since:
+            try:
+                modified_since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                # 형식이 잘못된 날짜는 무시하고 내용을 보냄 (RFC 9110)
+                modified_since = None
+
+            # Last-Modified는 초 단위이므로 같은 초 안의 수정은 바뀌지 않은 것으로 봄
+            if modified_since is not None and int(stat.st_mtime) <= modified_since:
+                return (ResponseStatusCode.NOT_MODIFIED, AvatarFile("", storage.media_type, headers))
+        accel_prefix = os.getenv("AVATAR_ACCEL_REDIRECT")
+        if accel_prefix:
+            # 리버스 프록시(nginx)가 파일을 직접 보내도록 경로만 전달
+            headers["X-Accel-Redirect"] = f"{accel_prefix.rstrip('/')}/{os.path.relpath(path, storage.root)}"
+
+        return (ResponseStatusCode.SUCCESS, AvatarFile(path, storage.media_type, headers))
@@ -0,0 +1,150 @@
+from typing import AsyncIterator, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import tempfile
+import hashlib
+import asyncio
+import os
+
+# 업로드를 디스크에 쓰기 전에 모아두는 크기 (작은 청크마다 스레드를 오가지 않도록)
+WRITE_BUFFER_SIZE = 256 * 1024
+
+MEDIA_TYPES = {"webp": "image/webp", "png": "image/png", "jpeg": "image/jpeg"}
+
+
+class AvatarTooLargeError(Exception):
+    """업로드한 파일이 AVATAR_MAX_BYTES보다 큼"""
+
+
+class InvalidImageError(Exception):
+    """이미지로 열 수 없거나 허용하지 않는 이미지"""
+
+
+def _make_thumbnails(source_path: str, targets: List[Tuple[int, str]], image_format: str, max_pixels: int) -> None:
+    """워커 프로세스에서 실행, 원본을 정사각형으로 잘라서 크기별 썸네일을 저장"""
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(source_path) as image:
+            if image.width * image.height > max_pixels:
+                raise InvalidImageError(f"이미지가 너무 큽니다. ({image.width}x{image.height})")
+
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGBA" if image_format != "jpeg" else "RGB")
+            for size, path in targets:
+                thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+                temp_path = f"{path}.{os.getpid()}.tmp"
+                thumbnail.save(temp_path, format=image_format.upper())
+                os.replace(temp_path, path)
+
+    except InvalidImageError:
+        raise
+
+    except Exception as e:
+        raise InvalidImageError(f"이미지를 처리할 수 없습니다: {e}")
+
+
+class AvatarStorage(object):
+    """아바타 원본과 썸네일을 내용(sha256) 기준 경로에 저장
+    같은 이미지는 한 번만 저장/처리하고, 경로가 내용으로 정해지므로 캐시를 무기한 유지할 수 있음"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use AvatarStorage.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """AvatarStorage의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.root = os.path.abspath(os.getenv("AVATAR_DIR", "./avatars"))
+            cls._instance.max_bytes = int(os.getenv("AVATAR_MAX_BYTES", str(5 * 1024 * 1024)))
+            cls._instance.max_pixels = int(os.getenv("AVATAR_MAX_PIXELS", str(40_000_000)))
+            cls._instance.sizes = tuple(int(size) for size in os.getenv("AVATAR_SIZES", "256,64").split(","))
+            cls._instance.image_format = os.getenv("AVATAR_FORMAT", "webp").lower()
+            cls._instance.workers = int(os.getenv("AVATAR_WORKERS", "2"))
+            cls._instance._executor = None
+            cls._instance._processing = {}
+            os.makedirs(cls._instance.root, exist_ok=True)
+
+        return cls._instance
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        return self._executor
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.image_format]
+
+    def path(self, digest: str, size: int | None = None) -> str:
+        """size가 없으면 원본 경로"""
+        suffix = f"_{size}.{self.image_format}" if size else ".orig"
+        return os.path.join(self.root, digest[:2], f"{digest}{suffix}")
+
+    async def save(self, chunks: AsyncIterator[bytes]) -> str:
+        """업로드 스트림을 메모리에 모두 올리지 않고 임시 파일에 쓰면서 해시를 계산한 뒤 내용 주소로 옮기고,
+        썸네일을 만든 다음 digest를 반환"""
+        sha256 = hashlib.sha256()
+        received = 0
+        buffer = bytearray()
+        handle, temp_path = tempfile.mkstemp(dir=self.root, suffix=".upload")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                async for chunk in chunks:
+                    received += len(chunk)
+                    if received > self.max_bytes:
+                        raise AvatarTooLargeError(f"아바타 파일은 {self.max_bytes}바이트를 넘을 수 없습니다.")
+
+                    sha256.update(chunk)
+                    buffer += chunk
+                    if len(buffer) >= WRITE_BUFFER_SIZE:
+                        await asyncio.to_thread(file.write, bytes(buffer))
+                        buffer.clear()
+
+                if buffer:
+                    await asyncio.to_thread(file.write, bytes(buffer))
+
+            if received == 0:
+                raise InvalidImageError("업로드한 파일이 비어 있습니다.")
+
+            digest = sha256.hexdigest()
+            source_path = self.path(digest)
+            os.makedirs(os.path.dirname(source_path), exist_ok=True)
+            os.replace(temp_path, source_path)
+
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        await self.make_thumbnails(digest)
+        return digest
+
+    async def make_thumbnails(self, digest: str) -> None:
+        """없는 썸네일만 만들고, 같은 이미지를 동시에 처리하는 요청은 하나의 작업을 기다림"""
+        targets = [(size, self.path(digest, size)) for size in self.sizes
+                   if not os.path.exists(self.path(digest, size))]
+        if not targets:
+            return
+
+        future = self._processing.get(digest)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(
+                self.executor, _make_thumbnails, self.path(digest), targets, self.image_format, self.max_pixels)
+            self._processing[digest] = future
+            future.add_done_callback(lambda _: self._processing.pop(digest, None))
+
+        try:
+            await asyncio.shield(future)
+        except InvalidImageError:
+            if os.path.exists(self.path(digest)):
+                os.remove(self.path(digest))
+            raise
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,236 @@
+from email.mime.multipart import MIMEMultipart
+from util.structured_log import log_event
+from util.histogram import Histogram
+from typing import Any, Dict, List
+import smtplib
+import asyncio
+import logging
+import time
+import os
+
+
+class OutboxFullError(Exception):
+    """발송 대기열이 가득 참"""
+
+
+class OutgoingEmail:
+    recipient: str
+    message: MIMEMultipart
+    attempts: int
+    enqueued_at: float
+
+    def __init__(self, recipient: str, message: MIMEMultipart):
+        self.recipient = recipient
+        self.message = message
+        self.attempts = 0
+        self.enqueued_at = time.monotonic()
+
+
+class EmailOutbox(object):
+    """요청 처리와 분리된 백그라운드 메일 발송기
+    인증된 SMTP 연결 하나를 재사용하면서 대기열의 메일을 묶어서 발송하고, 실패하면 지수 백오프로 재시도"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use EmailOutbox.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """EmailOutbox의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.host = os.getenv("SMTP_HOST", "smtp.gmail.com")
+            cls._instance.port = int(os.getenv("SMTP_PORT", "465"))
+            cls._instance.security = os.getenv("SMTP_SECURITY", "ssl").lower()
+            cls._instance.max_size = int(os.getenv("OUTBOX_MAX_SIZE", "1000"))
+            cls._instance.batch_size = int(
+                os.getenv("OUTBOX_BATCH_SIZE", "20"))
+            cls._instance.max_retries = int(
+                os.getenv("OUTBOX_MAX_RETRIES", "5"))
+            cls._instance.retry_base = float(
+                os.getenv("OUTBOX_RETRY_BASE", "1"))
+            cls._instance.idle_timeout = float(
+                os.getenv("SMTP_IDLE_TIMEOUT", "60"))
+            cls._instance._queue = None
+            cls._instance._worker = None
+            cls._instance._smtp = None
+            cls._instance._retry_handles = set()
+            cls._instance.sent = 0
+            cls._instance.failed = 0
+            cls._instance.retries = 0
+            cls._instance.connects = 0
+            cls._instance.last_error = None
+            cls._instance.send_latency = Histogram()
+            cls._instance.delivery_latency = Histogram()
+
+        return cls._instance
+
+    @property
+    def sender(self) -> str:
+        return str(os.getenv("SENDER"))
+
+    def start(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, timeout: float = 10) -> None:
+        """남은 메일을 timeout 동안 발송한 뒤 워커와 SMTP 연결을 정리"""
+        if self._worker is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            log_event("email.unsent_on_shutdown", logging.WARNING, count=self._queue.qsize())
+
+        for handle in self._retry_handles:
+            handle.cancel()
+
+        self._retry_handles.clear()
+        self._worker.cancel()
+        self._worker = None
+        await asyncio.to_thread(self._close)
+
+    def enqueue(self, recipient: str, message: MIMEMultipart) -> None:
+        self.start()
+        try:
+            self._queue.put_nowait(OutgoingEmail(recipient, message))
+        except asyncio.QueueFull:
+            raise OutboxFullError("메일 발송 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), self.idle_timeout)
+            except asyncio.TimeoutError:
+                # 한동안 보낼 메일이 없으면 연결을 닫아서 서버 쪽 타임아웃을 피함
+                await asyncio.to_thread(self._close)
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                failures = await asyncio.to_thread(self._send_batch, batch)
+            except Exception as e:
+                for email in batch:
+                    email.attempts += 1
+                failures = [(email, e) for email in batch]
+
+            for email, error in failures:
+                self._schedule_retry(email, error)
+
+            for _ in batch:
+                self._queue.task_done()
+
+    def _schedule_retry(self, email: OutgoingEmail, error: Exception) -> None:
+        self.last_error = str(error)
+        if email.attempts >= self.max_retries:
+            self.failed += 1
+            log_event("email.failed", logging.ERROR, recipient=email.recipient, attempts=email.attempts, error=str(error))
+            return
+
+        self.retries += 1
+        delay = self.retry_base * (2 ** (email.attempts - 1))
+
+        def requeue():
+            self._retry_handles.discard(handle)
+            try:
+                self._queue.put_nowait(email)
+            except asyncio.QueueFull:
+                self.failed += 1
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retry_handles.add(handle)
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.security == "ssl":
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=30)
+            if self.security == "starttls":
+                smtp.starttls()
+
+        if self.security != "none" and os.getenv("APP_PASSWORD"):
+            smtp.login(self.sender, str(os.getenv("APP_PASSWORD")))
+
+        self.connects += 1
+        return smtp
+
+    def _ensure_connection(self) -> smtplib.SMTP:
+        """재사용 중인 연결이 살아있는지 NOOP으로 확인하고, 끊겼으면 다시 연결"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+
+            self._close()
+
+        self._smtp = self._connect()
+        return self._smtp
+
+    def _close(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+
+            self._smtp = None
+
+    def _send_batch(self, batch: List[OutgoingEmail]) -> List[tuple]:
+        """워커 스레드에서 실행, 실패한 (메일, 에러) 목록을 반환"""
+        failures = []
+        smtp = None
+        for index, email in enumerate(batch):
+            if smtp is None:
+                try:
+                    smtp = self._ensure_connection()
+                except (smtplib.SMTPException, OSError) as e:
+                    # 연결 자체가 안 되면 남은 메일은 모두 다음 재시도로 넘김
+                    for remaining in batch[index:]:
+                        remaining.attempts += 1
+                        failures.append((remaining, e))
+                    break
+
+            email.attempts += 1
+            started = time.perf_counter()
+            try:
+                smtp.sendmail(self.sender, email.recipient,
+                              email.message.as_string())
+
+            except (smtplib.SMTPServerDisconnected, OSError) as e:
+                self._close()
+                smtp = None
+                failures.append((email, e))
+                continue
+
+            except smtplib.SMTPException as e:
+                failures.append((email, e))
+                continue
+
+            self.sent += 1
+            self.send_latency.observe(time.perf_counter() - started)
+            self.delivery_latency.observe(time.monotonic() - email.enqueued_at)
+
+        return failures
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "retry_pending": len(self._retry_handles),
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+            "connects": self.connects,
+            "last_error": self.last_error,
+            "send_latency": self.send_latency.get_attributes(),
+            "delivery_latency": self.delivery_latency.get_attributes(),
+        }
@@ -0,0 +1,163 @@
+from model.friend import Friend, FriendStatus, FRIEND_PROFILE_SERIALIZER
+from model.response import ResponseStatusCode, Detail, Page
+from repository.friend_graph_cache import FriendGraphCache
+from repository.friend_repository import FriendRepository
+from util.structured_log import log_exception
+from model.serializer import format_datetime
+from typing import Any, Dict, List, Tuple
+from util.cursor import decode_cursor
+from collections import Counter
+from datetime import datetime
+from model.user import User
+
+MAX_PAGE_SIZE = 200
+MAX_SUGGESTIONS = 50
+
+
+class FriendService:
+    @staticmethod
+    def to_entries(rows: List[Tuple[User, datetime]]) -> List[Dict[str, Any]]:
+        return [{**FRIEND_PROFILE_SERIALIZER(user), "since": format_datetime(since)} for user, since in rows]
+
+    @staticmethod
+    async def request_friend(user: User, other_uuid: str) -> Tuple[ResponseStatusCode, Detail | Friend]:
+        try:
+            if other_uuid == user.user_uuid:
+                return (ResponseStatusCode.ENTITY_ERROR, Detail("자기 자신에게 친구 요청을 보낼 수 없습니다."))
+
+            if not await FriendRepository.find_users([other_uuid]):
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{other_uuid}' 유저를 찾을 수 없습니다."))
+
+            # 확인과 변경을 같은 잠금 안에서 해야 동시에 보낸 A -> B, B -> A 요청이 둘 다 대기 중으로 남지 않음
+            async with FriendRepository.lock_pair(user.user_uuid, other_uuid) as session:
+                relations = await FriendRepository.find_relations(session, user.user_uuid, other_uuid)
+                statuses = {friend.status for friend in relations}
+                sent = {friend.status for friend in relations if friend.transmit_user_uuid == user.user_uuid}
+                received = {friend.status for friend in relations if friend.transmit_user_uuid == other_uuid}
+                if FriendStatus.block in statuses:
+                    return (ResponseStatusCode.FORBIDDEN, Detail("차단된 유저에게는 친구 요청을 보낼 수 없습니다."))
+
+                if FriendStatus.accepted in statuses:
+                    return (ResponseStatusCode.CONFLICT, Detail("이미 친구인 유저입니다."))
+
+                if FriendStatus.pending in sent:
+                    return (ResponseStatusCode.CONFLICT, Detail("이미 친구 요청을 보냈습니다."))
+
+                # 상대방이 먼저 보낸 요청이 있으면 바로 수락
+                accepted = FriendStatus.pending in received
+                if accepted:
+                    friend = await FriendRepository.set_status(session, other_uuid, user.user_uuid, FriendStatus.accepted)
+                else:
+                    friend = await FriendRepository.set_status(session, user.user_uuid, other_uuid, FriendStatus.pending)
+
+            if not accepted:
+                return (ResponseStatusCode.CREATED, friend)
+
+            # 커밋한 뒤에 무효화해야 그 사이에 이전 관계로 캐시가 다시 채워지지 않음
+            FriendGraphCache.get_instance().invalidate(user.user_uuid, other_uuid)
+            return (ResponseStatusCode.SUCCESS, friend)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def answer_request(user: User, other_uuid: str, status: FriendStatus) -> Tuple[ResponseStatusCode, Detail | Friend]:
+        """받은 친구 요청을 수락(accepted) 또는 거절(rejected)"""
+        try:
+            async with FriendRepository.lock_pair(user.user_uuid, other_uuid) as session:
+                relations = await FriendRepository.find_relations(session, user.user_uuid, other_uuid)
+                if not any(friend.transmit_user_uuid == other_uuid and friend.status == FriendStatus.pending
+                           for friend in relations):
+                    return (ResponseStatusCode.NOT_FOUND, Detail(f"'{other_uuid}' 유저에게 받은 친구 요청이 없습니다."))
+
+                friend = await FriendRepository.set_status(session, other_uuid, user.user_uuid, status)
+
+            FriendGraphCache.get_instance().invalidate(user.user_uuid, other_uuid)
+            return (ResponseStatusCode.SUCCESS, friend)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def block_user(user: User, other_uuid: str) -> Tuple[ResponseStatusCode, Detail | Friend]:
+        """기존 관계를 모두 정리하고 user -> other 방향으로 차단"""
+        try:
+            if other_uuid == user.user_uuid:
+                return (ResponseStatusCode.ENTITY_ERROR, Detail("자기 자신을 차단할 수 없습니다."))
+
+            if not await FriendRepository.find_users([other_uuid]):
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{other_uuid}' 유저를 찾을 수 없습니다."))
+
+            # 상대방이 동시에 보낸 요청이나 차단이 정리된 관계 옆에 새로 생기지 않도록 같은 잠금 안에서 변경
+            async with FriendRepository.lock_pair(user.user_uuid, other_uuid) as session:
+                await FriendRepository.delete_relation(session, other_uuid, user.user_uuid)
+                friend = await FriendRepository.set_status(session, user.user_uuid, other_uuid, FriendStatus.block)
+
+            FriendGraphCache.get_instance().invalidate(user.user_uuid, other_uuid)
+            return (ResponseStatusCode.SUCCESS, friend)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def list_friends(user: User, cursor: str | None = None, limit: int = 50, received: bool = False) -> Tuple[ResponseStatusCode, Detail | Page]:
+        """received가 True면 받은 친구 요청 목록을 조회"""
+        try:
+            try:
+                after = decode_cursor(cursor, 1)[0] if cursor else None
+            except ValueError as e:
+                return (ResponseStatusCode.ENTITY_ERROR, Detail(str(e)))
+
+            limit = max(1, min(limit, MAX_PAGE_SIZE))
+            if received:
+                rows, next_cursor = await FriendRepository.list_received_requests(user.user_uuid, after, limit)
+            else:
+                rows, next_cursor = await FriendRepository.list_friends(user.user_uuid, after, limit)
+
+            return (ResponseStatusCode.SUCCESS, Page(FriendService.to_entries(rows), next_cursor))
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def mutual_friends(user: User, other_uuid: str) -> Tuple[ResponseStatusCode, Detail | List[Dict[str, Any]]]:
+        try:
+            graph = await FriendGraphCache.get_instance().neighbors_many([user.user_uuid, other_uuid])
+            mutual = sorted(graph[user.user_uuid] & graph[other_uuid])
+            users = await FriendRepository.find_users(mutual)
+            return (ResponseStatusCode.SUCCESS, [FRIEND_PROFILE_SERIALIZER(users[uuid]) for uuid in mutual if uuid in users])
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def suggest_friends(user: User, limit: int = 10) -> Tuple[ResponseStatusCode, Detail | List[Dict[str, Any]]]:
+        """친구의 친구를 함께 아는 친구 수가 많은 순서로 추천 (이미 관계가 있는 유저는 제외)"""
+        try:
+            graph = FriendGraphCache.get_instance()
+            friends = await graph.neighbors(user.user_uuid)
+            mutual_counts = Counter()
+            for friends_of_friend in (await graph.neighbors_many(friends)).values():
+                mutual_counts.update(friends_of_friend)
+
+            excluded = friends | await FriendRepository.find_related_uuids(user.user_uuid)
+            candidates = sorted(
+                ((count, uuid) for uuid, count in mutual_counts.items()
+                 if uuid != user.user_uuid and uuid not in excluded),
+                key=lambda candidate: (-candidate[0], candidate[1]),
+            )[:max(1, min(limit, MAX_SUGGESTIONS))]
+
+            users = await FriendRepository.find_users(uuid for _, uuid in candidates)
+            return (ResponseStatusCode.SUCCESS, [
+                {**FRIEND_PROFILE_SERIALIZER(users[uuid]), "mutual_count": count}
+                for count, uuid in candidates if uuid in users
+            ])
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
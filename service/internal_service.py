@@ -0,0 +1,64 @@
+from util.request_metrics import RequestMetrics, render_histogram
+from model.response import ResponseStatusCode, Detail
+from service.email_outbox import EmailOutbox
+from service.rate_limiter import RateLimiter
+from service.room_broker import RoomBroker
+from database.connection import DBObject
+from typing import Any, Dict, Tuple
+from fastapi import Header
+import hmac
+import os
+
+
+class InternalService:
+    @staticmethod
+    def verify_internal_token(x_internal_token: str | None = Header(default=None)) -> Tuple[ResponseStatusCode, Detail | None]:
+        """INTERNAL_API_TOKEN이 설정되어 있고 X-Internal-Token 헤더와 일치할 때만 허용"""
+        internal_token = os.getenv("INTERNAL_API_TOKEN")
+        if not internal_token:
+            return (ResponseStatusCode.NOT_FOUND, Detail("내부 API가 비활성화되어 있습니다."))
+
+        if not x_internal_token or not hmac.compare_digest(x_internal_token, internal_token):
+            return (ResponseStatusCode.FORBIDDEN, Detail("내부 API 토큰이 올바르지 않습니다."))
+
+        return (ResponseStatusCode.SUCCESS, None)
+
+    @staticmethod
+    def verify_metrics_token(authorization: str | None = Header(default=None), x_internal_token: str | None = Header(default=None)) -> Tuple[ResponseStatusCode, Detail | None]:
+        """Prometheus는 토큰을 Authorization: Bearer 헤더로 보내므로 X-Internal-Token과 함께 허용"""
+        if not x_internal_token and authorization and authorization.lower().startswith("bearer "):
+            x_internal_token = authorization[7:]
+
+        return InternalService.verify_internal_token(x_internal_token)
+
+    @staticmethod
+    def get_pool_stats() -> Dict[str, Any]:
+        return DBObject.get_instance().pool_stats()
+
+    @staticmethod
+    def get_outbox_stats() -> Dict[str, Any]:
+        return EmailOutbox.get_instance().stats()
+
+    @staticmethod
+    def get_broker_stats() -> Dict[str, Any]:
+        return RoomBroker.get_instance().stats()
+
+    @staticmethod
+    def get_rate_limit_stats() -> Dict[str, Any]:
+        return RateLimiter.get_instance().stats()
+
+    @staticmethod
+    def get_metrics() -> str:
+        db = DBObject.get_instance()
+        extra = [
+            "# HELP tdls_db_query_duration_seconds 쿼리 실행 시간 (요청 밖에서 실행한 쿼리 포함)",
+            "# TYPE tdls_db_query_duration_seconds histogram",
+            *render_histogram("tdls_db_query_duration_seconds", db.query_monitor.duration),
+            "# HELP tdls_db_pool_wait_seconds 커넥션 풀에서 커넥션을 얻기까지 기다린 시간",
+            "# TYPE tdls_db_pool_wait_seconds histogram",
+            *render_histogram("tdls_db_pool_wait_seconds", db.pool_monitor.wait_time, 'engine="sync"'),
+        ]
+        if db._async_engine is not None:
+            extra += render_histogram("tdls_db_pool_wait_seconds", db.async_pool_monitor.wait_time, 'engine="async"')
+
+        return RequestMetrics.get_instance().render_prometheus(extra)
@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor
+from util.structured_log import log_event
+from passlib.context import CryptContext
+from typing import Dict, Tuple
+from collections import deque
+import asyncio
+import logging
+import hmac
+import time
+import os
+
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+)
+
+
+def _hash_password(plain_password: str) -> str:
+    return pwd_context.hash(plain_password)
+
+
+def _verify_and_update(plain_password: str, stored_password: str) -> Tuple[bool, str | None]:
+    """비밀번호를 한 번만 검증하고, 해시 설정(rounds 등)이 바뀌었으면 새 해시를 함께 반환"""
+    if pwd_context.identify(stored_password, required=False) is None:
+        # 해싱 도입 이전에 평문으로 저장된 비밀번호는 비교 후 바로 해시로 교체
+        verified = hmac.compare_digest(
+            plain_password.encode(), stored_password.encode())
+        return (verified, pwd_context.hash(plain_password) if verified else None)
+
+    return pwd_context.verify_and_update(plain_password, stored_password)
+
+
+class PasswordHasherBusyError(Exception):
+    """대기열이 가득 차서 해싱 요청을 받을 수 없음"""
+
+
+class PasswordTiming:
+    operation: str
+    wait_time: float
+    run_time: float
+
+    def __init__(self, operation: str, wait_time: float, run_time: float):
+        self.operation = operation
+        self.wait_time = wait_time
+        self.run_time = run_time
+
+    def get_attributes(self) -> Dict[str, float | str]:
+        return {
+            "operation": self.operation,
+            "wait_ms": round(self.wait_time * 1000, 3),
+            "run_ms": round(self.run_time * 1000, 3),
+        }
+
+
+class PasswordHasher(object):
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use PasswordHasher.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """PasswordHasher의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            workers = int(os.getenv("PASSWORD_HASH_WORKERS",
+                          str(min(4, os.cpu_count() or 1))))
+
+            cls._instance = object.__new__(cls)
+            cls._instance.workers = workers
+            cls._instance.concurrency = int(
+                os.getenv("PASSWORD_HASH_CONCURRENCY", str(workers)))
+            cls._instance.queue_limit = int(
+                os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "64"))
+            cls._instance._executor = None
+            cls._instance._semaphore = None
+            cls._instance._waiting = 0
+            cls._instance._rejected = 0
+            cls._instance._timings = deque(maxlen=256)
+
+        return cls._instance
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        return self._executor
+
+    async def _run(self, operation: str, func, *args):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        if self._semaphore.locked() and self._waiting >= self.queue_limit:
+            self._rejected += 1
+            raise PasswordHasherBusyError("비밀번호 처리 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요.")
+
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        try:
+            started_at = time.perf_counter()
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+            finished_at = time.perf_counter()
+
+        finally:
+            self._semaphore.release()
+
+        timing = PasswordTiming(
+            operation, started_at - queued_at, finished_at - started_at)
+        self._timings.append(timing)
+        log_event("password.timing", logging.DEBUG, **timing.get_attributes())
+        return result
+
+    async def hash(self, plain_password: str) -> str:
+        return await self._run("hash", _hash_password, plain_password)
+
+    async def verify(self, plain_password: str, stored_password: str) -> Tuple[bool, str | None]:
+        """(검증 결과, 교체할 새 해시 또는 None)을 반환"""
+        return await self._run("verify", _verify_and_update, plain_password, stored_password)
+
+    def recent_timings(self) -> list:
+        return [timing.get_attributes() for timing in self._timings]
+
+    def stats(self) -> Dict[str, float | int]:
+        run_times = [timing.run_time for timing in self._timings]
+        wait_times = [timing.wait_time for timing in self._timings]
+        return {
+            "workers": self.workers,
+            "concurrency": self.concurrency,
+            "queue_limit": self.queue_limit,
+            "waiting": self._waiting,
+            "rejected": self._rejected,
+            "avg_run_ms": round(sum(run_times) / len(run_times) * 1000, 3) if run_times else 0.0,
+            "max_run_ms": round(max(run_times) * 1000, 3) if run_times else 0.0,
+            "avg_wait_ms": round(sum(wait_times) / len(wait_times) * 1000, 3) if wait_times else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,188 @@
+from util.structured_log import log_event
+from typing import Callable, Dict, Tuple
+from abc import ABC, abstractmethod
+from fastapi import Form, Request
+from model.user import LoginModel
+import asyncio
+import logging
+import math
+import time
+import os
+
+
+class RateLimitExceededError(Exception):
+    """요청 한도를 초과함, retry_after초 뒤에 다시 시도할 수 있음"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("요청이 너무 많습니다. 잠시 후 다시 시도하세요.")
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class RateLimitRule:
+    """limit번의 요청을 period초 동안 허용하는 토큰 버킷 (한 번에 최대 limit번까지 몰아서 허용)"""
+    name: str
+    limit: int
+    period: float
+
+    def __init__(self, name: str, limit: int, period: float):
+        self.name = name
+        self.limit = limit
+        self.period = period
+        # 토큰 하나가 다시 채워지는 시간
+        self.interval = period / limit if limit > 0 else 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0
+
+    @classmethod
+    def from_env(cls, name: str, default: str) -> "RateLimitRule":
+        """RATE_LIMIT_<NAME> = "횟수/초" (횟수가 0이면 제한하지 않음)"""
+        limit, period = os.getenv(f"RATE_LIMIT_{name.upper()}", default).split("/")
+        return cls(name, int(limit), float(period))
+
+
+class RateLimiter(ABC):
+    """요청 한도 저장소 인터페이스 (RATE_LIMIT_BACKEND=memory)
+    여러 워커가 한도를 공유하는 백엔드는 hit()을 외부 저장소에서 원자적으로 처리하도록 구현"""
+    _instance = None
+
+    def __init__(self, max_keys: int, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.clock = clock
+        self.allowed = 0
+        self.limited = 0
+        self._sweeper = None
+
+    @classmethod
+    def get_instance(cls) -> "RateLimiter":
+        """환경 변수에 맞는 저장소의 싱글턴 인스턴스를 반환"""
+        if RateLimiter._instance is None:
+            backend = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+            if backend != "memory":
+                raise ValueError(
+                    f"RATE_LIMIT_BACKEND '{backend}'는 지원하지 않습니다. memory만 사용할 수 있습니다.")
+
+            RateLimiter._instance = MemoryRateLimiter(
+                max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000")))
+
+        return RateLimiter._instance
+
+    @abstractmethod
+    async def hit(self, rule: RateLimitRule, key: str) -> float:
+        """토큰 하나를 사용하고, 남은 토큰이 없으면 사용하지 않고 다시 시도할 수 있을 때까지의 시간(초)을 반환 (허용하면 0)"""
+
+    async def purge_expired(self) -> int:
+        return 0
+
+    async def check(self, rule: RateLimitRule, key: str | None) -> None:
+        if not rule.enabled or not key:
+            return
+
+        retry_after = await self.hit(rule, key)
+        if retry_after > 0:
+            self.limited += 1
+            raise RateLimitExceededError(retry_after)
+
+        self.allowed += 1
+
+    def start_sweeper(self, interval: float | None = None) -> None:
+        """버킷이 다시 가득 찬 키를 주기적으로 지우는 백그라운드 작업을 시작"""
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+
+        interval = interval or float(
+            os.getenv("RATE_LIMIT_SWEEP_INTERVAL", "60"))
+
+        async def sweep():
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.purge_expired()
+                except Exception as e:
+                    log_event("rate_limit.purge_failed", logging.ERROR, error=str(e))
+
+        self._sweeper = asyncio.get_running_loop().create_task(sweep())
+
+    def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"allowed": self.allowed, "limited": self.limited, "max_keys": self.max_keys}
+
+
+class MemoryRateLimiter(RateLimiter):
+    """프로세스 내 저장소 (워커마다 한도를 따로 계산하므로 전체 한도는 워커 수만큼 늘어남)
+    키마다 버킷이 다시 가득 차는 시각 하나만 저장 (GCRA): 남은 토큰 = limit - (가득 차는 시각 - 현재) / interval"""
+
+    def __init__(self, max_keys: int, clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_keys, clock)
+        self.evictions = 0
+        self._full_at: Dict[Tuple[str, str], float] = {}
+
+    async def hit(self, rule: RateLimitRule, key: str) -> float:
+        now = self.clock()
+        bucket = (rule.name, key)
+        full_at = max(self._full_at.get(bucket, now), now)
+        # 토큰 하나를 쓰면 가득 차는 시각이 interval만큼 늦어지고, period를 넘으면 토큰이 없는 상태
+        retry_after = full_at + rule.interval - now - rule.period
+        if retry_after > 0:
+            return retry_after
+
+        if bucket not in self._full_at and len(self._full_at) >= self.max_keys:
+            await self.purge_expired()
+            if len(self._full_at) >= self.max_keys:
+                # 그래도 가득 차 있으면 가장 먼저 추가된 키부터 버림 (그 키는 한도가 초기화됨)
+                del self._full_at[next(iter(self._full_at))]
+                self.evictions += 1
+
+        self._full_at[bucket] = full_at + rule.interval
+        return 0.0
+
+    async def purge_expired(self) -> int:
+        """버킷이 가득 찬 키는 처음 보는 키와 같으므로 지워도 결과가 달라지지 않음"""
+        now = self.clock()
+        expired = [bucket for bucket, full_at in self._full_at.items() if full_at <= now]
+        for bucket in expired:
+            del self._full_at[bucket]
+
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        return {**super().stats(), "keys": len(self._full_at), "evictions": self.evictions}
+
+
+LOGIN_IP = RateLimitRule.from_env("login_ip", "20/60")
+LOGIN_ACCOUNT = RateLimitRule.from_env("login_account", "10/300")
+EMAIL_IP = RateLimitRule.from_env("email_ip", "10/600")
+EMAIL_ADDRESS = RateLimitRule.from_env("email_address", "3/600")
+
+
+def client_ip(request: Request) -> str | None:
+    """프록시 뒤에서는 uvicorn이 FORWARDED_ALLOW_IPS에 해당하는 X-Forwarded-For로 client를 바꿔 줌"""
+    return request.client.host if request.client else None
+
+
+class RateLimit:
+    """비밀번호 해싱이나 메일 발송 전에 IP와 대상 계정별 한도를 확인하는 의존성
+    (dependencies=[Depends(RateLimit.login)]), 초과하면 RateLimitExceededError로 429를 반환"""
+
+    @staticmethod
+    async def login(request: Request, form_data: LoginModel) -> None:
+        limiter = RateLimiter.get_instance()
+        await limiter.check(LOGIN_IP, client_ip(request))
+        await limiter.check(LOGIN_ACCOUNT, form_data.user_id)
+
+    @staticmethod
+    async def token(request: Request, username: str = Form()) -> None:
+        limiter = RateLimiter.get_instance()
+        await limiter.check(LOGIN_IP, client_ip(request))
+        await limiter.check(LOGIN_ACCOUNT, username)
+
+    @staticmethod
+    async def email(request: Request, email: str) -> None:
+        limiter = RateLimiter.get_instance()
+        await limiter.check(EMAIL_IP, client_ip(request))
+        await limiter.check(EMAIL_ADDRESS, email.strip().lower())
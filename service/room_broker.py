@@ -0,0 +1,145 @@
+from model.response import orjson, serialize_default
+from typing import Any, Dict, Iterable, Set
+from abc import ABC, abstractmethod
+import asyncio
+import json
+import os
+
+# 구독자에게 보내는 제어 메시지
+RESYNC = '{"type":"resync"}'
+CLOSE = None
+
+
+class Subscription:
+    """한 소켓이 구독하는 방 목록과 보낼 메시지 대기열
+    대기열이 가득 차면(느린 소비자) 밀린 메시지를 버리고 resync 한 건만 남겨서 클라이언트가 다시 조회하도록 함"""
+
+    def __init__(self, room_uuids: Iterable[str], queue_size: int):
+        self.room_uuids = frozenset(room_uuids)
+        self.lagging = False
+        self.dropped = 0
+        self.resyncs = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, payload: str | None) -> None:
+        if payload is CLOSE:
+            self._clear()
+            self._queue.put_nowait(CLOSE)
+            return
+
+        if self.lagging:
+            self.dropped += 1
+            return
+
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.dropped += self._clear() + 1
+            self._queue.put_nowait(RESYNC)
+            self.lagging = True
+            self.resyncs += 1
+
+    async def get(self) -> str | None:
+        """다음 메시지를 반환하고, 구독이 끝났으면 None"""
+        payload = await self._queue.get()
+        if payload == RESYNC:
+            self.lagging = False
+
+        return payload
+
+    def _clear(self) -> int:
+        cleared = 0
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            cleared += 1
+
+        return cleared
+
+
+class RoomBroker(ABC):
+    """방 단위로 변경 사항을 구독자에게 전달하는 브로커 인터페이스 (ROOM_BROKER=memory)
+    여러 워커에서 공유하는 백엔드는 publish()에서 외부 메시지 버스로 보내고,
+    버스에서 받은 메시지를 각 워커가 deliver()로 자기 구독자에게 전달하도록 구현"""
+    _instance = None
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.published = 0
+        self.delivered = 0
+        self._rooms: Dict[str, Set[Subscription]] = {}
+        self._subscriptions: Set[Subscription] = set()
+
+    @classmethod
+    def get_instance(cls) -> "RoomBroker":
+        """환경 변수에 맞는 브로커의 싱글턴 인스턴스를 반환"""
+        if RoomBroker._instance is None:
+            backend = os.getenv("ROOM_BROKER", "memory").lower()
+            if backend != "memory":
+                raise ValueError(
+                    f"ROOM_BROKER '{backend}'는 지원하지 않습니다. memory만 사용할 수 있습니다.")
+
+            RoomBroker._instance = InProcessRoomBroker(
+                queue_size=int(os.getenv("ROOM_BROKER_QUEUE_SIZE", "256")))
+
+        return RoomBroker._instance
+
+    @staticmethod
+    def encode(event: str, room_uuid: str, data: Any) -> str:
+        message = {"type": event, "room_uuid": room_uuid, "data": data}
+        if orjson is not None:
+            return orjson.dumps(message, default=serialize_default).decode()
+
+        return json.dumps(message, default=serialize_default, ensure_ascii=False, separators=(",", ":"))
+
+    def subscribe(self, room_uuids: Iterable[str]) -> Subscription:
+        subscription = Subscription(room_uuids, self.queue_size)
+        self._subscriptions.add(subscription)
+        for room_uuid in subscription.room_uuids:
+            self._rooms.setdefault(room_uuid, set()).add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        for room_uuid in subscription.room_uuids:
+            subscribers = self._rooms.get(room_uuid)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._rooms[room_uuid]
+
+    @abstractmethod
+    def publish(self, room_uuid: str, event: str, data: Any) -> None:
+        """요청 처리 경로에서 호출되므로 기다리지 않음"""
+
+    def deliver(self, room_uuid: str, payload: str) -> None:
+        """한 번 인코딩한 메시지를 이 워커의 구독자 대기열에 넣음"""
+        for subscription in self._rooms.get(room_uuid, ()):
+            subscription.push(payload)
+            self.delivered += 1
+
+    def close(self) -> None:
+        """서버 종료 시 모든 구독을 끝냄"""
+        for subscription in list(self._subscriptions):
+            subscription.push(CLOSE)
+            self.unsubscribe(subscription)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscriptions": len(self._subscriptions),
+            "rooms": len(self._rooms),
+            "published": self.published,
+            "delivered": self.delivered,
+            "lagging": sum(1 for subscription in self._subscriptions if subscription.lagging),
+            "dropped": sum(subscription.dropped for subscription in self._subscriptions),
+            "resyncs": sum(subscription.resyncs for subscription in self._subscriptions),
+        }
+
+
+class InProcessRoomBroker(RoomBroker):
+    """프로세스 내 브로커 (워커가 하나일 때만 모든 구독자에게 전달됨)"""
+
+    def publish(self, room_uuid: str, event: str, data: Any) -> None:
+        self.published += 1
+        if room_uuid in self._rooms:
+            self.deliver(room_uuid, RoomBroker.encode(event, room_uuid, data))
@@ -0,0 +1,105 @@
+from repository.room_change_repository import RoomChangeRepository, StaleCursorError
+from repository.category_repository import CategoryRepository
+from model.category import Category, CreateCategoryModel
+from model.room_change import ChangeSet, ChangeOperation
+from model.response import ResponseStatusCode, Detail
+from repository.room_repository import RoomRepository
+from util.cursor import encode_cursor, decode_cursor
+from util.structured_log import log_exception
+from model.room import Room, CreateRoomModel
+from service.room_broker import RoomBroker
+from model.user import User
+from typing import Tuple
+
+MAX_CHANGES = 1000
+
+
+class RoomService:
+    @staticmethod
+    async def create_room(user: User, form: CreateRoomModel) -> Tuple[ResponseStatusCode, Detail | Room]:
+        try:
+            room = Room(form.room_name)
+            await RoomRepository.create_room(room, user.user_uuid)
+            return (ResponseStatusCode.CREATED, room)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def get_version(user: User, room_uuid: str) -> Tuple[ResponseStatusCode, Detail | int]:
+        """방 내용의 ETag 버전, 내용을 조회하기 전에 호출하므로 그 사이에 바뀌면 ETag가 내용보다 오래된 쪽이 되어
+        다음 요청에서 다시 200을 받을 뿐 바뀐 내용을 304로 놓치지는 않음"""
+        try:
+            version = await RoomRepository.find_room_version(room_uuid, user.user_uuid)
+            if version is None:
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            return (ResponseStatusCode.SUCCESS, version)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def get_dashboard(user: User, room_uuid: str, member_checked: bool = False) -> Tuple[ResponseStatusCode, Detail | Room]:
+        """member_checked: 같은 요청에서 get_version으로 참여 여부를 이미 확인했으면 다시 조회하지 않음"""
+        try:
+            if not member_checked and not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            room = await RoomRepository.find_dashboard(room_uuid)
+            if not room:
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{room_uuid}' 방을 찾을 수 없습니다."))
+
+            return (ResponseStatusCode.SUCCESS, room)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def get_changes(user: User, room_uuid: str, cursor: str | None = None, limit: int = 500) -> Tuple[ResponseStatusCode, Detail | ChangeSet]:
+        """cursor 이후에 생성/수정/삭제된 할 일과 카테고리 (cursor가 없으면 전체, 정리된 삭제 기록보다 오래된 cursor는 GONE)"""
+        try:
+            if not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            try:
+                after = int(decode_cursor(cursor, 1)[0]) if cursor else 0
+            except (ValueError, TypeError) as e:
+                return (ResponseStatusCode.ENTITY_ERROR, Detail(str(e)))
+
+            changes, rows, has_more = await RoomChangeRepository.list_changes(
+                room_uuid, after, max(1, min(limit, MAX_CHANGES)))
+            deleted = {"task": [], "category": []}
+            for change in changes:
+                if change.operation == ChangeOperation.delete:
+                    deleted[change.entity].append(change.entity_uuid)
+
+            next_cursor = encode_cursor([changes[-1].seq if changes else after])
+            return (ResponseStatusCode.SUCCESS, ChangeSet(
+                rows["task"], rows["category"], deleted["task"], deleted["category"], next_cursor, has_more))
+
+        except StaleCursorError:
+            # 그동안 지워진 항목을 알 수 없으므로 클라이언트는 가진 목록을 버리고 커서 없이 다시 받아야 함
+            return (ResponseStatusCode.GONE, Detail("동기화한 지 너무 오래되었습니다. 가진 목록을 지우고 커서 없이 다시 동기화하세요."))
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def create_category(user: User, room_uuid: str, form: CreateCategoryModel) -> Tuple[ResponseStatusCode, Detail | Category]:
+        try:
+            if not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            category = Category(form.category_name, user.user_uuid, room_uuid)
+            await CategoryRepository.create_category(category)
+            RoomBroker.get_instance().publish(room_uuid, "category.created", category.get_attributes())
+            return (ResponseStatusCode.CREATED, category)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
@@ -0,0 +1,65 @@
+from service.room_broker import RoomBroker, Subscription
+from model.response import ResponseStatusCode, Detail
+from repository.room_repository import RoomRepository
+from util.structured_log import log_exception
+from service.user_service import UserService
+from service.auth_service import AuthService
+from model.user import User
+from typing import Tuple
+import time
+
+# 연결 중에 다시 확인해서 끊을 때 쓰는 웹소켓 종료 코드 (HTTP 401/403에 대응)
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN = 4403
+
+
+class RoomSyncService:
+    @staticmethod
+    async def authenticate(token: str) -> Tuple[ResponseStatusCode, Detail | User]:
+        """연결을 수락하기 전에 토큰을 확인"""
+        return await UserService.get_current_user(token)
+
+    @staticmethod
+    async def subscribe(user: User) -> Tuple[ResponseStatusCode, Detail | Subscription]:
+        """유저가 참여한 모든 방을 구독 (연결 이후에 참여한 방은 다시 연결해야 받을 수 있음)"""
+        try:
+            room_uuids = await RoomRepository.list_room_uuids(user.user_uuid)
+            return (ResponseStatusCode.SUCCESS, RoomBroker.get_instance().subscribe(room_uuids))
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    def next_check_in(token: str, interval: float) -> float:
+        """다음 확인까지 기다릴 시간(초), 토큰이 그 전에 만료되면 만료 시각에 맞춰 확인"""
+        try:
+            expires_in = AuthService.decode_claims(token)["exp"] - time.time()
+        except Exception:
+            expires_in = 0
+
+        return max(1.0, min(interval, expires_in))
+
+    @staticmethod
+    async def recheck(token: str, subscription: Subscription) -> int | None:
+        """연결을 유지해도 되는지 다시 확인하고, 끊어야 하면 웹소켓 종료 코드를 반환
+        토큰이 만료/폐기되었거나 유저가 없어졌으면 CLOSE_UNAUTHORIZED, 구독 중인 방에서 나갔으면 CLOSE_FORBIDDEN
+        DB 장애처럼 확인하지 못한 경우는 연결을 유지하고 다음 확인에서 다시 판단"""
+        try:
+            status_code, user = await UserService.get_current_user(token)
+            if isinstance(user, Detail):
+                return None if status_code.value >= 500 else CLOSE_UNAUTHORIZED
+
+            room_uuids = await RoomRepository.list_room_uuids(user.user_uuid)
+            if not subscription.room_uuids <= set(room_uuids):
+                return CLOSE_FORBIDDEN
+
+            return None
+
+        except Exception as e:
+            log_exception(e)
+            return None
+
+    @staticmethod
+    def unsubscribe(subscription: Subscription) -> None:
+        RoomBroker.get_instance().unsubscribe(subscription)
@@ -0,0 +1,186 @@
+from model.task import Task, CreateTaskModel, UpdateTaskModel, BatchTaskModel, BatchTaskOperation, TASK_SERIALIZER
+from model.response import ResponseStatusCode, Detail, Page
+from repository.task_repository import TaskRepository
+from repository.room_repository import RoomRepository
+from util.structured_log import log_exception
+from model.serializer import format_datetime
+from service.room_broker import RoomBroker
+from typing import Any, Dict, List, Tuple
+from util.cursor import decode_cursor
+from types import SimpleNamespace
+from datetime import datetime
+from model.user import User
+import uuid
+
+MAX_PAGE_SIZE = 200
+
+
+class TaskService:
+    @staticmethod
+    async def list_tasks(user: User, room_uuid: str, category_uuid: str | None = None, cursor: str | None = None, limit: int = 50, member_checked: bool = False) -> Tuple[ResponseStatusCode, Detail | Page]:
+        """member_checked: 같은 요청에서 RoomService.get_version으로 참여 여부를 이미 확인했으면 다시 조회하지 않음"""
+        try:
+            if not member_checked and not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            try:
+                after = decode_cursor(cursor, 3) if cursor else None
+            except ValueError as e:
+                return (ResponseStatusCode.ENTITY_ERROR, Detail(str(e)))
+
+            tasks, next_cursor = await TaskRepository.list_tasks(
+                room_uuid, category_uuid, after, max(1, min(limit, MAX_PAGE_SIZE)))
+            return (ResponseStatusCode.SUCCESS, Page(tasks, next_cursor))
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def create_task(user: User, room_uuid: str, form: CreateTaskModel) -> Tuple[ResponseStatusCode, Detail | Task]:
+        try:
+            if not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            if not await RoomRepository.check_category_in_room(room_uuid, form.category_uuid):
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{form.category_uuid}' 카테고리를 찾을 수 없습니다."))
+
+            task = Task(form.title, form.content, form.category_uuid,
+                        user.user_uuid, room_uuid, end_at=form.end_at)
+            await TaskRepository.create_task(task)
+            RoomBroker.get_instance().publish(room_uuid, "task.created", task.get_attributes())
+            return (ResponseStatusCode.CREATED, task)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def update_task(user: User, room_uuid: str, task_uuid: str, form: UpdateTaskModel) -> Tuple[ResponseStatusCode, Detail | Task]:
+        try:
+            if not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            task = await TaskRepository.find_task(room_uuid, task_uuid)
+            if not task:
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{task_uuid}' 할 일을 찾을 수 없습니다."))
+
+            task_data = form.model_dump(exclude_none=True)
+            if "category_uuid" in task_data and not await RoomRepository.check_category_in_room(room_uuid, task_data["category_uuid"]):
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{task_data['category_uuid']}' 카테고리를 찾을 수 없습니다."))
+
+            task = await TaskRepository.update_task(task, task_data)
+            # 바뀐 필드만 전달
+            attributes = task.get_attributes()
+            RoomBroker.get_instance().publish(room_uuid, "task.updated", {
+                key: attributes[key] for key in ("task_uuid", "updated_at", *task_data)})
+            return (ResponseStatusCode.SUCCESS, task)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def delete_task(user: User, room_uuid: str, task_uuid: str) -> Tuple[ResponseStatusCode, Detail | None]:
+        try:
+            if not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            task = await TaskRepository.find_task(room_uuid, task_uuid)
+            if not task:
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{task_uuid}' 할 일을 찾을 수 없습니다."))
+
+            await TaskRepository.delete_task(task)
+            RoomBroker.get_instance().publish(room_uuid, "task.deleted", {"task_uuid": task_uuid})
+            return (ResponseStatusCode.SUCCESS, None)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def apply_batch(user: User, room_uuid: str, form: BatchTaskModel) -> Tuple[ResponseStatusCode, Detail | List[Dict[str, Any]]]:
+        """여러 작업을 검증한 뒤 한 트랜잭션으로 반영하고 작업별 결과를 순서대로 반환
+        검증은 카테고리/할 일 존재 여부를 IN 쿼리 한 번씩으로 확인"""
+        try:
+            if not await RoomRepository.check_room_member(room_uuid, user.user_uuid):
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{room_uuid}' 방에 참여하지 않은 유저입니다."))
+
+            operations = form.operations
+            category_uuids = {operation.category_uuid for operation in operations
+                              if operation.op != "delete" and operation.category_uuid}
+            task_uuids = {operation.task_uuid for operation in operations
+                          if operation.op != "create" and operation.task_uuid}
+            categories = await RoomRepository.find_category_uuids(room_uuid, category_uuids) if category_uuids else set()
+            existing = await TaskRepository.find_task_uuids(room_uuid, task_uuids) if task_uuids else set()
+
+            now = datetime.now()
+            creates: List[Dict[str, Any]] = []
+            updates: Dict[str, Dict[str, Any]] = {}
+            deletes: List[str] = []
+            results: List[Dict[str, Any]] = []
+
+            def fail(index: int, operation: BatchTaskOperation, status_code: ResponseStatusCode, detail: str):
+                results.append({"index": index, "op": operation.op, "task_uuid": operation.task_uuid,
+                                "status_code": status_code.value, "detail": detail})
+
+            for index, operation in enumerate(operations):
+                fields = operation.model_dump(
+                    exclude_none=True, include={"title", "content", "category_uuid", "end_at"})
+                if "category_uuid" in fields and fields["category_uuid"] not in categories:
+                    fail(index, operation, ResponseStatusCode.NOT_FOUND,
+                         f"'{fields['category_uuid']}' 카테고리를 찾을 수 없습니다.")
+                    continue
+
+                if operation.op == "create":
+                    if not all(key in fields for key in ("title", "content", "category_uuid")):
+                        fail(index, operation, ResponseStatusCode.ENTITY_ERROR, "title, content, category_uuid가 필요합니다.")
+                        continue
+
+                    task_uuid = str(uuid.uuid4())
+                    creates.append({"task_uuid": task_uuid, "user_uuid": user.user_uuid, "room_uuid": room_uuid,
+                                    "created_at": now, "updated_at": now, "end_at": now, **fields})
+                    results.append({"index": index, "op": operation.op, "task_uuid": task_uuid,
+                                    "status_code": ResponseStatusCode.CREATED.value})
+                    continue
+
+                if operation.task_uuid not in existing:
+                    fail(index, operation, ResponseStatusCode.NOT_FOUND, f"'{operation.task_uuid}' 할 일을 찾을 수 없습니다.")
+                    continue
+
+                if operation.op == "update":
+                    if not fields:
+                        fail(index, operation, ResponseStatusCode.ENTITY_ERROR, "수정할 값이 없습니다.")
+                        continue
+
+                    # 같은 할 일을 여러 번 수정하면 하나로 합침
+                    updates.setdefault(operation.task_uuid, {"task_uuid": operation.task_uuid}).update(fields, updated_at=now)
+                else:
+                    existing.discard(operation.task_uuid)
+                    updates.pop(operation.task_uuid, None)
+                    deletes.append(operation.task_uuid)
+
+                results.append({"index": index, "op": operation.op, "task_uuid": operation.task_uuid,
+                                "status_code": ResponseStatusCode.SUCCESS.value})
+
+            # 같은 할 일에 대한 작업은 합쳐지므로 반영할 개수가 아니라 작업별 결과로 판단
+            if form.atomic and any(result["status_code"] >= 400 for result in results):
+                return (ResponseStatusCode.ENTITY_ERROR, results)
+
+            if not (creates or updates or deletes):
+                return (ResponseStatusCode.SUCCESS, results)
+
+            await TaskRepository.apply_batch(room_uuid, creates, list(updates.values()), deletes)
+
+            # 구독자 대기열이 넘치지 않도록 작업마다가 아니라 배치 하나로 전달
+            RoomBroker.get_instance().publish(room_uuid, "task.batch", {
+                "created": [TASK_SERIALIZER(SimpleNamespace(**task)) for task in creates],
+                "updated": [{key: format_datetime(value) if isinstance(value, datetime) else value
+                             for key, value in task.items()} for task in updates.values()],
+                "deleted": deletes,
+            })
+            return (ResponseStatusCode.SUCCESS, results)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
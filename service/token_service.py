@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Mapping, Optional
+from util.ttl_cache import TTLCache
+from types import MappingProxyType
+import time
+import uuid
+import jwt
+import os
+
+
+class TokenService(object):
+    """JWT 키/설정을 시작 시점에 한 번만 읽고, 검증이 끝난 토큰의 claims를 exp까지 캐싱"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use TokenService.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """TokenService의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            acem = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
+            sk = os.getenv("SECRET_KEY")
+            al = os.getenv("ALGORITHM")
+
+            if not (acem and sk and al):
+                raise FileNotFoundError(
+                    ".env파일에서 ACCESS_TOKEN_EXPIRE_MINUTES과 SECRET_KEY 환경 변수를 찾을 수 없습니다!"
+                )
+
+            instance = object.__new__(cls)
+            instance.algorithm = al
+            instance.expire_minutes = int(acem)
+            instance.refresh_expire_minutes = int(
+                os.getenv("REFRESH_TOKEN_EXPIRE_MINUTES", "20160"))
+            instance.keys = TokenService.parse_keys(
+                os.getenv("JWT_KEYS"), sk)
+            instance.active_kid = os.getenv("JWT_ACTIVE_KID", "default")
+            if instance.active_kid not in instance.keys:
+                raise ValueError(
+                    f"JWT_ACTIVE_KID '{instance.active_kid}'에 해당하는 키가 JWT_KEYS에 없습니다.")
+
+            instance.cache = TTLCache(
+                max_size=int(os.getenv("TOKEN_CACHE_SIZE", "10000")),
+                ttl=float(os.getenv("TOKEN_CACHE_TTL", "300")),
+            )
+            cls._instance = instance
+
+        return cls._instance
+
+    @classmethod
+    def reload(cls):
+        """환경 변수에서 키를 다시 읽음 (키 교체 시 사용), 검증 캐시도 함께 비워짐"""
+        cls._instance = None
+        return cls.get_instance()
+
+    @staticmethod
+    def parse_keys(jwt_keys: str | None, secret_key: str) -> Dict[str, str]:
+        """JWT_KEYS="kid1:secret1,kid2:secret2" 형식을 파싱, SECRET_KEY는 항상 'default' kid로 사용 가능"""
+        keys = {"default": secret_key}
+        for item in (jwt_keys or "").split(","):
+            if ":" in item:
+                kid, secret = item.split(":", 1)
+                keys[kid.strip()] = secret.strip()
+
+        return keys
+
+    @property
+    def max_lifetime(self) -> timedelta:
+        """발급한 토큰이 유효할 수 있는 가장 긴 시간 (유저 단위 폐기 기록을 이만큼 보관)"""
+        return timedelta(minutes=max(self.expire_minutes, self.refresh_expire_minutes))
+
+    def encode(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None, token_type: str = "access") -> str:
+        """token_type은 access(API 호출용) 또는 refresh(새 토큰 발급용)
+        jti로 토큰 하나를, iat(소수점 초)로 특정 시각 이전에 발급된 토큰 전체를 폐기할 수 있음"""
+        to_encode = data.copy()
+        default_minutes = self.refresh_expire_minutes if token_type == "refresh" else self.expire_minutes
+        expire = datetime.now(timezone.utc) + \
+            (expires_delta or timedelta(minutes=default_minutes))
+        to_encode.update({"exp": expire, "iat": time.time(), "jti": uuid.uuid4().hex, "typ": token_type})
+        return jwt.encode(
+            to_encode,
+            self.keys[self.active_kid],
+            algorithm=self.algorithm,
+            headers={"kid": self.active_kid},
+        )
+
+    def decode(self, token: str) -> Mapping[str, Any]:
+        """캐시한 claims를 여러 요청이 함께 쓰므로 호출한 쪽에서 바꿀 수 없도록 읽기 전용으로 반환"""
+        claims = self.cache.get(token)
+        if claims is not None:
+            return claims
+
+        kid = jwt.get_unverified_header(token).get("kid", "default")
+        if kid not in self.keys:
+            raise jwt.InvalidTokenError(f"'{kid}'는 알 수 없는 키 ID입니다.")
+
+        claims = MappingProxyType(jwt.decode(token, self.keys[kid], algorithms=[self.algorithm]))
+        if "exp" in claims:
+            self.cache.set(token, claims, ttl=claims["exp"] - time.time())
+
+        return claims
+
+    def stats(self) -> Dict[str, int]:
+        return self.cache.stats()
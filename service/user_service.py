@@ -1,189 +1,305 @@
+from repository.verification_repository import VerificationStore, VerificationStoreFullError
+from repository.user_repository import UserRepository, UserConflictError, UNIQUE_FIELDS
+from service.password_hasher import PasswordHasher, PasswordHasherBusyError
 from model.user import VerifyErrorCode, TokenModel, CreateUserModel, User
-from repository.user_repository import UserRepository
+from service.email_outbox import EmailOutbox, OutboxFullError
+from repository.principal_cache import PrincipalCache
+from repository.revocation_list import RevocationList
 from model.response import ResponseStatusCode, Detail
 from fastapi.security import OAuth2PasswordBearer
+from service.token_service import TokenService
 from email.mime.multipart import MIMEMultipart
+from util.structured_log import log_exception
 from service.auth_service import AuthService
+from typing import Any, Dict, List, Tuple
+from database.connection import DBObject
 from email.mime.text import MIMEText
-from datetime import datetime
 from fastapi import Depends
 from random import randint
-from typing import Tuple
-import traceback
-import logging
-import smtplib
+import asyncio
+import jwt
 import os
 
-email_session = {}
+CONFLICT_MESSAGES = {
+    "user_id": "'{}'라는 유저 아이디를 가진 유저가 이미 존재합니다.",
+    "nickname": "'{}'라는 닉네임을 가진 유저가 이미 존재합니다.",
+    "email": "'{}'라는 이메일을 가진 유저가 이미 존재합니다.",
+}
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/user/token")
 
 
 class UserService:
     @staticmethod
-    def login(user_id: str, password: str) -> Tuple[ResponseStatusCode, Detail | TokenModel]:
+    async def login(user_id: str, password: str) -> Tuple[ResponseStatusCode, Detail | TokenModel]:
         try:
-            user = AuthService.authenticate_user(user_id, password)
+            user = await AuthService.authenticate_user(user_id, password)
             if not user:
                 return (ResponseStatusCode.NOT_FOUND, Detail(f"'{user_id}'라는 유저 아이디를 가진 유저를 찾을 수 없습니다."))
 
-            access_token = AuthService.create_access_token(
-                data={"sub": user.user_uuid})
+            return (ResponseStatusCode.SUCCESS, AuthService.issue_tokens(user.user_uuid))
 
-            return (ResponseStatusCode.SUCCESS, TokenModel(access_token=access_token, token_type="bearer"))
+        except PasswordHasherBusyError as e:
+            return (ResponseStatusCode.SERVICE_UNAVAILABLE, Detail(str(e)))
 
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
-            )
+            log_exception(e)
             return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
 
     @staticmethod
-    def signup(user: CreateUserModel) -> Tuple[ResponseStatusCode, Detail | None]:
+    async def signup(user: CreateUserModel) -> Tuple[ResponseStatusCode, Detail | None]:
         try:
-            db_user = User(user.user_id, user.password,
+            db_user = User(user.user_id, await AuthService.hash_password(user.password),
                            user.nickname, user.email)
-            if UserRepository.check_exist_user("user_id", db_user.user_id):
-                return (ResponseStatusCode.CONFLICT, Detail(f"'{db_user.user_id}'라는 유저 아이디를 가진 유저가 이미 존재합니다."))
-
-            if UserRepository.check_exist_user("nickname", db_user.nickname):
-                return (ResponseStatusCode.CONFLICT, Detail(f"'{db_user.nickname}'라는 닉네임을 가진 유저가 이미 존재합니다."))
+            await UserRepository.create_user(db_user)
+            return (ResponseStatusCode.CREATED, None)
 
-            if UserRepository.check_exist_user("email", db_user.email):
-                return (ResponseStatusCode.CONFLICT, Detail(f"'{db_user.email}'라는 이메일을 가진 유저가 이미 존재합니다."))
+        except UserConflictError as e:
+            return (ResponseStatusCode.CONFLICT, Detail(CONFLICT_MESSAGES[e.field].format(e.value)))
 
-            UserRepository.create_user(db_user)
-            return (ResponseStatusCode.CREATED, None)
+        except PasswordHasherBusyError as e:
+            return (ResponseStatusCode.SERVICE_UNAVAILABLE, Detail(str(e)))
 
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def signup_batch(users: List[CreateUserModel]) -> Tuple[ResponseStatusCode, Detail | List[Dict[str, Any]]]:
+        """여러 계정을 한 번에 생성 (충돌 확인 쿼리 1번 + INSERT 트랜잭션 1번)
+        충돌하는 항목은 건너뛰고, 항목별 결과를 입력 순서대로 반환"""
+        try:
+            rows = await UserRepository.find_conflicts(
+                [user.user_id for user in users],
+                [user.nickname for user in users],
+                [user.email for user in users],
             )
+            taken = {field: {row[index] for row in rows}
+                     for index, field in enumerate(UNIQUE_FIELDS)}
+
+            results: List[Dict[str, Any]] = []
+            accepted: List[CreateUserModel] = []
+            for user in users:
+                field = next((field for field in UNIQUE_FIELDS
+                              if getattr(user, field) in taken[field]), None)
+                if field:
+                    results.append({"user_id": user.user_id, "status_code": ResponseStatusCode.CONFLICT.value,
+                                    "detail": CONFLICT_MESSAGES[field].format(getattr(user, field))})
+                    continue
+
+                # 같은 요청 안에서 중복된 값도 이후 항목에서 충돌로 처리
+                for field in UNIQUE_FIELDS:
+                    taken[field].add(getattr(user, field))
+
+                results.append({"user_id": user.user_id,
+                               "status_code": ResponseStatusCode.CREATED.value})
+                accepted.append(user)
+
+            hasher = PasswordHasher.get_instance()
+            hashed_passwords: List[str] = []
+            for index in range(0, len(accepted), hasher.concurrency):
+                chunk = accepted[index:index + hasher.concurrency]
+                hashed_passwords += await asyncio.gather(*(hasher.hash(user.password) for user in chunk))
+
+            if accepted:
+                await UserRepository.create_users([
+                    User(user.user_id, hashed_password, user.nickname, user.email)
+                    for user, hashed_password in zip(accepted, hashed_passwords)
+                ])
+
+            return (ResponseStatusCode.CREATED, results)
+
+        except UserConflictError as e:
+            return (ResponseStatusCode.CONFLICT, Detail(CONFLICT_MESSAGES[e.field].format(e.value)))
+
+        except PasswordHasherBusyError as e:
+            return (ResponseStatusCode.SERVICE_UNAVAILABLE, Detail(str(e)))
+
+        except Exception as e:
+            log_exception(e)
             return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
 
     @staticmethod
-    def get_current_user(token: str = Depends(oauth2_scheme)) -> Tuple[ResponseStatusCode, Detail | User]:
+    async def get_current_user(token: str = Depends(oauth2_scheme)) -> Tuple[ResponseStatusCode, Detail | User]:
         try:
-            user_uuid = TokenModel.decode_token(token)
+            try:
+                claims = AuthService.decode_claims(token)
+            except jwt.ExpiredSignatureError:
+                return (ResponseStatusCode.FAIL, Detail("만료된 토큰입니다. refresh 토큰으로 새 토큰을 발급받으세요."))
+            except jwt.InvalidTokenError:
+                claims = {}
+
+            # refresh 토큰으로는 API를 호출할 수 없음 (typ가 없는 이전 형식의 토큰은 access 토큰으로 취급)
+            user_uuid = claims.get("sub") if claims.get("typ", "access") == "access" else None
             if not user_uuid:
                 return (ResponseStatusCode.FAIL, Detail(f"'{token}'은 유요한 토큰이 아닙니다."))
 
-            user = UserRepository.find_user(by="user_uuid", value=user_uuid)
+            # 메모리의 폐기 목록만 확인하므로 DB를 조회하지 않음
+            if RevocationList.get_instance().is_revoked(claims):
+                return (ResponseStatusCode.FAIL, Detail("폐기된 토큰입니다. 다시 로그인하세요."))
+
+            DBObject.set_principal(user_uuid)
+            user = PrincipalCache.get_instance().get(user_uuid)
+            if user:
+                return (ResponseStatusCode.SUCCESS, user)
+
+            # 캐시를 채우는 조회이므로 복제 지연으로 오래된 스냅샷이 TTL 동안 남지 않도록 primary에서 조회
+            user = await UserRepository.find_user(by="user_uuid", value=user_uuid, consistent=True)
             if not user:
                 return (ResponseStatusCode.NOT_FOUND, Detail(f"'{token}'을 할당받은 유저를 찾을 수 없습니다."))
 
+            PrincipalCache.get_instance().put(user)
+
             return (ResponseStatusCode.SUCCESS, user)
 
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
-            )
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def refresh_token(refresh_token: str) -> Tuple[ResponseStatusCode, Detail | TokenModel]:
+        """refresh 토큰으로 새 토큰을 발급하고, 사용한 refresh 토큰은 폐기 (같은 토큰을 다시 쓰면 실패하고 그 유저의 토큰을 모두 폐기)
+        로그아웃으로 폐기된 refresh 토큰은 실패만 함"""
+        try:
+            try:
+                claims = AuthService.decode_claims(refresh_token)
+            except jwt.InvalidTokenError as e:
+                return (ResponseStatusCode.FAIL, Detail(f"유효한 refresh 토큰이 아닙니다: {e}"))
+
+            if claims.get("typ") != "refresh" or not claims.get("sub"):
+                return (ResponseStatusCode.FAIL, Detail("유효한 refresh 토큰이 아닙니다."))
+
+            revocation_list = RevocationList.get_instance()
+            if not await revocation_list.consume(claims):
+                # 이미 사용한 refresh 토큰이 다시 들어오면 탈취된 것으로 보고 그 유저의 토큰을 모두 폐기
+                # 로그아웃으로 폐기된 토큰은 실패만 하고 다른 세션은 그대로 둠
+                if revocation_list.is_consumed(claims):
+                    await revocation_list.revoke_user(claims["sub"], TokenService.get_instance().max_lifetime)
+                return (ResponseStatusCode.FAIL, Detail("폐기된 토큰입니다. 다시 로그인하세요."))
+
+            return (ResponseStatusCode.SUCCESS, AuthService.issue_tokens(claims["sub"]))
+
+        except Exception as e:
+            log_exception(e)
             return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
 
     @staticmethod
-    def update_user(user: User, password: str | None = None, nickname: str | None = None, email: str | None = None, avatar_path: str | None = None) -> Tuple[ResponseStatusCode, Detail | User]:
+    async def logout(user: User, token: str, refresh_token: str | None = None) -> Tuple[ResponseStatusCode, Detail | None]:
+        """현재 access 토큰과, 함께 보낸 같은 유저의 refresh 토큰을 폐기"""
         try:
+            revocation_list = RevocationList.get_instance()
+            await revocation_list.revoke_token(AuthService.decode_claims(token))
+
+            if refresh_token:
+                try:
+                    claims = AuthService.decode_claims(refresh_token)
+                except jwt.InvalidTokenError:
+                    claims = {}
+
+                if claims.get("typ") == "refresh" and claims.get("sub") == user.user_uuid:
+                    await revocation_list.revoke_token(claims)
+
+            return (ResponseStatusCode.SUCCESS, None)
+
+        except Exception as e:
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
+
+    @staticmethod
+    async def update_user(user: User, password: str | None = None, nickname: str | None = None, email: str | None = None, avatar_path: str | None = None) -> Tuple[ResponseStatusCode, Detail | User]:
+        try:
+            if avatar_path is not None:
+                return (ResponseStatusCode.ENTITY_ERROR, Detail("avatar_path는 더 이상 수정할 수 없습니다. PUT /user/avatar로 이미지를 업로드하세요."))
+
             user_data = {}
 
             if password:
-                user_data["password"] = password
+                user_data["password"] = await AuthService.hash_password(password)
             if nickname:
                 user_data["nickname"] = nickname
             if email:
                 user_data["email"] = email
-            if avatar_path:
-                user_data["avatar_path"] = avatar_path
 
-            UserRepository.update_user(user, user_data)
-            user = UserRepository.find_user("user_uuid", user.user_uuid)
+            await UserRepository.update_user(user, user_data)
+            if password:
+                # 비밀번호를 바꾸면 지금까지 발급된 모든 토큰을 폐기 (현재 토큰 포함)
+                await RevocationList.get_instance().revoke_user(
+                    user.user_uuid, TokenService.get_instance().max_lifetime)
+            user = await UserRepository.find_user("user_uuid", user.user_uuid)
 
             return (ResponseStatusCode.SUCCESS, user)
 
+        except PasswordHasherBusyError as e:
+            return (ResponseStatusCode.SERVICE_UNAVAILABLE, Detail(str(e)))
+
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
-            )
+            log_exception(e)
             return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
 
     @staticmethod
-    def delete_user(user: User, password: str) -> Tuple[ResponseStatusCode, Detail | None]:
+    async def delete_user(user: User, password: str) -> Tuple[ResponseStatusCode, Detail | None]:
         try:
-            status_code, result = UserService.login(user.user_id, password)
-            if isinstance(result, Detail):
-                return (status_code, result)
+            # 비밀번호만 확인하면 되므로 토큰을 발급하는 login()이 아니라 authenticate_user()를 사용
+            if not await AuthService.authenticate_user(user.user_id, password):
+                return (ResponseStatusCode.NOT_FOUND, Detail(f"'{user.user_id}'라는 유저 아이디를 가진 유저를 찾을 수 없습니다."))
 
-            UserRepository.delete_user(user)
+            await UserRepository.delete_user(user)
+            await RevocationList.get_instance().revoke_user(
+                user.user_uuid, TokenService.get_instance().max_lifetime)
             return (ResponseStatusCode.SUCCESS, None)
 
+        except PasswordHasherBusyError as e:
+            return (ResponseStatusCode.SERVICE_UNAVAILABLE, Detail(str(e)))
+
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
-            )
+            log_exception(e)
             return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
 
     @staticmethod
-    def send_email_service(email: str) -> Tuple[ResponseStatusCode, Detail | None]:
+    async def send_email_service(email: str) -> Tuple[ResponseStatusCode, Detail | None]:
         try:
             message = MIMEMultipart("alternative")
             message["Subject"] = "TDLS 인증번호 요청"
             message["From"] = str(os.getenv("SENDER"))
             message["To"] = email
-            print(message)
-            print(os.getenv("APP_PASSWORD"))
-            email_session[f"{email}-verify-code"] = str(
-                randint(10**4, 10**6 - 1)
-            ).rjust(6, "0")
-            text = f"<html><body><div>인증 코드: {
-                email_session[f'{email}-verify-code']}</div></body></html>"
+            verify_code = str(randint(10**4, 10**6 - 1)).rjust(6, "0")
+            text = f"<html><body><div>인증 코드: {verify_code}</div></body></html>"
             part2 = MIMEText(text, "html")
             message.attach(part2)
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-                server.login(str(os.getenv("SENDER")),
-                             str(os.getenv("APP_PASSWORD")))
-                server.sendmail(str(os.getenv("SENDER")),
-                                email, message.as_string())
-
-            email_session[f"{email}-start-time"] = datetime.now().strftime(
-                "%Y/%m/%d %H:%M:%S"
-            )
+
+            # 실제 발송은 백그라운드 워커가 담당하고, 요청은 대기열에 넣은 뒤 바로 반환
+            store = VerificationStore.get_instance()
+            previous = await store.issue(email, verify_code)
+            try:
+                EmailOutbox.get_instance().enqueue(email, message)
+            except OutboxFullError:
+                # 새 코드는 발송되지 않으므로 이미 받은 이전 코드를 계속 쓸 수 있도록 되돌림
+                await store.restore(email, verify_code, previous)
+                raise
 
             return (ResponseStatusCode.SUCCESS, None)
 
+        except (OutboxFullError, VerificationStoreFullError) as e:
+            return (ResponseStatusCode.SERVICE_UNAVAILABLE, Detail(str(e)))
+
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
-            )
+            log_exception(e)
             return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
 
     @staticmethod
-    def verify_email_service(email: str, verify_code: str) -> VerifyErrorCode:
+    async def verify_email_service(email: str, verify_code: str) -> Tuple[ResponseStatusCode, Detail | None]:
         try:
-            if (
-                f"{email}-verify-code" not in email_session.keys()
-                or (
-                    datetime.now()
-                    - datetime.strptime(
-                        email_session[f"{
-                            email}-start-time"], "%Y/%m/%d %H:%M:%S"
-                    )
-                ).total_seconds()
-                >= 300
-            ):
-                return VerifyErrorCode.TIMEOUT
-
-            elif verify_code != email_session[f"{email}-verify-code"]:
-                return VerifyErrorCode.WRONG_VERIFY_CODE
-
-            return VerifyErrorCode.SUCCESS
+            result = await VerificationStore.get_instance().verify(email, verify_code)
+            if result == VerifyErrorCode.TIMEOUT:
+                return (ResponseStatusCode.TIME_OUT, Detail(f"'{email}'의 인증 코드가 만료되었거나 발급되지 않았습니다."))
+
+            elif result == VerifyErrorCode.TOO_MANY_ATTEMPTS:
+                return (ResponseStatusCode.FORBIDDEN, Detail(f"'{email}'의 인증 시도 횟수를 초과하였습니다. 인증 코드를 다시 발급받으세요."))
+
+            elif result == VerifyErrorCode.WRONG_VERIFY_CODE:
+                return (ResponseStatusCode.FAIL, Detail("인증 코드가 일치하지 않습니다."))
+
+            return (ResponseStatusCode.SUCCESS, None)
 
         except Exception as e:
-            logging.error(
-                f"{e}: {''.join(traceback.format_exception(
-                    None, e, e.__traceback__))}"
-            )
-            raise e
+            log_exception(e)
+            return (ResponseStatusCode.INTERNAL_SERVER_ERROR, Detail(str(e)))
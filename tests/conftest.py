@@ -0,0 +1,58 @@
+"""benchmark와 같은 방식으로 임시 SQLite 파일을 MySQL 대신 사용 (aiosqlite, httpx 필요, 메일 테스트는 aiosmtpd 필요)
+
+    python -m pytest tests
+"""
+from typing import Any, Awaitable, Callable, Dict
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.common import setup_environment, create_schema  # noqa: E402
+
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+setup_environment()
+create_schema()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+async def dispose_engine(anyio_backend):
+    """비동기 엔진의 커넥션은 만든 이벤트 루프에 묶이므로 테스트(이벤트 루프)마다 정리
+    정리하지 않으면 aiosqlite 스레드가 남아서 pytest가 종료되지 않음"""
+    yield
+    from database.connection import DBObject
+
+    await DBObject.get_instance().async_engine.dispose()
+
+
+@pytest.fixture
+async def client():
+    from httpx import AsyncClient, ASGITransport
+    from main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def signup(client) -> Callable[[str], Awaitable[Dict[str, Any]]]:
+    """name으로 가입하고 로그인해서 발급받은 토큰을 반환
+    테스트끼리 DB를 공유하므로 name은 테스트마다 다르게 (nickname으로도 쓰므로 15자 이하)"""
+
+    async def signup(name: str, password: str = "password") -> Dict[str, Any]:
+        response = await client.post("/user", json={
+            "user_id": name, "password": password, "nickname": name, "email": f"{name}@test.local"})
+        assert response.status_code == 201, response.json()
+
+        response = await client.post("/user/auth/login", json={"user_id": name, "password": password})
+        assert response.status_code == 200, response.json()
+        return response.json()["token"]
+
+    return signup
+
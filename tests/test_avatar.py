@@ -0,0 +1,55 @@
+from email.utils import formatdate
+import pytest
+import time
+import io
+
+pytestmark = pytest.mark.anyio
+
+UNKNOWN_DIGEST = "0" * 64
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    """임시 디렉터리를 쓰는 AvatarStorage 싱글턴을 새로 만들고, 테스트가 끝나면 썸네일 프로세스를 정리"""
+    from service.avatar_storage import AvatarStorage
+
+    monkeypatch.setenv("AVATAR_DIR", str(tmp_path))
+    AvatarStorage._instance = None
+    storage = AvatarStorage.get_instance()
+    yield storage
+
+    storage.shutdown()
+    AvatarStorage._instance = None
+
+
+async def upload(client, token) -> str:
+    image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    image.new("RGB", (300, 300), (200, 30, 30)).save(buffer, "PNG")
+    response = await client.put("/user/avatar", content=buffer.getvalue(), headers={
+        "Authorization": f"Bearer {token['access_token']}", "Content-Type": "image/png"})
+    assert response.status_code == 200, response.json()
+    return response.json()["user"]["avatar_path"]
+
+
+async def test_unknown_digest_with_if_modified_since_is_not_found(client, storage):
+    response = await client.get(f"/user/avatar/{UNKNOWN_DIGEST}", headers={
+        "If-Modified-Since": formatdate(time.time(), usegmt=True)})
+    assert response.status_code == 404
+
+
+async def test_if_modified_since_is_compared_with_the_file(client, signup, storage):
+    digest = await upload(client, await signup("avatar1"))
+    response = await client.get(f"/user/avatar/{digest}")
+    assert response.status_code == 200
+    last_modified = response.headers["last-modified"]
+
+    response = await client.get(f"/user/avatar/{digest}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = await client.get(f"/user/avatar/{digest}", headers={
+        "If-Modified-Since": formatdate(time.time() - 3600, usegmt=True)})
+    assert response.status_code == 200
+
+    response = await client.get(f"/user/avatar/{digest}", headers={"If-Modified-Since": "not a date"})
+    assert response.status_code == 200
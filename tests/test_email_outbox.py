@@ -0,0 +1,119 @@
+from benchmark.e2e import wait_verify_code
+from benchmark.room_fanout import free_port
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def outbox(monkeypatch):
+    """로컬 SMTP 포트를 보도록 EmailOutbox 싱글턴을 새로 만들고, 테스트가 끝나면 워커를 정리"""
+    from service.email_outbox import EmailOutbox
+
+    port = free_port()
+    monkeypatch.setenv("SMTP_HOST", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(port))
+    monkeypatch.setenv("SMTP_SECURITY", "none")
+    monkeypatch.setenv("OUTBOX_MAX_RETRIES", "2")
+    monkeypatch.setenv("OUTBOX_RETRY_BASE", "0.05")
+    EmailOutbox._instance = None
+    outbox = EmailOutbox.get_instance()
+    yield outbox
+
+    await outbox.stop(timeout=1)
+    EmailOutbox._instance = None
+
+
+@pytest.fixture
+def verification_store(monkeypatch):
+    """코드를 하나만 저장할 수 있는 메모리 저장소로 바꾸고, 테스트가 끝나면 원래 인스턴스로 되돌림"""
+    from repository.verification_repository import VerificationStore
+
+    original = VerificationStore._instance
+    monkeypatch.setenv("VERIFICATION_STORE", "memory")
+    monkeypatch.setenv("VERIFICATION_MAX_ENTRIES", "1")
+    VerificationStore._instance = None
+    yield VerificationStore.get_instance()
+    VerificationStore._instance = original
+
+
+async def test_verification_mail_is_sent_in_background(client, outbox):
+    pytest.importorskip("aiosmtpd")
+    from benchmark.smtp_stub import start_stub
+
+    smtp, handler = start_stub("127.0.0.1", outbox.port)
+    try:
+        address = "outbox1@test.local"
+        response = await client.post("/user/email/send", params={"email": address})
+        assert response.status_code == 200
+
+        verify_code = await wait_verify_code(handler, address, timeout=10)
+        assert verify_code is not None
+
+        response = await client.post("/user/email/verify", params={"email": address, "verify_code": verify_code})
+        assert response.status_code == 200
+        assert outbox.sent == 1
+
+    finally:
+        smtp.stop()
+
+
+async def test_unreachable_smtp_does_not_block_the_request(client, outbox):
+    # SMTP 서버가 없어도 요청은 대기열에 넣고 바로 반환하고, 재시도가 끝나면 실패로 기록
+    response = await client.post("/user/email/send", params={"email": "outbox2@test.local"})
+    assert response.status_code == 200
+
+    for _ in range(100):
+        if outbox.failed:
+            break
+        await asyncio.sleep(0.05)
+
+    assert outbox.failed == 1
+    assert outbox.retries == 1
+
+
+async def test_full_verification_store_keeps_issued_codes(client, outbox, verification_store):
+    response = await client.post("/user/email/send", params={"email": "outbox3@test.local"})
+    assert response.status_code == 200
+
+    # 가득 차면 기존 코드를 버리지 않고 새 요청을 거절
+    response = await client.post("/user/email/send", params={"email": "outbox4@test.local"})
+    assert response.status_code == 503
+    assert list(verification_store._entries) == ["outbox3@test.local"]
+
+    # 같은 이메일로 다시 요청하면 코드만 바뀌므로 거절하지 않음
+    response = await client.post("/user/email/send", params={"email": "outbox3@test.local"})
+    assert response.status_code == 200
+
+
+async def test_full_outbox_keeps_the_previous_code(client, outbox, verification_store, monkeypatch):
+    from service.email_outbox import OutboxFullError
+
+    address = "outbox5@test.local"
+    response = await client.post("/user/email/send", params={"email": address})
+    assert response.status_code == 200
+    verify_code = verification_store._entries[address].verify_code
+
+    def enqueue(recipient, message):
+        raise OutboxFullError("메일 발송 대기열이 가득 찼습니다.")
+
+    monkeypatch.setattr(outbox, "enqueue", enqueue)
+    response = await client.post("/user/email/send", params={"email": address})
+    assert response.status_code == 503
+
+    response = await client.post("/user/email/verify", params={"email": address, "verify_code": verify_code})
+    assert response.status_code == 200
+
+
+def test_unknown_verification_store_is_rejected(monkeypatch):
+    from repository.verification_repository import VerificationStore
+
+    original = VerificationStore._instance
+    monkeypatch.setenv("VERIFICATION_STORE", "redis")
+    VerificationStore._instance = None
+    try:
+        with pytest.raises(ValueError):
+            VerificationStore.get_instance()
+    finally:
+        VerificationStore._instance = original
@@ -0,0 +1,51 @@
+from model.friend import Friend, FriendStatus
+from database.connection import DBObject
+from sqlalchemy import select, or_
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def user(client, signup):
+    """가입한 유저의 (headers, user_uuid)를 반환"""
+
+    async def user(name: str) -> tuple:
+        token = await signup(name)
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+        response = await client.get("/user", headers=headers)
+        return headers, response.json()["user"]["user_uuid"]
+
+    return user
+
+
+async def relations(user_uuid: str, other_uuid: str) -> list:
+    async with DBObject.get_instance().async_session_scope() as session:
+        result = await session.execute(select(Friend.transmit_user_uuid, Friend.status).filter(or_(
+            (Friend.transmit_user_uuid == user_uuid) & (Friend.receive_user_uuid == other_uuid),
+            (Friend.transmit_user_uuid == other_uuid) & (Friend.receive_user_uuid == user_uuid))))
+        return [tuple(row) for row in result.all()]
+
+
+async def test_concurrent_requests_in_both_directions_become_friends(client, user):
+    (headers_a, uuid_a), (headers_b, uuid_b) = await user("friend1"), await user("friend2")
+
+    responses = await asyncio.gather(
+        client.post(f"/friend/{uuid_b}", headers=headers_a),
+        client.post(f"/friend/{uuid_a}", headers=headers_b))
+
+    # 나중에 처리된 요청이 먼저 온 요청을 수락하므로 대기 중인 요청 두 개가 아니라 친구 관계 하나만 남음
+    assert sorted(response.status_code for response in responses) == [200, 201]
+    assert [status for _, status in await relations(uuid_a, uuid_b)] == [FriendStatus.accepted]
+
+
+async def test_concurrent_request_and_block_leave_one_relation(client, user):
+    (headers_a, uuid_a), (headers_b, uuid_b) = await user("friend3"), await user("friend4")
+
+    responses = await asyncio.gather(
+        client.post(f"/friend/{uuid_b}", headers=headers_a),
+        client.post(f"/friend/{uuid_a}/block", headers=headers_b))
+
+    assert all(response.status_code in (200, 201, 403) for response in responses)
+    assert await relations(uuid_a, uuid_b) == [(uuid_b, FriendStatus.block)]
@@ -0,0 +1,43 @@
+from service.rate_limiter import RateLimiter, RateLimitRule
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """conftest에서 끈 로그인 계정 한도를 "2/60"으로 켜고, 테스트가 끝나면 원래 저장소로 되돌림"""
+    original = RateLimiter._instance
+    monkeypatch.setattr("service.rate_limiter.LOGIN_ACCOUNT", RateLimitRule("login_account", 2, 60))
+    RateLimiter._instance = None
+    yield RateLimiter.get_instance()
+    RateLimiter._instance = original
+
+
+async def login(client, user_id: str):
+    return await client.post("/user/auth/login", json={"user_id": user_id, "password": "nope"})
+
+
+async def test_login_over_the_limit_gets_retry_after(client, limiter):
+    # 한도는 비밀번호를 확인하기 전에 계산하므로 없는 계정도 똑같이 제한됨
+    assert [(await login(client, "limited1")).status_code for _ in range(2)] == [404, 404]
+
+    response = await login(client, "limited1")
+    assert response.status_code == 429
+    # 토큰 하나가 다시 채워지는 시간(60초 / 2회)만큼 기다려야 함
+    assert 1 <= int(response.headers["retry-after"]) <= 30
+
+    # 한도는 계정마다 따로 계산
+    assert (await login(client, "limited2")).status_code == 404
+    assert limiter.limited == 1
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    original = RateLimiter._instance
+    monkeypatch.setenv("RATE_LIMIT_BACKEND", "redis")
+    RateLimiter._instance = None
+    try:
+        with pytest.raises(ValueError):
+            RateLimiter.get_instance()
+    finally:
+        RateLimiter._instance = original
@@ -0,0 +1,48 @@
+from benchmark.room_dashboard import seed
+from sqlalchemy import event
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def count_dashboard_queries(room_uuid: str) -> tuple:
+    from repository.room_repository import RoomRepository
+    from database.connection import DBObject
+
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = DBObject.get_instance().async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", count)
+    try:
+        room = await RoomRepository.find_dashboard(room_uuid)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count)
+
+    return len(statements), room.get_dashboard_attributes()
+
+
+async def test_dashboard_query_count_does_not_grow_with_categories():
+    small, large = 3, 12
+    small_queries, small_room = await count_dashboard_queries(seed(small, 2))
+    large_queries, large_room = await count_dashboard_queries(seed(large, 2))
+
+    assert small_queries == large_queries == 3
+    assert len(small_room["categories"]) == small
+    assert len(large_room["categories"]) == large
+    assert all(category["task_count"] == 2 for category in large_room["categories"])
+
+
+def test_unknown_room_broker_is_rejected(monkeypatch):
+    from service.room_broker import RoomBroker
+
+    original = RoomBroker._instance
+    monkeypatch.setenv("ROOM_BROKER", "redis")
+    RoomBroker._instance = None
+    try:
+        with pytest.raises(ValueError):
+            RoomBroker.get_instance()
+    finally:
+        RoomBroker._instance = original
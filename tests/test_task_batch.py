@@ -0,0 +1,94 @@
+from typing import Any, Dict, List
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def room(client, signup):
+    """가입한 유저의 방과 카테고리를 만들고 (headers, room_uuid, category_uuid)를 반환"""
+
+    async def room(name: str) -> tuple:
+        token = await signup(name)
+        headers = {"Authorization": f"Bearer {token['access_token']}"}
+        response = await client.post("/room", headers=headers, json={"room_name": name})
+        room_uuid = response.json()["room"]["room_uuid"]
+        response = await client.post(f"/room/{room_uuid}/category", headers=headers, json={"category_name": name})
+        return headers, room_uuid, response.json()["category"]["category_uuid"]
+
+    return room
+
+
+async def batch(client, headers: Dict[str, str], room_uuid: str, operations: List[Dict[str, Any]], atomic: bool = False):
+    response = await client.post(f"/room/{room_uuid}/task/batch", headers=headers,
+                                 json={"operations": operations, "atomic": atomic})
+    return response.status_code, response.json()
+
+
+async def list_titles(client, headers: Dict[str, str], room_uuid: str) -> List[str]:
+    response = await client.get(f"/room/{room_uuid}/task", headers=headers)
+    return sorted(task["title"] for task in response.json()["tasks"])
+
+
+async def test_results_are_reported_per_operation(client, room):
+    headers, room_uuid, category_uuid = await room("batch1")
+    status_code, body = await batch(client, headers, room_uuid, [
+        {"op": "create", "title": "a", "content": "c", "category_uuid": category_uuid},
+        {"op": "create", "title": "b"},
+        {"op": "create", "title": "c", "content": "c", "category_uuid": "missing"},
+        {"op": "delete", "task_uuid": "missing"},
+    ])
+
+    assert status_code == 200
+    assert [result["status_code"] for result in body["results"]] == [201, 422, 404, 404]
+    assert await list_titles(client, headers, room_uuid) == ["a"]
+
+
+async def test_atomic_batch_with_merged_operations_is_applied(client, room):
+    # 같은 할 일에 대한 작업은 하나로 합쳐지지만 모두 성공했으므로 반영되어야 함
+    headers, room_uuid, category_uuid = await room("batch2")
+    _, body = await batch(client, headers, room_uuid, [
+        {"op": "create", "title": title, "content": "c", "category_uuid": category_uuid} for title in ("a", "b")])
+    first, second = [result["task_uuid"] for result in body["results"]]
+
+    status_code, body = await batch(client, headers, room_uuid, [
+        {"op": "update", "task_uuid": first, "title": "a2"},
+        {"op": "update", "task_uuid": first, "content": "c2"},
+        {"op": "update", "task_uuid": second, "title": "b2"},
+        {"op": "delete", "task_uuid": second},
+    ], atomic=True)
+
+    assert status_code == 200
+    assert [result["status_code"] for result in body["results"]] == [200, 200, 200, 200]
+    assert await list_titles(client, headers, room_uuid) == ["a2"]
+
+
+async def test_atomic_batch_with_a_failure_applies_nothing(client, room):
+    headers, room_uuid, category_uuid = await room("batch3")
+    _, body = await batch(client, headers, room_uuid, [
+        {"op": "create", "title": "a", "content": "c", "category_uuid": category_uuid}])
+    task_uuid = body["results"][0]["task_uuid"]
+
+    status_code, body = await batch(client, headers, room_uuid, [
+        {"op": "delete", "task_uuid": task_uuid},
+        {"op": "create", "title": "b", "content": "c", "category_uuid": category_uuid},
+        {"op": "update", "task_uuid": "missing", "title": "x"},
+    ], atomic=True)
+
+    assert status_code == 422
+    assert [result["status_code"] for result in body["results"]] == [200, 201, 404]
+    assert await list_titles(client, headers, room_uuid) == ["a"]
+
+
+async def test_batch_without_changes_records_nothing(client, room):
+    headers, room_uuid, _ = await room("batch4")
+    response = await client.get(f"/room/{room_uuid}/changes", headers=headers)
+    cursor = response.json()["next_cursor"]
+
+    status_code, _ = await batch(client, headers, room_uuid, [{"op": "delete", "task_uuid": "missing"}])
+    assert status_code == 200
+
+    response = await client.get(f"/room/{room_uuid}/changes", headers=headers, params={"cursor": cursor})
+    body = response.json()
+    assert body["tasks"] == [] and body["deleted"]["tasks"] == []
+    assert body["next_cursor"] == cursor
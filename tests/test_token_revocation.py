@@ -0,0 +1,123 @@
+from repository.revocation_list import RevocationList
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def auth(token) -> dict:
+    return {"Authorization": f"Bearer {token['access_token']}"}
+
+
+async def refresh(client, token) -> int:
+    response = await client.post("/user/auth/refresh", json={"refresh_token": token["refresh_token"]})
+    return response.status_code
+
+
+@pytest.fixture
+def new_worker():
+    """다른 워커처럼 빈 폐기 목록에서 시작하고, 테스트가 끝나면 원래 인스턴스로 되돌림"""
+    original = RevocationList._instance
+
+    def new_worker() -> RevocationList:
+        RevocationList._instance = None
+        return RevocationList.get_instance()
+
+    yield new_worker
+    RevocationList._instance = original
+
+
+async def test_logout_revokes_access_and_refresh_tokens(client, signup):
+    token = await signup("revoke1")
+    response = await client.post("/user/auth/logout", headers=auth(token), json={"refresh_token": token["refresh_token"]})
+    assert response.status_code == 200
+
+    assert (await client.get("/user", headers=auth(token))).status_code == 401
+    assert await refresh(client, token) == 401
+
+
+async def test_refresh_token_is_single_use(client, signup):
+    token = await signup("revoke2")
+    response = await client.post("/user/auth/refresh", json={"refresh_token": token["refresh_token"]})
+    assert response.status_code == 200
+    rotated = response.json()["token"]
+    assert (await client.get("/user", headers=auth(rotated))).status_code == 200
+
+    # 사용한 refresh 토큰이 다시 들어오면 탈취된 것으로 보고 이후 발급된 토큰까지 모두 폐기
+    assert await refresh(client, token) == 401
+    assert (await client.get("/user", headers=auth(rotated))).status_code == 401
+    assert await refresh(client, rotated) == 401
+
+
+async def test_concurrent_refresh_issues_one_pair(client, signup):
+    token = await signup("revoke3")
+    status_codes = await asyncio.gather(*[refresh(client, token) for _ in range(5)])
+    assert sorted(status_codes) == [200, 401, 401, 401, 401]
+
+
+async def test_refresh_reuse_is_detected_across_workers(client, signup, new_worker):
+    token = await signup("revoke4")
+    assert await refresh(client, token) == 200
+
+    # 메모리 목록에는 없지만 jti의 unique 제약으로 재사용을 감지
+    new_worker()
+    assert await refresh(client, token) == 401
+    assert (await client.get("/user", headers=auth(token))).status_code == 401
+
+
+async def test_revocations_are_loaded_by_other_workers(client, signup, new_worker):
+    token = await signup("revoke5")
+    await client.post("/user/auth/logout", headers=auth(token))
+
+    worker = new_worker()
+    assert (await client.get("/user", headers=auth(token))).status_code == 200
+    await worker.refresh()
+    assert (await client.get("/user", headers=auth(token))).status_code == 401
+
+
+async def test_password_change_revokes_existing_tokens(client, signup):
+    token = await signup("revoke6")
+    response = await client.patch("/user", headers=auth(token), json={"password": "changed"})
+    assert response.status_code == 200
+    assert (await client.get("/user", headers=auth(token))).status_code == 401
+
+    response = await client.post("/user/auth/login", json={"user_id": "revoke6", "password": "changed"})
+    assert (await client.get("/user", headers=auth(response.json()["token"]))).status_code == 200
+
+
+async def test_refresh_after_logout_keeps_other_sessions(client, signup):
+    token = await signup("revoke7")
+    response = await client.post("/user/auth/login", json={"user_id": "revoke7", "password": "password"})
+    other = response.json()["token"]
+
+    await client.post("/user/auth/logout", headers=auth(token), json={"refresh_token": token["refresh_token"]})
+
+    # 로그아웃한 refresh 토큰은 재사용(탈취)이 아니므로 실패만 하고 다른 세션은 유지
+    assert await refresh(client, token) == 401
+    assert (await client.get("/user", headers=auth(other))).status_code == 200
+    assert await refresh(client, other) == 200
+
+
+async def test_refresh_after_logout_on_other_worker_keeps_other_sessions(client, signup, new_worker):
+    token = await signup("revoke8")
+    response = await client.post("/user/auth/login", json={"user_id": "revoke8", "password": "password"})
+    other = response.json()["token"]
+
+    await client.post("/user/auth/logout", headers=auth(token), json={"refresh_token": token["refresh_token"]})
+
+    # 메모리 목록에 없어도 DB에 남은 기록으로 로그아웃한 토큰임을 구분
+    new_worker()
+    assert await refresh(client, token) == 401
+    assert (await client.get("/user", headers=auth(other))).status_code == 200
+
+
+async def test_cached_claims_are_read_only(signup):
+    from service.auth_service import AuthService
+
+    token = await signup("revoke9")
+    claims = AuthService.decode_claims(token["access_token"])
+    with pytest.raises(TypeError):
+        claims["sub"] = "someone-else"
+
+    # 캐시에서 꺼낸 값도 처음 검증한 claims와 같아야 함
+    assert AuthService.decode_claims(token["access_token"])["sub"] == claims["sub"]
@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_signup_login_and_profile_on_async_session(client, signup):
+    token = await signup("profile1")
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+    response = await client.get("/user", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["user"]["user_id"] == "profile1"
+
+    response = await client.patch("/user", headers=headers, json={"nickname": "profile1b"})
+    assert response.status_code == 200
+
+    # 바로 다음 요청에서 바뀐 값을 읽음 (read-your-writes)
+    response = await client.get("/user", headers=headers)
+    assert response.json()["user"]["nickname"] == "profile1b"
+
+
+async def test_concurrent_signups_share_the_async_pool(client):
+    responses = await asyncio.gather(*[client.post("/user", json={
+        "user_id": f"many{i}", "password": "password", "nickname": f"many{i}", "email": f"many{i}@test.local"})
+        for i in range(10)])
+    assert [response.status_code for response in responses] == [201] * 10
+
+    response = await client.post("/user", json={
+        "user_id": "many0", "password": "password", "nickname": "other", "email": "other@test.local"})
+    assert response.status_code == 409
+
+
+async def test_login_with_wrong_password_fails(client, signup):
+    await signup("wrongpw1")
+    response = await client.post("/user/auth/login", json={"user_id": "wrongpw1", "password": "nope"})
+    assert response.status_code == 404
+
+
+async def test_deprecated_avatar_path_is_rejected(client, signup):
+    token = await signup("avatarpath1")
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+
+    response = await client.patch("/user", headers=headers, json={"nickname": "avatarpath1b", "avatar_path": "a.png"})
+    assert response.status_code == 422
+
+    # 거절된 요청의 다른 필드도 반영되지 않아야 함
+    response = await client.get("/user", headers=headers)
+    assert response.json()["user"]["nickname"] == "avatarpath1"
+    assert response.json()["user"]["avatar_path"] is None
@@ -0,0 +1,23 @@
+from typing import Any, List
+import base64
+import json
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """페이지 마지막 행의 정렬 키를 클라이언트가 그대로 돌려줄 불투명한 문자열로 인코딩"""
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """encode_cursor의 역변환, 형식이 맞지 않으면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"'{cursor}'는 올바른 커서가 아닙니다.") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"'{cursor}'는 올바른 커서가 아닙니다.")
+
+    return values
@@ -0,0 +1,51 @@
+from model.response import ResponseModel
+from fastapi import Header, Response
+from typing import Any, Dict
+import hashlib
+
+# 인증된 유저별 응답이므로 공유 캐시에는 저장하지 않고, 매번 ETag로 재검증하도록 함
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*version: Any) -> str:
+    """응답 본문 대신 리소스의 버전(updated_at, 변경 seq, 쿼리 파라미터 등)으로 weak ETag를 생성"""
+    raw = "\x1f".join("" if part is None else str(part) for part in version).encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match의 ETag 목록 중 하나라도 약한 비교(W/ 무시)로 같으면 True"""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+class ConditionalRequest:
+    """조건부 GET 의존성 (conditional: ConditionalRequest = Depends())
+    본문을 조회하거나 직렬화하기 전에 not_modified(버전...)를 호출해서 304를 먼저 반환하고,
+    200 응답에는 headers를 붙여서 클라이언트가 다음 요청에 ETag를 보내도록 함"""
+    if_none_match: str | None
+    etag: str | None
+
+    def __init__(self, if_none_match: str | None = Header(default=None)):
+        self.if_none_match = if_none_match
+        self.etag = None
+
+    def not_modified(self, *version: Any) -> Response | None:
+        self.etag = make_etag(*version)
+        if etag_matches(self.if_none_match, self.etag):
+            return ResponseModel.show_not_modified(self.headers)
+
+        return None
+
+    @property
+    def headers(self) -> Dict[str, str] | None:
+        if self.etag is None:
+            return None
+
+        return {"ETag": self.etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"}
@@ -0,0 +1,42 @@
+from typing import Dict, Sequence
+import threading
+import bisect
+
+# 초 단위 기본 버킷 (Prometheus 기본값과 같은 구간)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """고정 버킷 누적 히스토그램 (Prometheus histogram과 같은 방식)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def cumulative(self) -> Dict[str, int]:
+        """{"le": 누적 개수} 형태로 반환, 마지막은 "+Inf" """
+        result: Dict[str, int] = {}
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result[str(bound)] = total
+
+        result["+Inf"] = total + self.counts[-1]
+        return result
+
+    def get_attributes(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "buckets": self.cumulative(),
+        }
@@ -0,0 +1,178 @@
+from database.query_monitor import QueryStats, current_query_stats
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette.datastructures import MutableHeaders
+from util.structured_log import log_event
+from util.histogram import Histogram
+from collections import Counter
+from typing import List, Tuple
+import threading
+import logging
+import time
+import os
+
+# 라우트를 찾지 못한 요청은 경로별로 나누지 않음 (라벨 종류가 무한히 늘어나는 것을 방지)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RouteMetrics:
+    """라우트(메서드 + 경로 템플릿) 하나의 지연 시간 히스토그램, 응답 코드별 요청 수, 쿼리 수/DB 시간"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.statuses = Counter()
+        self.queries = 0
+        self.db_time = 0.0
+
+
+class RequestMetrics(object):
+    """요청별 계측 결과를 모으고 Prometheus 텍스트 형식으로 출력
+    값은 프로세스(워커)마다 따로 집계됨"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use RequestMetrics.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """RequestMetrics의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.slow_request = float(
+                os.getenv("SLOW_REQUEST_MS", "500")) / 1000
+            cls._instance.slow_queries = int(
+                os.getenv("SLOW_REQUEST_QUERIES", "30"))
+            cls._instance.server_timing = os.getenv(
+                "SERVER_TIMING", "true").lower() in ("1", "true", "yes")
+            cls._instance.routes = {}
+            cls._instance.in_progress = 0
+            cls._instance._lock = threading.Lock()
+
+        return cls._instance
+
+    def route_metrics(self, method: str, route: str) -> RouteMetrics:
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self.routes.setdefault(key, RouteMetrics())
+
+        return metrics
+
+    def observe(self, method: str, route: str, status: int, duration: float, stats: QueryStats) -> None:
+        metrics = self.route_metrics(method, route)
+        metrics.latency.observe(duration)
+        metrics.statuses[status] += 1
+        metrics.queries += stats.count
+        metrics.db_time += stats.duration
+
+        if duration >= self.slow_request or stats.count >= self.slow_queries:
+            self.log_slow_request(method, route, status, duration, stats)
+
+    @staticmethod
+    def log_slow_request(method: str, route: str, status: int, duration: float, stats: QueryStats) -> None:
+        log_event(
+            "request.slow", logging.WARNING,
+            method=method, route=route, status=status,
+            duration_ms=round(duration * 1000, 1),
+            queries=stats.count, db_ms=round(stats.duration * 1000, 1),
+            slowest=[{"ms": round(total * 1000, 1), "count": count, "statement": ' '.join(statement.split())[:500]}
+                     for statement, count, total in stats.slowest(10)],
+        )
+
+    def server_timing_header(self, duration: float, stats: QueryStats) -> str:
+        return (f'app;dur={duration * 1000:.1f}, '
+                f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"')
+
+    def render_prometheus(self, extra: List[str] | None = None) -> str:
+        lines = [
+            "# HELP tdls_http_requests_in_progress 처리 중인 HTTP 요청 수",
+            "# TYPE tdls_http_requests_in_progress gauge",
+            f"tdls_http_requests_in_progress {self.in_progress}",
+            "# HELP tdls_http_requests_total 라우트/응답 코드별 HTTP 요청 수",
+            "# TYPE tdls_http_requests_total counter",
+        ]
+        routes: List[Tuple[Tuple[str, str], RouteMetrics]] = sorted(self.routes.items())
+        for (method, route), metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f'tdls_http_requests_total{{{labels(method=method, route=route, status=status)}}} {count}')
+
+        lines += [
+            "# HELP tdls_http_request_duration_seconds 라우트별 HTTP 요청 처리 시간",
+            "# TYPE tdls_http_request_duration_seconds histogram",
+        ]
+        for (method, route), metrics in routes:
+            lines += render_histogram("tdls_http_request_duration_seconds", metrics.latency,
+                                      labels(method=method, route=route))
+
+        lines += [
+            "# HELP tdls_http_request_db_queries_total 라우트별 요청에서 실행한 쿼리 수",
+            "# TYPE tdls_http_request_db_queries_total counter",
+        ]
+        lines += [f'tdls_http_request_db_queries_total{{{labels(method=method, route=route)}}} {metrics.queries}'
+                  for (method, route), metrics in routes]
+        lines += [
+            "# HELP tdls_http_request_db_seconds_total 라우트별 요청에서 쿼리 실행에 쓴 시간",
+            "# TYPE tdls_http_request_db_seconds_total counter",
+        ]
+        lines += [f'tdls_http_request_db_seconds_total{{{labels(method=method, route=route)}}} {metrics.db_time:.6f}'
+                  for (method, route), metrics in routes]
+
+        return "\n".join(lines + (extra or [])) + "\n"
+
+
+def labels(**values) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{key}="{escape(value)}"' for key, value in values.items())
+
+
+def render_histogram(name: str, histogram: Histogram, label_text: str = "") -> List[str]:
+    prefix = f"{label_text}," if label_text else ""
+    lines = [f'{name}_bucket{{{prefix}le="{bound}"}} {count}'
+             for bound, count in histogram.cumulative().items()]
+    suffix = f"{{{label_text}}}" if label_text else ""
+    lines.append(f"{name}_sum{suffix} {histogram.sum:.6f}")
+    lines.append(f"{name}_count{suffix} {histogram.count}")
+    return lines
+
+
+class RequestMetricsMiddleware:
+    """HTTP 요청마다 처리 시간과 DB 쿼리 수/시간을 라우트별로 기록하고 Server-Timing 헤더를 추가하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics.get_instance()
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if metrics.server_timing:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", metrics.server_timing_header(time.perf_counter() - started, stats))
+
+            await send(message)
+
+        metrics.in_progress += 1
+        try:
+            await self.app(scope, receive, send_with_timing)
+
+        finally:
+            metrics.in_progress -= 1
+            current_query_stats.reset(token)
+            # 라우팅이 끝나면 FastAPI가 scope["route"]에 매칭된 라우트를 넣어둠
+            route = scope.get("route")
+            metrics.observe(scope["method"], getattr(route, "path", UNMATCHED_ROUTE),
+                            status, time.perf_counter() - started, stats)
@@ -0,0 +1,72 @@
+from typing import Any, Dict, List
+import importlib.util
+import os
+
+
+class ServerSettings:
+    """SERVER_* 환경 변수로 설정하는 uvicorn 실행 옵션
+    개발 모드는 리로드 가능한 단일 프로세스, 운영 모드(SERVER_MODE=production 또는 ./is-server 파일)는
+    워커 여러 개를 띄우고 uvloop/httptools를 사용하며 SIGTERM을 받으면 처리 중인 요청을 마친 뒤 종료"""
+
+    @staticmethod
+    def is_production() -> bool:
+        mode = os.getenv("SERVER_MODE")
+        if mode:
+            return mode.lower() == "production"
+
+        return os.path.exists("./is-server")
+
+    @staticmethod
+    def resolve(option: str, preferred: str, fallback: str) -> str:
+        """auto면 preferred 패키지가 설치되어 있을 때만 사용 (uvloop은 Windows를 지원하지 않음)"""
+        if option != "auto":
+            return option
+
+        return preferred if importlib.util.find_spec(preferred) is not None else fallback
+
+    @staticmethod
+    def from_env() -> Dict[str, Any]:
+        """uvicorn.run에 넘길 옵션"""
+        if not ServerSettings.is_production():
+            return {
+                "host": os.getenv("SERVER_HOST", "localhost"),
+                "port": int(os.getenv("SERVER_PORT", "3000")),
+                "reload": True,
+            }
+
+        limit_concurrency = os.getenv("SERVER_LIMIT_CONCURRENCY")
+        return {
+            "host": os.getenv("SERVER_HOST", "localhost"),
+            "port": int(os.getenv("SERVER_PORT", "8000")),
+            # 워커는 spawn으로 새로 시작하므로 DB 커넥션 풀도 워커마다 따로 생성됨
+            "workers": int(os.getenv("SERVER_WORKERS", str(os.cpu_count() or 1))),
+            "loop": ServerSettings.resolve(os.getenv("SERVER_LOOP", "auto"), "uvloop", "asyncio"),
+            "http": ServerSettings.resolve(os.getenv("SERVER_HTTP", "auto"), "httptools", "h11"),
+            # 앞단 프록시(nginx 등)의 upstream keepalive_timeout보다 길게 잡아야 재사용하려던 연결이 먼저 끊기지 않음
+            "timeout_keep_alive": int(os.getenv("SERVER_KEEPALIVE", "75")),
+            "backlog": int(os.getenv("SERVER_BACKLOG", "2048")),
+            # SIGTERM 후 새 연결은 받지 않고 처리 중인 요청을 최대 이 시간(초)만큼 기다린 다음 lifespan 종료 처리
+            "timeout_graceful_shutdown": int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30")),
+            "limit_concurrency": int(limit_concurrency) if limit_concurrency else None,
+            "proxy_headers": True,
+            "forwarded_allow_ips": os.getenv("SERVER_FORWARDED_ALLOW_IPS", "127.0.0.1"),
+            # 요청 로그는 /metrics로 대신하고 기본으로 끔
+            "access_log": os.getenv("SERVER_ACCESS_LOG", "false").lower() in ("1", "true", "yes"),
+        }
+
+    @staticmethod
+    def warnings(options: Dict[str, Any]) -> List[str]:
+        """워커가 여러 개일 때 프로세스 안에만 있는 저장소를 쓰면 워커끼리 상태를 공유하지 못함"""
+        if options.get("workers", 1) <= 1:
+            return []
+
+        messages = []
+        if os.getenv("VERIFICATION_STORE", "memory").lower() == "memory":
+            messages.append("VERIFICATION_STORE=memory는 워커끼리 공유되지 않습니다. database로 설정하세요.")
+        if os.getenv("ROOM_BROKER", "memory").lower() == "memory":
+            messages.append("ROOM_BROKER=memory는 같은 워커에 연결된 클라이언트에게만 변경 사항을 전달합니다.")
+        if os.getenv("RATE_LIMIT_BACKEND", "memory").lower() == "memory":
+            messages.append(
+                f"RATE_LIMIT_BACKEND=memory는 워커마다 따로 계산하므로 실제 요청 한도는 RATE_LIMIT_*의 최대 {options['workers']}배입니다.")
+
+        return messages
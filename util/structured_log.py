@@ -0,0 +1,202 @@
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable
+from datetime import datetime, timezone
+import traceback
+import logging
+import random
+import queue
+import copy
+import json
+import sys
+import re
+import os
+
+# 필드 이름에 이 단어가 들어가면 값을 가림
+SECRET_FIELDS = ("password", "secret", "token", "authorization", "verify_code", "cookie")
+# 메시지나 예외 안에 들어간 bearer 토큰과 JWT
+SECRET_PATTERNS = (
+    re.compile(r"(?i)bearer\s+[\w\-.~+/]+=*"),
+    re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*"),
+)
+# 값이 그대로 로그에 남으면 안 되는 환경 변수
+SECRET_ENVS = ("APP_PASSWORD", "SECRET_KEY", "DB_PASSWORD", "INTERNAL_API_TOKEN")
+REDACTED = "[REDACTED]"
+
+# LogRecord가 기본으로 가지는 속성 (나머지는 extra로 넘긴 필드)
+RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class Redactor:
+    def __init__(self, secret_values: Iterable[str] = ()):
+        # 짧은 값은 일반 단어와 겹칠 수 있으므로 가리지 않음
+        self.secret_values = sorted({value for value in secret_values if value and len(value) >= 6}, key=len, reverse=True)
+
+    @classmethod
+    def from_env(cls) -> "Redactor":
+        return cls(os.getenv(name, "") for name in SECRET_ENVS)
+
+    def text(self, value: str) -> str:
+        for secret in self.secret_values:
+            value = value.replace(secret, REDACTED)
+        for pattern in SECRET_PATTERNS:
+            value = pattern.sub(REDACTED, value)
+
+        return value
+
+    def value(self, key: str, value: Any) -> Any:
+        if any(name in key.lower() for name in SECRET_FIELDS):
+            return REDACTED
+
+        if isinstance(value, str):
+            return self.text(value)
+
+        if isinstance(value, dict):
+            return {k: self.value(str(k), v) for k, v in value.items()}
+
+        return value
+
+
+class JSONFormatter(logging.Formatter):
+    """한 줄짜리 JSON으로 출력 (QueueListener 스레드에서 실행되므로 예외 포맷과 가리기도 요청 경로 밖에서 처리)"""
+
+    def __init__(self, redactor: Redactor):
+        super().__init__()
+        self.redactor = redactor
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": getattr(record, "event", None) or f"{record.module}.{record.funcName}",
+            "message": self.redactor.text(record.getMessage()),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and key != "event":
+                event[key] = self.redactor.value(key, value)
+
+        if record.exc_info:
+            event["exception"] = self.redactor.text("".join(traceback.format_exception(*record.exc_info)))
+
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """LOG_SAMPLE_RATES에 있는 이벤트는 그 비율만큼만 남김 (WARNING 이상은 항상 남김)"""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self.sampled_out = 0
+
+    @staticmethod
+    def parse(value: str) -> Dict[str, float]:
+        """"user.created=0.1,task.updated=0.01" 형식"""
+        rates = {}
+        for item in value.split(","):
+            if "=" in item:
+                event, rate = item.split("=", 1)
+                rates[event.strip()] = float(rate)
+
+        return rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(getattr(record, "event", None))
+        if rate is None or record.levelno >= logging.WARNING:
+            return True
+
+        if random.random() < rate:
+            record.sample_rate = rate
+            return True
+
+        self.sampled_out += 1
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """요청 경로에서는 레코드를 대기열에 넣기만 함
+    기본 QueueHandler와 달리 여기서 예외를 포맷하지 않고, 대기열이 가득 차면 기다리지 않고 버림"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class StructuredLogging(object):
+    """루트 로거를 NonBlockingQueueHandler로 바꾸고, 백그라운드 QueueListener가 JSON으로 출력"""
+    _instance = None
+
+    def __init__(self):
+        """__init__ 호출 방지"""
+        raise RuntimeError("Use StructuredLogging.get_instance() instead")
+
+    @classmethod
+    def get_instance(cls):
+        """StructuredLogging의 싱글턴 인스턴스를 반환"""
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+            cls._instance.level = os.getenv("LOG_LEVEL", "INFO").upper()
+            cls._instance.handler = NonBlockingQueueHandler(
+                queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000"))))
+            cls._instance.sampler = SamplingFilter(
+                SamplingFilter.parse(os.getenv("LOG_SAMPLE_RATES", "")))
+            cls._instance.handler.addFilter(cls._instance.sampler)
+            cls._instance.listener = None
+            cls._instance._previous_handlers = None
+
+        return cls._instance
+
+    def start(self) -> None:
+        if self.listener is not None:
+            return
+
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JSONFormatter(Redactor.from_env()))
+        self.listener = QueueListener(self.handler.queue, output, respect_handler_level=False)
+        self.listener.start()
+
+        root = logging.getLogger()
+        self._previous_handlers = root.handlers[:]
+        root.handlers = [self.handler]
+        root.setLevel(self.level)
+
+    def stop(self) -> None:
+        """남은 로그를 모두 출력한 뒤 원래 핸들러로 되돌림"""
+        if self.listener is None:
+            return
+
+        root = logging.getLogger()
+        root.handlers = self._previous_handlers
+        self.listener.stop()
+        self.listener = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.handler.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "sampled_out": self.sampler.sampled_out,
+        }
+
+
+def log_event(event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """이름이 있는 이벤트를 필드와 함께 기록 (LOG_SAMPLE_RATES로 이벤트별 샘플링)"""
+    logger = logging.getLogger("tdls")
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"event": event, **fields}, stacklevel=2)
+
+
+def log_exception(e: BaseException, **fields: Any) -> None:
+    """처리하지 못한 예외를 기록 (traceback 문자열은 백그라운드 스레드에서 만듦)"""
+    logging.getLogger("tdls").error(str(e), exc_info=(type(e), e, e.__traceback__), extra=fields, stacklevel=2)